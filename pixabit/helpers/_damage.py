@@ -0,0 +1,116 @@
+# pixabit/helpers/_damage.py
+
+# SECTION: MODULE DOCSTRING
+"""Vectorized forecast of the damage uncompleted dailies deal at cron.
+
+Implements Habitica's daily damage formula over NumPy arrays so a whole list of
+dailies is evaluated in one call instead of one `math.pow` per task:
+
+    delta        = 0.9747 ** clip(value, -47.27, 21.27) * (1 - checklist_ratio)
+    user damage  = delta * max(0.1, 1 - CON / 250) * priority * 2
+    party damage = delta * priority * boss_strength
+
+All inputs broadcast, so a 2-D `pending` mask (scenarios x dailies) evaluates
+many what-if completion sets against the same dailies at once.
+"""
+
+# SECTION: IMPORTS
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+# SECTION: CONSTANTS
+MIN_TASK_VALUE = -47.27  # Task value is clamped to this range before the delta
+MAX_TASK_VALUE = 21.27
+DELTA_BASE = 0.9747
+CON_MITIGATION_DIVISOR = 250.0
+MIN_CON_MITIGATION = 0.1
+USER_DAMAGE_FACTOR = 2.0
+DAMAGE_DECIMALS = 1  # Matches the rounding shown by Habitica
+
+
+# SECTION: CLASSES
+
+
+# KLASS: DamageForecast
+class DamageForecast(NamedTuple):
+    """Per-daily damage arrays, shaped like the broadcast inputs."""
+
+    user: np.ndarray
+    party: np.ndarray
+
+    @property
+    def total_user(self) -> np.ndarray | float:
+        """User damage summed over the last (dailies) axis."""
+        return self.user.sum(axis=-1)
+
+    @property
+    def total_party(self) -> np.ndarray | float:
+        """Party damage summed over the last (dailies) axis."""
+        return self.party.sum(axis=-1)
+
+
+# SECTION: FUNCTIONS
+
+
+# FUNC: daily_deltas
+def daily_deltas(values: ArrayLike, checklist_ratios: ArrayLike) -> np.ndarray:
+    """Computes the unmitigated delta of each daily.
+
+    Args:
+        values: Task values.
+        checklist_ratios: Completed fraction of each daily's checklist (0-1).
+
+    Returns:
+        Array of deltas, broadcast from the inputs.
+    """
+    clamped = np.clip(np.asarray(values, dtype=np.float64), MIN_TASK_VALUE, MAX_TASK_VALUE)
+    return np.power(DELTA_BASE, clamped) * (1.0 - np.asarray(checklist_ratios, dtype=np.float64))
+
+
+# FUNC: con_mitigation
+def con_mitigation(con: ArrayLike) -> np.ndarray:
+    """Computes the damage multiplier granted by effective CON."""
+    return np.maximum(MIN_CON_MITIGATION, 1.0 - np.asarray(con, dtype=np.float64) / CON_MITIGATION_DIVISOR)
+
+
+# FUNC: forecast_daily_damage
+def forecast_daily_damage(
+    values: ArrayLike,
+    priorities: ArrayLike,
+    checklist_ratios: ArrayLike,
+    con: ArrayLike,
+    boss_strength: ArrayLike = 0.0,
+    pending: ArrayLike | None = None,
+    round_result: bool = True,
+) -> DamageForecast:
+    """Computes user and party damage for many dailies in one vectorized call.
+
+    Args:
+        values: Task values, one per daily.
+        priorities: Task priorities (difficulty multipliers).
+        checklist_ratios: Completed fraction of each checklist (0-1).
+        con: The user's effective CON. Use shape (scenarios, 1) to vary it per scenario.
+        boss_strength: Strength of the active boss, 0 when not on a boss quest.
+        pending: Optional boolean mask; False entries (completed dailies) deal no damage.
+            A 2-D mask of shape (scenarios, dailies) evaluates what-if scenarios.
+        round_result: Round each daily's damage to one decimal like the per-task display.
+
+    Returns:
+        A DamageForecast with non-negative user and party damage arrays.
+    """
+    deltas = daily_deltas(values, checklist_ratios)
+    priorities = np.asarray(priorities, dtype=np.float64)
+    user = deltas * priorities * USER_DAMAGE_FACTOR * con_mitigation(con)
+    party = deltas * priorities * np.asarray(boss_strength, dtype=np.float64)
+
+    if pending is not None:
+        mask = np.asarray(pending, dtype=bool)
+        user = np.where(mask, user, 0.0)
+        party = np.where(mask, party, 0.0)
+
+    if round_result:
+        user = np.round(user, DAMAGE_DECIMALS)
+        party = np.round(party, DAMAGE_DECIMALS)
+    return DamageForecast(np.maximum(user, 0.0), np.maximum(party, 0.0))
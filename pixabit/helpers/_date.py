@@ -10,7 +10,8 @@ Requires `python-dateutil` and `tzlocal`.
 
 # SECTION: IMPORTS
 from datetime import datetime, timedelta, timezone, tzinfo
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
 import dateutil.parser
 from dateutil.tz import tzlocal  # Preferred import for local timezone object
@@ -37,6 +38,12 @@ except ImportError:
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
 
+# SECTION: CONSTANTS
+EPOCH_MS_THRESHOLD = 2e9  # Epoch values above this are treated as milliseconds
+TIMESTAMP_CACHE_SIZE = 4096  # Max distinct timestamp strings kept parsed
+ISO_BASIC_DATE_DIGITS = 8  # All-digit strings up to this long are ISO dates ('20250101'), not epochs
+
+
 # SECTION: FUNCTIONS
 
 
@@ -46,6 +53,65 @@ def convert_unix_to_utc(timestamp_ms):
     return dt_utc
 
 
+# FUNC: _epoch_to_utc
+def _epoch_to_utc(value: int | float) -> datetime:
+    """Converts a Unix epoch number to UTC, auto-detecting milliseconds vs seconds."""
+    seconds = value / 1000.0 if abs(value) > EPOCH_MS_THRESHOLD else float(value)
+    return datetime.fromtimestamp(seconds, tz=timezone.utc)
+
+
+# FUNC: _parse_utc_string
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def _parse_utc_string(value: str) -> datetime | None:
+    """Parses a timestamp string to aware UTC. Cached, since API payloads repeat the same strings."""
+    text = value.strip()
+    if not text:
+        return None
+    try:
+        if text.lstrip("-").replace(".", "", 1).isdigit() and not (text.isdigit() and len(text) <= ISO_BASIC_DATE_DIGITS):
+            return _epoch_to_utc(float(text))
+        try:
+            # Fast path: C-implemented ISO parser (accepts 'Z' on Python 3.11+)
+            dt_object = datetime.fromisoformat(text)
+        except ValueError:
+            dt_object = dateutil.parser.isoparse(text)
+    except (ValueError, TypeError, OverflowError):
+        return None
+    if dt_object.tzinfo is None:
+        return dt_object.replace(tzinfo=timezone.utc)
+    return dt_object.astimezone(timezone.utc)
+
+
+# FUNC: parse_utc_datetime
+def parse_utc_datetime(value: Any) -> datetime | None:
+    """Parses an API timestamp into a timezone-aware UTC datetime.
+
+    Lightweight replacement for building a `DateTimeHandler` when only the UTC
+    value is needed (e.g. in model validators). Naive inputs are assumed UTC.
+
+    Args:
+        value: ISO 8601 string, Unix epoch (seconds or milliseconds, as number
+               or numeric string), datetime object, or None.
+
+    Returns:
+        The aware UTC datetime, or None if the input is empty or unparseable.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, str):
+        return _parse_utc_string(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+    if isinstance(value, (int, float)):
+        try:
+            return _epoch_to_utc(value)
+        except (ValueError, OverflowError, OSError):
+            return None
+    return None
+
+
 # FUNC: convert_timestamp_to_utc
 def convert_timestamp_to_utc(timestamp: str | None) -> datetime | None:
     """Converts an ISO 8601 timestamp string to a timezone-aware datetime object in UTC.
@@ -0,0 +1,47 @@
+# pixabit/helpers/_emoji.py
+
+# SECTION: MODULE DOCSTRING
+"""Provides a memoized wrapper around `emoji_data_python.replace_colons`.
+
+Model validators expand emoji shortcodes (e.g. ``:smile:``) on every text field
+of every object they validate. On a refresh nearly every string is identical to
+the previous one, so results are kept in a bounded LRU cache keyed by the raw
+string. Strings without a ``:`` cannot contain a shortcode and skip the lookup.
+"""
+
+# SECTION: IMPORTS
+from functools import lru_cache
+
+import emoji_data_python
+
+# SECTION: CONSTANTS
+EMOJI_CACHE_SIZE = 8192  # Max distinct raw strings kept in the cache
+
+
+# SECTION: FUNCTIONS
+
+
+@lru_cache(maxsize=EMOJI_CACHE_SIZE)
+def _replace_colons_cached(text: str) -> str:
+    return emoji_data_python.replace_colons(text)
+
+
+# FUNC: replace_emoji_colons
+def replace_emoji_colons(text: str) -> str:
+    """Replaces emoji shortcodes in a string, reusing previous results.
+
+    Args:
+        text: The raw string, possibly containing ``:shortcode:`` sequences.
+
+    Returns:
+        The string with known shortcodes replaced by their emoji characters.
+    """
+    if ":" not in text:
+        return text
+    return _replace_colons_cached(text)
+
+
+# FUNC: clear_emoji_cache
+def clear_emoji_cache() -> None:
+    """Empties the shortcode expansion cache."""
+    _replace_colons_cached.cache_clear()
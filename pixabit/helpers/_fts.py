@@ -0,0 +1,221 @@
+# pixabit/helpers/_fts.py
+
+# SECTION: MODULE DOCSTRING
+"""SQLite FTS5 full-text search shared by the archive and the live lists.
+
+Both use the same two index layouts:
+
+- tasks: text, notes, checklist (item texts joined), plus unindexed task_id,
+  challenge_id and type for filtering and joining back.
+- challenges: name, summary, description, plus unindexed challenge_id.
+
+Rows are keyed by a stable 63-bit rowid derived from the entity IDs
+(`fts_rowid`), so a single changed task or challenge can be replaced without
+scanning the index. Results are ranked with bm25 (title columns weigh most)
+and carry a highlighted snippet.
+
+`FtsIndex` is the in-memory variant used by `TaskList.search` and
+`ChallengeList.search`; the Archiver keeps the same tables in its database.
+"""
+
+# SECTION: IMPORTS
+from __future__ import annotations
+
+import hashlib
+import re
+import sqlite3
+import threading
+from typing import Any, Iterable, NamedTuple
+
+# SECTION: CONSTANTS
+TASK_FTS_COLUMNS = ("text", "notes", "checklist", "task_id", "challenge_id", "type")
+CHALLENGE_FTS_COLUMNS = ("name", "summary", "description", "challenge_id")
+TASK_WEIGHTS = (4.0, 1.0, 1.0)  # bm25 weights for text, notes, checklist
+CHALLENGE_WEIGHTS = (4.0, 2.0, 1.0)  # bm25 weights for name, summary, description
+HIGHLIGHT = ("[b]", "[/b]")  # Rich/Textual markup around matched terms
+SNIPPET_TOKENS = 12
+DEFAULT_LIMIT = 20
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+# SECTION: FUNCTIONS
+
+
+# FUNC: task_fts_schema
+def task_fts_schema(table: str) -> str:
+    return (
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5("
+        "text, notes, checklist, task_id UNINDEXED, challenge_id UNINDEXED, type UNINDEXED, tokenize = 'unicode61 remove_diacritics 2')"
+    )
+
+
+# FUNC: challenge_fts_schema
+def challenge_fts_schema(table: str) -> str:
+    return (
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5("
+        "name, summary, description, challenge_id UNINDEXED, tokenize = 'unicode61 remove_diacritics 2')"
+    )
+
+
+# FUNC: fts_rowid
+def fts_rowid(*ids: str | None) -> int:
+    """Stable positive 63-bit rowid for an entity key, e.g. (challenge_id, task_id)."""
+    digest = hashlib.blake2b("\x1f".join(i or "" for i in ids).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") >> 1
+
+
+# FUNC: fts_query
+def fts_query(text: str) -> str | None:
+    """Turns free user input into a safe FTS5 query.
+
+    Every word becomes a quoted term (so punctuation and FTS operators in the
+    input cannot cause syntax errors) and the last one a prefix term, for
+    search-as-you-type. All terms must match.
+
+    Returns:
+        The MATCH expression, or None if the input has no searchable words.
+    """
+    tokens = _TOKEN_RE.findall(text or "")
+    if not tokens:
+        return None
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+# FUNC: checklist_text
+def checklist_text(checklist: Iterable[Any] | None) -> str:
+    """Joins checklist item texts (models or raw dicts) into one searchable string."""
+    texts = (item.get("text") if isinstance(item, dict) else getattr(item, "text", None) for item in checklist or ())
+    return "\n".join(text for text in texts if text)
+
+
+# FUNC: task_fts_row
+def task_fts_row(task_id: str, challenge_id: str | None, task_type: str | None, text: str | None, notes: str | None, checklist: str) -> tuple[Any, ...]:
+    """Row for a task FTS table: (rowid, *TASK_FTS_COLUMNS)."""
+    return (fts_rowid(challenge_id, task_id), text or "", notes or "", checklist, task_id, challenge_id, task_type)
+
+
+# FUNC: challenge_fts_row
+def challenge_fts_row(challenge_id: str, name: str | None, summary: str | None, description: str | None) -> tuple[Any, ...]:
+    """Row for a challenge FTS table: (rowid, *CHALLENGE_FTS_COLUMNS)."""
+    return (fts_rowid(challenge_id), name or "", summary or "", description or "", challenge_id)
+
+
+# FUNC: insert_sql
+def insert_sql(table: str, columns: tuple[str, ...]) -> str:
+    return f"INSERT OR REPLACE INTO {table} (rowid, {', '.join(columns)}) VALUES ({', '.join('?' * (len(columns) + 1))})"
+
+
+# FUNC: search_tasks
+def search_tasks(
+    conn: sqlite3.Connection,
+    table: str,
+    query: str,
+    limit: int = DEFAULT_LIMIT,
+    task_type: str | None = None,
+    challenge_id: str | None = None,
+    highlight: tuple[str, str] = HIGHLIGHT,
+) -> list[SearchHit]:
+    """Ranked task search over a task FTS table."""
+    match = fts_query(query)
+    if match is None:
+        return []
+    clauses, params = [f"{table} MATCH ?"], [match]
+    if task_type:
+        clauses.append("type = ?")
+        params.append(task_type)
+    if challenge_id:
+        clauses.append("challenge_id = ?")
+        params.append(challenge_id)
+    sql = (
+        f"SELECT task_id, challenge_id, type, text, snippet({table}, -1, ?, ?, '…', {SNIPPET_TOKENS}) AS snip, "
+        f"bm25({table}, {', '.join(map(str, TASK_WEIGHTS))}) AS rank "
+        f"FROM {table} WHERE {' AND '.join(clauses)} ORDER BY rank LIMIT ?"
+    )
+    rows = conn.execute(sql, (*highlight, *params, limit)).fetchall()
+    return [SearchHit("task", row[0], row[1], row[2], row[3], row[4], -row[5]) for row in rows]
+
+
+# FUNC: search_challenges
+def search_challenges(
+    conn: sqlite3.Connection, table: str, query: str, limit: int = DEFAULT_LIMIT, highlight: tuple[str, str] = HIGHLIGHT
+) -> list[SearchHit]:
+    """Ranked challenge search over a challenge FTS table."""
+    match = fts_query(query)
+    if match is None:
+        return []
+    sql = (
+        f"SELECT challenge_id, name, snippet({table}, -1, ?, ?, '…', {SNIPPET_TOKENS}) AS snip, "
+        f"bm25({table}, {', '.join(map(str, CHALLENGE_WEIGHTS))}) AS rank "
+        f"FROM {table} WHERE {table} MATCH ? ORDER BY rank LIMIT ?"
+    )
+    rows = conn.execute(sql, (*highlight, match, limit)).fetchall()
+    return [SearchHit("challenge", row[0], row[0], None, row[1], row[2], -row[3]) for row in rows]
+
+
+# SECTION: CLASSES
+
+
+# KLASS: SearchHit
+class SearchHit(NamedTuple):
+    """One ranked full-text match."""
+
+    kind: str  # "task" or "challenge"
+    id: str
+    challenge_id: str | None
+    type: str | None  # Task type; None for challenges
+    title: str  # Task text or challenge name
+    snippet: str  # Best matching fragment, matches wrapped in `highlight`
+    score: float  # Higher is better (negated bm25)
+
+
+# KLASS: FtsIndex
+class FtsIndex:
+    """In-memory FTS5 index over live tasks and challenges.
+
+    Callers (the list models) decide when to rebuild; see `TaskList.search`.
+    """
+
+    TASKS = "tasks_fts"
+    CHALLENGES = "challenges_fts"
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()  # The TUI searches from worker threads
+        self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self._conn.execute(task_fts_schema(self.TASKS))
+        self._conn.execute(challenge_fts_schema(self.CHALLENGES))
+
+    def index_tasks(self, tasks: Iterable[Any]) -> None:
+        """Replaces the task index with the given Task models."""
+        rows = [
+            task_fts_row(
+                task.id,
+                task.challenge.challenge_id if getattr(task, "challenge", None) else None,
+                task.type,
+                task.text,
+                task.notes,
+                checklist_text(getattr(task, "checklist", None)),
+            )
+            for task in tasks
+            if task.id
+        ]
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.TASKS}")
+            self._conn.executemany(insert_sql(self.TASKS, TASK_FTS_COLUMNS), rows)
+
+    def index_challenges(self, challenges: Iterable[Any]) -> None:
+        """Replaces the challenge index with the given Challenge models."""
+        rows = [challenge_fts_row(c.id, c.name, c.summary, c.description) for c in challenges if c.id]
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.CHALLENGES}")
+            self._conn.executemany(insert_sql(self.CHALLENGES, CHALLENGE_FTS_COLUMNS), rows)
+
+    def search_tasks(self, query: str, limit: int = DEFAULT_LIMIT, task_type: str | None = None, highlight: tuple[str, str] = HIGHLIGHT) -> list[SearchHit]:
+        with self._lock:
+            return search_tasks(self._conn, self.TASKS, query, limit, task_type=task_type, highlight=highlight)
+
+    def search_challenges(self, query: str, limit: int = DEFAULT_LIMIT, highlight: tuple[str, str] = HIGHLIGHT) -> list[SearchHit]:
+        with self._lock:
+            return search_challenges(self._conn, self.CHALLENGES, query, limit, highlight=highlight)
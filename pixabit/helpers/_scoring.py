@@ -0,0 +1,164 @@
+# pixabit/helpers/_scoring.py
+
+# SECTION: MODULE DOCSTRING
+"""Local model of Habitica's task scoring, for optimistic updates.
+
+Mirrors the server's `scoreTask` for a single manual score (no cron):
+
+    delta     = 0.9747 ** clip(value, -47.27, 21.27)        (up: +, down: -)
+              unchecking a daily/todo uses the reverse delta that restores
+              the value before it was checked; todos multiply by
+              (1 + checked checklist items)
+    exp       += round(delta * (1 + INT * 0.025) * priority * 6)
+    gp        += delta * priority * (1 + PER * 0.02) * (1 + streak / 100)
+    mp        += ±max(0.25, 0.0025 * maxMP)
+    hp        += round(delta * max(0.1, 1 - CON / 250) * priority * 2, 1)   (habit down)
+    boss dmg  += delta * (1 + STR / 200)
+
+Critical hits and drops are random and cannot be predicted; they arrive with
+the server's response and are reconciled there.
+"""
+
+# SECTION: IMPORTS
+from __future__ import annotations
+
+import math
+from typing import NamedTuple
+
+from pixabit.helpers._damage import CON_MITIGATION_DIVISOR, DELTA_BASE, MAX_TASK_VALUE, MIN_CON_MITIGATION, MIN_TASK_VALUE
+
+# SECTION: CONSTANTS
+CLOSE_ENOUGH = 0.00001  # Convergence of the reverse delta
+MAX_REVERSE_ITERATIONS = 100
+EXP_FACTOR = 6.0
+INT_EXP_BONUS = 0.025
+PER_GP_BONUS = 0.02
+STR_QUEST_BONUS = 1 / 200
+MIN_MP_GAIN = 0.25
+MP_GAIN_RATIO = 0.0025
+HP_DAMAGE_FACTOR = 2.0
+MAX_LEVEL = 9999
+
+
+# SECTION: CLASSES
+
+
+# KLASS: ScorePrediction
+class ScorePrediction(NamedTuple):
+    """Predicted effect of one score; stat fields are changes, not totals."""
+
+    delta: float  # Task value change
+    exp: float
+    gp: float
+    mp: float
+    hp: float
+    quest_up: float  # Pending boss damage change
+    streak: int  # Daily streak change
+    completed: bool | None  # New completed state for dailies/todos, None for habits/rewards
+
+
+# SECTION: FUNCTIONS
+
+
+# FUNC: task_delta
+def task_delta(value: float, direction: str) -> float:
+    """Value change of a normal score in `direction` ('up' or 'down')."""
+    current = min(max(value, MIN_TASK_VALUE), MAX_TASK_VALUE)
+    return DELTA_BASE**current * (-1.0 if direction == "down" else 1.0)
+
+
+# FUNC: reverse_delta
+def reverse_delta(value: float) -> float:
+    """Value change that undoes the check which led to `value` (always <= 0).
+
+    Solves `previous + 0.9747 ** previous == value` for `previous` by fixed-point iteration.
+    """
+    current = min(max(value, MIN_TASK_VALUE), MAX_TASK_VALUE)
+    test = current - DELTA_BASE**current
+    for _ in range(MAX_REVERSE_ITERATIONS):
+        diff = current - (test + DELTA_BASE**test)
+        if abs(diff) <= CLOSE_ENOUGH:
+            break
+        test += diff
+    return test - current
+
+
+# FUNC: exp_to_next_level
+def exp_to_next_level(level: int) -> int:
+    """Experience needed to leave `level`, as Habitica computes `toNextLevel`."""
+    return int(round((level**2 * 0.25 + 10 * level + 139.75) / 10) * 10)
+
+
+# FUNC: predict_score
+def predict_score(
+    task_type: str,
+    direction: str,
+    value: float,
+    priority: float = 1.0,
+    streak: int = 0,
+    completed: bool = False,
+    checked_items: int = 0,
+    stats: dict[str, float] | None = None,
+    max_mp: float = 10.0,
+    on_quest: bool = False,
+) -> ScorePrediction:
+    """Predicts the effect of scoring a task once.
+
+    Args:
+        task_type: 'habit', 'daily', 'todo' or 'reward'.
+        direction: 'up' or 'down'.
+        value: Task value before the score (the cost, for rewards).
+        priority: Task difficulty multiplier.
+        streak: Daily streak before the score.
+        completed: Whether the daily/todo is currently checked.
+        checked_items: Checked checklist items (todos).
+        stats: The user's effective stats ('str', 'con', 'int', 'per').
+        max_mp: The user's maximum MP.
+        on_quest: Whether scoring counts towards a boss quest.
+
+    Returns:
+        The predicted changes; all zero when the score changes nothing
+        (checking an already checked daily, etc.).
+    """
+    if task_type == "reward":
+        return ScorePrediction(0.0, 0.0, -value, 0.0, 0.0, 0.0, 0, None)
+    if task_type in ("daily", "todo") and completed == (direction == "up"):
+        return ScorePrediction(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0, completed)
+
+    stats = stats or {}
+    undo = task_type in ("daily", "todo") and direction == "down"
+    delta = reverse_delta(value) if undo else task_delta(value, direction)
+    if task_type == "todo" and checked_items:
+        delta *= 1 + checked_items
+
+    mp = math.copysign(max(MIN_MP_GAIN, MP_GAIN_RATIO * max_mp), delta)  # Down scores cost MP too
+    if task_type == "habit" and direction == "down":
+        mitigation = max(MIN_CON_MITIGATION, 1.0 - stats.get("con", 0.0) / CON_MITIGATION_DIVISOR)
+        hp = round(delta * mitigation * priority * HP_DAMAGE_FACTOR, 1)
+        return ScorePrediction(delta, 0.0, 0.0, mp, hp, 0.0, 0, None)
+
+    exp = float(round(delta * (1 + stats.get("int", 0.0) * INT_EXP_BONUS) * priority * EXP_FACTOR))
+    gp = delta * priority * (1 + stats.get("per", 0.0) * PER_GP_BONUS)
+    if task_type == "daily" and streak:
+        gp *= 1 + (streak - 1 if undo else streak) / 100
+    quest_up = delta * (1 + stats.get("str", 0.0) * STR_QUEST_BONUS) if on_quest else 0.0
+    streak_change = (-1 if streak > 0 else 0) if undo else (1 if task_type == "daily" else 0)
+    new_completed = (direction == "up") if task_type in ("daily", "todo") else None
+    return ScorePrediction(delta, exp, gp, mp, 0.0, quest_up, streak_change, new_completed)
+
+
+# FUNC: apply_level_ups
+def apply_level_ups(exp: float, level: int, to_next_level: int) -> tuple[float, int, int, bool]:
+    """Rolls surplus experience into levels.
+
+    Returns:
+        (exp, level, to_next_level, leveled_up)
+    """
+    leveled_up = False
+    to_next = to_next_level or exp_to_next_level(level)
+    while exp >= to_next > 0 and level < MAX_LEVEL:
+        exp -= to_next
+        level += 1
+        to_next = exp_to_next_level(level)
+        leveled_up = True
+    return max(0.0, exp), level, to_next, leveled_up
@@ -19,14 +19,14 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Iterator, Literal
+from typing import Any, Callable, Iterable, Iterator, Literal
 
 # External Libs
-import emoji_data_python
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PrivateAttr,
     ValidationError,
     ValidationInfo,
     computed_field,
@@ -35,14 +35,16 @@ from pydantic import (
 )
 
 from pixabit.config import USER_ID
+from pixabit.helpers._emoji import replace_emoji_colons
+from pixabit.helpers._fts import DEFAULT_LIMIT, HIGHLIGHT, FtsIndex, SearchHit
 
 # Local Imports (Ensure these resolve correctly)
 try:
     from pixabit.api.client import HabiticaClient
     from pixabit.config import HABITICA_DATA_PATH
+    from pixabit.helpers._date import parse_utc_datetime
     from pixabit.helpers._json import save_json, save_pydantic_model
     from pixabit.helpers._logger import log
-    from pixabit.helpers.DateTimeHandler import DateTimeHandler
 
     from .task import AnyTask, Task, TaskList
     from .user import User
@@ -74,9 +76,8 @@ except ImportError:
         def from_raw_api_list(cls, li):
             return cls(li)
 
-    class DateTimeHandler:
-        __init__ = lambda s, t: None
-        utc_datetime = None
+    def parse_utc_datetime(value):
+        return None
 
     class HabiticaClient:
         async def get_challenges(self):
@@ -129,7 +130,7 @@ class ChallengeLeader(BaseModel):
     @classmethod
     def parse_name_emoji(cls, value: Any) -> str | None:
         if isinstance(value, str):
-            return emoji_data_python.replace_colons(value).strip()
+            return replace_emoji_colons(value).strip()
         return None
 
 
@@ -148,7 +149,7 @@ class ChallengeGroup(BaseModel):
     def parse_name_emoji(cls, value: Any) -> str:
         default = "Unnamed Group"
         if isinstance(value, str):
-            parsed = emoji_data_python.replace_colons(value).strip()
+            parsed = replace_emoji_colons(value).strip()
             return parsed if parsed else default
         return default
 
@@ -212,8 +213,16 @@ class Challenge(BaseModel):
     joined: bool | None = Field(None, description="Has the fetching user joined this challenge? (Set externally)", exclude=False)
 
     # --- Linked Data ---
-    # Populated externally by ChallengeList.link_tasks()
-    tasks: list[Task] = Field(default_factory=list, description="Tasks belonging to this challenge.", exclude=False)
+    # Populated externally by ChallengeList.link_tasks(); once linked, this is the TaskList's own index list
+    task_ids: list[str] = Field(default_factory=list, description="IDs of tasks belonging to this challenge.")
+    _task_list: TaskList | None = PrivateAttr(default=None)
+
+    @property
+    def tasks(self) -> list[Task]:
+        """Tasks belonging to this challenge, resolved from the linked TaskList."""
+        if self._task_list is None:
+            return []
+        return [task for task_id in self.task_ids if (task := self._task_list.get_task_by_id(task_id))]
 
     @computed_field(description="True if not the Tavern challenge.")
     @property
@@ -279,7 +288,7 @@ class Challenge(BaseModel):
         # (Implementation remains the same - simplified for brevity here)
         default = "Unnamed Challenge" if info.field_name == "name" else ("" if info.field_name in ["summary", "description"] else None)
         if isinstance(value, str):
-            p = emoji_data_python.replace_colons(value).strip()
+            p = replace_emoji_colons(value).strip()
             return p if (p or info.field_name != "name") else default
         return default
 
@@ -288,8 +297,7 @@ class Challenge(BaseModel):
     def parse_datetimes_utc(cls, value: Any) -> datetime | None:
         if value is None:
             return None
-        h = DateTimeHandler(timestamp=value)
-        return h.utc_datetime
+        return parse_utc_datetime(value)
 
     @field_validator("prize", "member_count", mode="before")
     @classmethod
@@ -301,9 +309,19 @@ class Challenge(BaseModel):
         except:
             return 0
 
+    def link_task_list(self, task_list: TaskList) -> None:
+        """Shares the TaskList's live ID list for this challenge; later task edits show up without relinking."""
+        self._task_list = task_list
+        self.task_ids = task_list.task_ids_for_challenge(self.id)
+
+    def set_tasks(self, task_list: TaskList) -> None:
+        """Attaches a TaskList holding exactly this challenge's tasks (e.g. restored from the archive)."""
+        self._task_list = task_list
+        self.task_ids = [task.id for task in task_list if task.id]
+
     def add_task(self, task: AnyTask) -> None:
-        if isinstance(task, Task) and task not in self.tasks:
-            self.tasks.append(task)
+        if isinstance(task, Task) and task.id not in self.task_ids:
+            self.task_ids.append(task.id)
 
     def add_tasks(self, tasks_to_add: list[AnyTask]) -> None:
         if isinstance(tasks_to_add, list):
@@ -311,7 +329,7 @@ class Challenge(BaseModel):
 
     # --- Corrected Literal string types ---
     def get_tasks_by_type(self, task_type: Literal["habit", "daily", "todo", "reward"]) -> list[AnyTask]:
-        return [t for t in self.tasks if hasattr(t, "task_type") and t.task_type == task_type]
+        return [t for t in self.tasks if t.type == task_type]
 
     def __repr__(self) -> str:
         # Simplified repr construction
@@ -325,7 +343,7 @@ class Challenge(BaseModel):
         if self.official:
             parts.append("Official")
         flags_str = f" ({', '.join(parts)})" if parts else ""
-        task_count = len(self.tasks)
+        task_count = len(self.task_ids)
         name_str = self.name or "Unnamed"
         name_preview = name_str[:25].replace("\n", " ") + ("..." if len(name_str) > 25 else "")
         id_str = self.id[:8] if self.id else "NoID"
@@ -337,14 +355,152 @@ class Challenge(BaseModel):
 
 # SECTION: CHALLENGE LIST CONTAINER
 
+# Facet name -> key extractor. Each facet indexes challenge IDs by the extracted value.
+CHALLENGE_FACETS: dict[str, Callable[[Challenge], Any]] = {
+    "leader": lambda c: c.leader.id if c.leader else None,
+    "group": lambda c: c.group.id if c.group else None,
+    "group_type": lambda c: c.group.type if c.group else None,
+    "official": lambda c: c.official,
+    "broken": lambda c: c.is_broken,
+    "joined": lambda c: bool(c.joined),
+    "owned": lambda c: bool(c.owned),
+}
+
 
 # KLASS: ChallengeList
 class ChallengeList(BaseModel):
-    """ChallengeList."""
+    """Container of challenges with ID and facet indexes.
+
+    Indexes are built when the list is created and kept current by
+    `add_challenge`, `remove_challenge`, `set_joined` and `mark_joined`.
+    Change `challenges` or index-relevant fields through these methods (or call
+    `reindex()` afterwards).
+    """
 
     model_config = ConfigDict(extra="forbid", frozen=False, arbitrary_types_allowed=False)
     challenges: list[Challenge] = Field(default_factory=list)
 
+    _by_id: dict[str, Challenge] = PrivateAttr(default_factory=dict)
+    # facet -> value -> IDs (dict used as an insertion-ordered set)
+    _facets: dict[str, dict[Any, dict[str, None]]] = PrivateAttr(default_factory=dict)
+    _names_lower: dict[str, str] = PrivateAttr(default_factory=dict)
+    _version: int = PrivateAttr(default=0)
+    _search_index: tuple[int, FtsIndex] | None = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        self.reindex()
+
+    # --- Indexing ---
+
+    def reindex(self) -> None:
+        """Rebuilds all indexes from `challenges`."""
+        self._by_id = {}
+        self._facets = {facet: {} for facet in CHALLENGE_FACETS}
+        self._names_lower = {}
+        for challenge in self.challenges:
+            self._index(challenge)
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Counter bumped by reindex, add and remove; consumers compare it to skip rebuilds."""
+        return self._version
+
+    def _index(self, challenge: Challenge) -> None:
+        self._by_id[challenge.id] = challenge
+        self._names_lower[challenge.id] = challenge.name.lower()
+        for facet, key_of in CHALLENGE_FACETS.items():
+            self._facets[facet].setdefault(key_of(challenge), {})[challenge.id] = None
+
+    def _unindex(self, challenge: Challenge) -> None:
+        self._by_id.pop(challenge.id, None)
+        self._names_lower.pop(challenge.id, None)
+        for facet_index in self._facets.values():
+            for ids in facet_index.values():
+                ids.pop(challenge.id, None)
+
+    def _ids_for(self, facet: str, value: Any) -> Iterable[str]:
+        return self._facets[facet].get(value, {}).keys()
+
+    def _subset(self, ids: Iterable[str]) -> ChallengeList:
+        return ChallengeList(challenges=[self._by_id[cid] for cid in ids if cid in self._by_id])
+
+    # --- Mutation ---
+
+    def add_challenge(self, challenge: Challenge) -> None:
+        """Adds a challenge, replacing any existing one with the same ID."""
+        existing = self._by_id.get(challenge.id)
+        if existing is not None:
+            self._unindex(existing)
+            self.challenges[self.challenges.index(existing)] = challenge
+        else:
+            self.challenges.append(challenge)
+        self._index(challenge)
+        self._version += 1
+
+    def remove_challenge(self, challenge_id: str) -> Challenge | None:
+        """Removes a challenge by ID, returning it if it was present."""
+        challenge = self._by_id.get(challenge_id)
+        if challenge is not None:
+            self._unindex(challenge)
+            self.challenges.remove(challenge)
+            self._version += 1
+        return challenge
+
+    def mark_joined(self, challenge_id: str, joined: bool = True) -> bool:
+        """Sets one challenge's joined flag and moves it between joined facets.
+
+        Returns:
+            True if the challenge is in this list.
+        """
+        challenge = self._by_id.get(challenge_id)
+        if challenge is None:
+            return False
+        joined_index = self._facets["joined"]
+        joined_index.setdefault(bool(challenge.joined), {}).pop(challenge_id, None)
+        challenge.joined = joined
+        joined_index.setdefault(joined, {})[challenge_id] = None
+        return True
+
+    def set_joined(self, joined_ids: Iterable[str]) -> int:
+        """Sets `joined` on every challenge from the user's joined challenge IDs.
+
+        Returns:
+            The number of challenges marked as joined.
+        """
+        joined_set = joined_ids if isinstance(joined_ids, (set, frozenset)) else set(joined_ids)
+        joined_index: dict[Any, dict[str, None]] = {True: {}, False: {}}
+        for challenge in self.challenges:
+            challenge.joined = challenge.id in joined_set
+            joined_index[challenge.joined][challenge.id] = None
+        self._facets["joined"] = joined_index
+        return len(joined_index[True])
+
+    # --- Search ---
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT, highlight: tuple[str, str] = HIGHLIGHT) -> list[SearchHit]:
+        """Ranked full-text search over challenge name, summary and description.
+
+        Uses an in-memory FTS5 index, rebuilt on the first search after the list version changes.
+        """
+        cached = self._search_index
+        if cached is None or cached[0] != self._version:
+            index = cached[1] if cached else FtsIndex()
+            index.index_challenges(self.challenges)
+            cached = self._search_index = (self._version, index)
+        return cached[1].search_challenges(query, limit, highlight=highlight)
+
+    # --- Facets ---
+
+    @property
+    def joined_ids(self) -> frozenset[str]:
+        """IDs of joined challenges."""
+        return frozenset(self._ids_for("joined", True))
+
+    def facet_counts(self) -> dict[str, dict[Any, int]]:
+        """Counts per facet value, e.g. {"official": {True: 3, False: 40}, "joined": {...}, ...}."""
+        return {facet: {value: len(ids) for value, ids in index.items() if ids} for facet, index in self._facets.items()}
+
     @classmethod
     def from_raw_data(
         cls,
@@ -372,29 +528,22 @@ class ChallengeList(BaseModel):
         return cls(challenges=validated_challenges)
 
     def link_tasks(self, task_list_obj: TaskList) -> int:
+        """Points every challenge at the TaskList's challenge index.
+
+        No tasks are copied: each challenge shares the TaskList's ID list for it,
+        which the TaskList keeps current as tasks are added, edited or deleted.
+
+        Returns:
+            The number of tasks linked to a known challenge.
+        """
         if not isinstance(task_list_obj, TaskList) or not self.challenges:
             return 0
-        log.info(f"Linking tasks (count={len(task_list_obj)}) to {len(self.challenges)} challenges...")
-        lookup = {c.id: c for c in self.challenges}
+        linked = 0
         for challenge in self.challenges:
-            challenge.tasks.clear()  # Clear first
-        linked, skip_link, skip_found = 0, 0, 0
-        for task in task_list_obj:  # Iterate through the tasks from TaskList
-            if not isinstance(task, Task) or not task.challenge:
-                skip_link += 1
-                continue
-            challenge_id_from_task = task.challenge.challenge_id  # Correct variable name
-            if not challenge_id_from_task:
-                skip_link += 1
-                continue
-            target_challenge = lookup.get(challenge_id_from_task)  # Correct variable name
-            if target_challenge:
-                target_challenge.add_task(task)
-                linked += 1
-            else:
-                skip_found += 1
-                # log.debug(f"Task {getattr(task,'id','N/A')} links to missing chal {challenge_id_from_task}")
-        log.info(f"Linking done. Linked:{linked}, NoLinkInfo:{skip_link}, NotFound:{skip_found}.")
+            challenge.link_task_list(task_list_obj)
+            linked += len(challenge.task_ids)
+        not_found = len(task_list_obj.linked_challenge_ids() - {c.id for c in self.challenges})
+        log.info(f"Linked {linked} tasks to {len(self.challenges)} challenges (tasks of {not_found} unknown challenges skipped).")
         return linked
 
     def __len__(self) -> int:
@@ -410,44 +559,46 @@ class ChallengeList(BaseModel):
         # Slicing works inherently on the list
         return self.challenges[index]
 
+    def __contains__(self, challenge_id: object) -> bool:
+        return challenge_id in self._by_id
+
     def get_by_id(self, challenge_id: str) -> Challenge | None:
         """Finds a challenge by its ID."""
-        # Can optimize with the lookup dict if created/stored persistently, but linear scan is fine too
-        return next((c for c in self.challenges if c.id == challenge_id), None)
+        return self._by_id.get(challenge_id)
 
-    # --- Filter methods - Placeholder implementations returning empty lists ---
-    def _filter(self, criteria: callable[[Challenge], bool]) -> ChallengeList:
-        # Basic filter mechanism used by others
-        return ChallengeList(challenges=[c for c in self.challenges if criteria(c)])  # Corrected this
+    # --- Filter methods - served from the facet indexes, in insertion order ---
+    def _filter(self, criteria: Callable[[Challenge], bool]) -> ChallengeList:
+        # Fallback scan for ad-hoc criteria
+        return ChallengeList(challenges=[c for c in self.challenges if criteria(c)])
 
     def filter_by_name(self, name_part: str, case_sensitive=False) -> ChallengeList:
-        name_match = name_part if case_sensitive else name_part.lower()
-        return self._filter(lambda c: name_match in (c.name if case_sensitive else c.name.lower()))
+        if case_sensitive:
+            return self._filter(lambda c: name_part in c.name)
+        name_match = name_part.lower()
+        return self._subset(cid for cid, name in self._names_lower.items() if name_match in name)
 
     def filter_by_leader(self, leader_id: str) -> ChallengeList:
-        return self._filter(lambda c: c.leader and c.leader.id == leader_id)
+        return self._subset(self._ids_for("leader", leader_id))
 
     def filter_by_group(self, group_id: str | None = None, group_type: str | None = None) -> ChallengeList:
-        def criteria(c: Challenge) -> bool:
-            group = c.group
-            if not group:
-                return False  # Challenge must have group for filtering
-            if group_id and group.id != group_id:
-                return False
-            if group_type and group.type != group_type:
-                return False
-            return True
-
-        return self._filter(criteria)
+        if group_id:
+            ids = self._ids_for("group", group_id)
+            if group_type:
+                ids = [cid for cid in ids if self._by_id[cid].group.type == group_type]
+            return self._subset(ids)
+        if group_type:
+            return self._subset(self._ids_for("group_type", group_type))
+        # Any challenge with a group
+        return self._subset(cid for value, ids in self._facets["group"].items() if value is not None for cid in ids)
 
     def filter_official(self, official: bool = True) -> ChallengeList:
-        return self._filter(lambda c: c.official == official)
+        return self._subset(self._ids_for("official", official))
 
     def filter_broken(self, is_broken: bool = True) -> ChallengeList:
-        return self._filter(lambda c: c.is_broken == is_broken)
+        return self._subset(self._ids_for("broken", is_broken))
 
     def filter_joined(self, joined: bool = True) -> ChallengeList:
-        return self._filter(lambda c: c.joined == joined)
+        return self._subset(self._ids_for("joined", joined))
 
     # --- End Filters ---
 
@@ -558,34 +709,8 @@ async def main():
         if challenge_list_instance:
             log.info(f"Saving processed challenge list to {processed_challenges_path}...")
             try:
-                # 1. Dump the ChallengeList to a dict, carefully excluding nested fields
-                #    We need to specify the path to exclude within the structure.
-                #    Structure: ChallengeList -> challenges (list) -> [index] -> tasks (list) -> [index] -> styled_text/notes
-                #    The exclude syntax for nested lists isn't straightforward for model_dump.
-                #    Easier: Dump challenges individually excluding bad fields, then reconstruct.
-
-                processed_challenges_list = []
-                for challenge in challenge_list_instance.challenges:
-                    # Dump each challenge, excluding the Task fields causing issues
-                    # The 'tasks' list itself is included, but styled_text/notes WITHIN those tasks are not.
-                    # NOTE: Pydantic's nested exclude doesn't easily target computed fields
-                    #       within nested list models directly. We may need to dump tasks manually.
-
-                    challenge_dict = challenge.model_dump(
-                        mode="json",
-                        exclude={  # Exclude from the Challenge level
-                            "tasks": {"__all__": {"styled_text", "styled_notes"}}  # For items in the 'tasks' list...  # Exclude these fields for all tasks
-                        },
-                    )
-                    processed_challenges_list.append(challenge_dict)
-
-                # Re-wrap the list of challenge dicts into the structure expected by ChallengeList save
-                # Our ChallengeList BaseModel *only* has the 'challenges' field
-                data_to_save = {"challenges": processed_challenges_list}
-
-                # 2. Save the resulting dictionary using the basic save_json helper
-                from pixabit.helpers._json import save_json
-
+                # Challenges store task IDs, not task bodies, so a plain dump is enough
+                data_to_save = challenge_list_instance.model_dump(mode="json")
                 save_successful = save_json(data_to_save, processed_challenges_path.name, folder=processed_challenges_path.parent)
 
                 if save_successful:
@@ -13,24 +13,30 @@ for fetching, caching (raw and processed), and accessing this data efficiently.
 # SECTION: IMPORTS
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import sys
+from collections.abc import Iterator, Mapping
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Literal, Type  # Use standard lowercase etc.
-
-import emoji_data_python
+from typing import Any, Callable, ClassVar, Iterable, Literal, NamedTuple, Type, TypeVar  # Use standard lowercase etc.
 
 # External Libs
+import numpy as np
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PrivateAttr,
     ValidationError,
     computed_field,  # <<<---- Import computed_field
     field_validator,
     model_validator,
 )
 
+from pixabit.helpers._emoji import replace_emoji_colons
+
 # Local Imports (assuming helpers and api are accessible)
 try:
     from pixabit.api.client import HabiticaClient  # Needed to fetch content
@@ -38,9 +44,9 @@ try:
         DEFAULT_CACHE_DURATION_DAYS,  # Default expiry
         HABITICA_DATA_PATH,  # Main cache dir
     )
+    from pixabit.helpers._date import parse_utc_datetime
     from pixabit.helpers._json import load_json, load_pydantic_model, save_json, save_pydantic_model
     from pixabit.helpers._logger import log
-    from pixabit.helpers.DateTimeHandler import DateTimeHandler
 except ImportError:
     import logging
 
@@ -68,13 +74,17 @@ except ImportError:
 # SECTION: CONSTANTS & CONFIG
 CACHE_SUBDIR_STATIC = "static_content"
 RAW_CONTENT_FILENAME = "habitica_content_raw.json"
-PROCESSED_CONTENT_FILENAME = "habitica_content_processed.json"
+PROCESSED_CONTENT_FILENAME = "habitica_content_compact.json"  # Raw sections only; items validate lazily
+CONTENT_SCHEMA_VERSION = 2  # Bump when GameContent gains/changes sections; older caches are reprocessed
 
 # Ensure base path exists
 HABITICA_DATA_PATH.mkdir(parents=True, exist_ok=True)
 STATIC_CACHE_DIR = HABITICA_DATA_PATH / CACHE_SUBDIR_STATIC
 STATIC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+GEAR_STAT_KEYS: tuple[str, ...] = ("str", "con", "int", "per")  # Column order of gear bonus tables
+CLASS_BONUS_MULTIPLIER = 1.5  # Gear of the user's own class gives 1.5x its stats
+
 
 # SECTION: PYDANTIC MODELS FOR CONTENT ITEMS
 
@@ -93,8 +103,7 @@ class GearEvent(BaseModel):
     @field_validator("start_date", "end_date", mode="before")
     @classmethod
     def parse_datetime_utc(cls, v: Any) -> datetime | None:
-        handler = DateTimeHandler(timestamp=v)
-        return handler.utc_datetime
+        return parse_utc_datetime(v)
 
 
 # KLASS: Gear
@@ -139,7 +148,7 @@ class Gear(BaseModel):
     @classmethod
     def parse_text_emoji(cls, v: Any) -> str:
         if isinstance(v, str):
-            return emoji_data_python.replace_colons(v).strip()
+            return replace_emoji_colons(v).strip()
         return ""
 
     @field_validator("value", mode="before")
@@ -177,7 +186,7 @@ class Spell(BaseModel):
     @classmethod
     def parse_text_emoji(cls, v: Any) -> str:
         if isinstance(v, str):
-            return emoji_data_python.replace_colons(v).strip()
+            return replace_emoji_colons(v).strip()
         return ""
 
     @field_validator("mana", mode="before")
@@ -334,7 +343,7 @@ class Quest(BaseModel):
     @classmethod
     def parse_text_emoji(cls, v: Any) -> str:
         if isinstance(v, str):
-            return emoji_data_python.replace_colons(v).strip()
+            return replace_emoji_colons(v).strip()
         return ""
 
     @field_validator("value", mode="before")
@@ -374,83 +383,418 @@ class Quest(BaseModel):
     # --- END computed_field properties ---
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+
+# SECTION: GEAR BONUS TABLE
+
+
+def _as_float(value: Any) -> float:
+    try:
+        return float(value) if value is not None else 0.0
+    except (ValueError, TypeError):
+        return 0.0
+
+
+# KLASS: GearBonusTable
+class GearBonusTable(NamedTuple):
+    """Stat bonuses of every gear item for one user class, class multiplier applied.
+
+    Rows follow `keys`; columns follow GEAR_STAT_KEYS. Built once per GameContent
+    (i.e. per content version) and class by `GameContent.gear_bonus_table`.
+    """
+
+    user_class: str | None
+    keys: tuple[str, ...]
+    index: dict[str, int]
+    bonuses: np.ndarray  # (items, 4) float64, read-only
+    slots: np.ndarray  # (items,) slot name per row ('' if unknown)
+    two_handed: np.ndarray  # (items,) bool
+
+    def rows_for(self, gear_keys: Iterable[str]) -> list[int]:
+        """Row indexes of the given keys; unknown keys are skipped."""
+        index = self.index
+        return [index[key] for key in gear_keys if key in index]
+
+    def total_bonus(self, gear_keys: Iterable[str]) -> dict[str, float]:
+        """Sums the bonuses of the given gear keys into {'str', 'con', 'int', 'per'}."""
+        totals = self.bonuses[self.rows_for(gear_keys)].sum(axis=0)
+        return dict(zip(GEAR_STAT_KEYS, totals.tolist(), strict=True))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+
+# SECTION: COMPACT CONTENT RECORDS
+# Pets, mounts, eggs, potions, food and backgrounds number in the thousands and are
+# only displayed or counted, so they use small __slots__ records instead of Pydantic
+# models. Repeated identifiers (egg, potion, type, set) are interned.
+
+
+def _as_str(value: Any) -> str:
+    return value if isinstance(value, str) else ""
+
+
+def _as_interned(value: Any) -> str | None:
+    return sys.intern(value) if isinstance(value, str) and value else None
+
+
+_RECORD_CONVERTERS: dict[str, Callable[[Any], Any]] = {"str": _as_str, "interned": _as_interned, "float": _as_float, "bool": bool}
+
+
+# KLASS: ContentRecord
+class ContentRecord:
+    """Base for compact content records built from one raw content dict.
+
+    Subclasses list their extra attributes in `_FIELDS` as (attribute, raw key, kind),
+    where kind is one of 'str', 'interned', 'float' or 'bool'.
+    """
+
+    __slots__ = ("key", "text")
+    _FIELDS: ClassVar[tuple[tuple[str, str, str], ...]] = ()
+
+    def __init__(self, key: str, data: dict[str, Any]) -> None:
+        self.key = sys.intern(key)
+        self.text = _as_str(data.get("text"))
+        for attr, raw_key, kind in self._FIELDS:
+            setattr(self, attr, _RECORD_CONVERTERS[kind](data.get(raw_key)))
+
+    def __repr__(self) -> str:
+        extras = ", ".join(f"{attr}={getattr(self, attr)!r}" for attr, _, _ in self._FIELDS)
+        return f"{self.__class__.__name__}(key={self.key!r}, {extras})"
+
+
+# KLASS: CompanionRecord
+class CompanionRecord(ContentRecord):
+    """A pet or mount (from content.petInfo / content.mountInfo)."""
+
+    __slots__ = ("egg", "potion", "type")
+    _FIELDS = (("egg", "egg", "interned"), ("potion", "potion", "interned"), ("type", "type", "interned"))
+
+
+# KLASS: EggRecord
+class EggRecord(ContentRecord):
+    __slots__ = ("adjective", "value", "notes")
+    _FIELDS = (("adjective", "adjective", "str"), ("value", "value", "float"), ("notes", "notes", "str"))
+
+
+# KLASS: HatchingPotionRecord
+class HatchingPotionRecord(ContentRecord):
+    __slots__ = ("value", "notes", "premium", "limited")
+    _FIELDS = (("value", "value", "float"), ("notes", "notes", "str"), ("premium", "premium", "bool"), ("limited", "limited", "bool"))
+
+
+# KLASS: FoodRecord
+class FoodRecord(ContentRecord):
+    __slots__ = ("value", "target", "can_drop", "notes")
+    _FIELDS = (("value", "value", "float"), ("target", "target", "interned"), ("can_drop", "canDrop", "bool"), ("notes", "notes", "str"))
+
+
+# KLASS: BackgroundRecord
+class BackgroundRecord(ContentRecord):
+    __slots__ = ("price", "set_key", "notes")
+    _FIELDS = (("price", "price", "float"), ("set_key", "set", "interned"), ("notes", "notes", "str"))
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 
 # SECTION: MAIN CONTENT CONTAINER MODEL
 
+ContentItemT = TypeVar("ContentItemT")
+
+
+def _model_factory(model: type[BaseModel]) -> Callable[[str, dict[str, Any]], Any]:
+    """Item factory validating a raw dict into `model`, injecting its key."""
+
+    def build(key: str, data: dict[str, Any]) -> Any:
+        return model.model_validate({**data, "key": key})
+
+    return build
+
+
+# KLASS: LazySection
+class LazySection(Mapping[str, ContentItemT]):
+    """Read-only mapping of content keys to items, built on first access.
+
+    Holds the raw item dicts and only runs the item factory (Pydantic validation
+    or a record constructor) for the keys that are actually requested; results
+    are memoised. Items that fail to build are logged once and then behave as
+    missing keys: they are left out of iteration and `len` from then on. Whether
+    an item is valid is only known once it is built, so `section[key]` may still
+    raise KeyError for a key yielded before its first access. The inherited
+    `keys`/`values`/`items` views stay lazy; `materialize` builds everything.
+    `index_by` groups keys by a raw field without building items.
+    """
+
+    __slots__ = ("name", "factory", "_raw", "_items", "_invalid", "_indexes")
+
+    def __init__(self, name: str, factory: Callable[[str, dict[str, Any]], ContentItemT], raw: dict[str, dict[str, Any]]):
+        self.name = name
+        self.factory = factory
+        self._raw = raw
+        self._items: dict[str, ContentItemT] = {}
+        self._invalid: set[str] = set()
+        self._indexes: dict[str, dict[str, tuple[str, ...]]] = {}
+
+    def __getitem__(self, key: str) -> ContentItemT:
+        item = self._items.get(key)
+        if item is not None:
+            return item
+        if key in self._invalid:
+            raise KeyError(key)
+        data = self._raw[key]  # KeyError for unknown keys
+        try:
+            item = self.factory(key, data)
+        except (ValidationError, ValueError, TypeError) as e:
+            log.warning(f"Validation failed for {self.name} '{key}': {e}")
+            self._invalid.add(key)
+            raise KeyError(key) from e
+        self._items[key] = item
+        return item
+
+    def __iter__(self) -> Iterator[str]:
+        invalid = self._invalid
+        return (key for key in self._raw if key not in invalid)
+
+    def __len__(self) -> int:
+        return len(self._raw) - len(self._invalid)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._raw and key not in self._invalid
+
+    def raw(self, key: str) -> dict[str, Any] | None:
+        """Raw dict of an item without validating it."""
+        return self._raw.get(key)
+
+    def index_by(self, field: str) -> dict[str, tuple[str, ...]]:
+        """Groups item keys by the value of a raw field (e.g. pets by 'egg'). Built once per field."""
+        index = self._indexes.get(field)
+        if index is None:
+            groups: dict[str, list[str]] = {}
+            for key, data in self._raw.items():
+                value = data.get(field)
+                if isinstance(value, str):
+                    groups.setdefault(value, []).append(key)
+            index = {value: tuple(keys) for value, keys in groups.items()}
+            self._indexes[field] = index
+        return index
+
+    def materialize(self) -> dict[str, ContentItemT]:
+        """Validates every item (skipping invalid ones) and returns a plain dict."""
+        for key in self._raw:
+            if key not in self._items and key not in self._invalid:
+                try:
+                    self[key]
+                except KeyError:
+                    pass
+        return dict(self._items)
+
+    @property
+    def materialized_count(self) -> int:
+        """Number of items validated so far."""
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"LazySection({self.name}, items={len(self._raw)}, materialized={len(self._items)})"
+
+
+_GEAR_FACTORY = _model_factory(Gear)
+_QUEST_FACTORY = _model_factory(Quest)
+_SPELL_FACTORY = _model_factory(Spell)
+
+# Record sections: (GameContent field, raw content key, record class)
+RECORD_SECTIONS: tuple[tuple[str, str, type[ContentRecord]], ...] = (
+    ("raw_pets", "petInfo", CompanionRecord),
+    ("raw_mounts", "mountInfo", CompanionRecord),
+    ("raw_eggs", "eggs", EggRecord),
+    ("raw_hatching_potions", "hatchingPotions", HatchingPotionRecord),
+    ("raw_food", "food", FoodRecord),
+    ("raw_backgrounds", "backgroundsFlat", BackgroundRecord),
+)
+
+
+# FUNC: hash_raw_content
+def hash_raw_content(raw_content: dict[str, Any]) -> str:
+    """Computes a stable SHA-256 of a raw '/content' payload, independent of key order."""
+    payload = json.dumps(raw_content, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
 
 # KLASS: GameContent
 class GameContent(BaseModel):
-    """Container for processed static game content."""
+    """Container for static game content, kept as compact raw sections.
+
+    Only the categories pixabit uses are kept from the '/content' payload. Items
+    are validated into `Gear`/`Quest`/`Spell` models on first access through the
+    `gear`, `quests` and `spells` lazy sections.
+    """
 
     model_config = ConfigDict(frozen=True)  # Content is static once loaded
 
-    gear: dict[str, Gear] = Field(default_factory=dict)
-    quests: dict[str, Quest] = Field(default_factory=dict)
-    spells: dict[str, Spell] = Field(default_factory=dict)  # Store all spells flat for easy lookup
-    # Add other categories if needed (e.g., pets, mounts, backgrounds)
-    # pets: dict[str, PetInfo] = Field(default_factory=dict)
-    # mounts: dict[str, MountInfo] = Field(default_factory=dict)
+    raw_gear: dict[str, Any] = Field(default_factory=dict, repr=False, description="content.gear.flat, keyed by gear key.")
+    raw_quests: dict[str, Any] = Field(default_factory=dict, repr=False, description="content.quests, keyed by quest key.")
+    raw_spells: dict[str, Any] = Field(default_factory=dict, repr=False, description="content.spells flattened, with 'klass' injected.")
+    raw_pets: dict[str, Any] = Field(default_factory=dict, repr=False, description="content.petInfo, keyed by 'Egg-Potion'.")
+    raw_mounts: dict[str, Any] = Field(default_factory=dict, repr=False, description="content.mountInfo, keyed by 'Egg-Potion'.")
+    raw_eggs: dict[str, Any] = Field(default_factory=dict, repr=False, description="content.eggs.")
+    raw_hatching_potions: dict[str, Any] = Field(default_factory=dict, repr=False, description="content.hatchingPotions.")
+    raw_food: dict[str, Any] = Field(default_factory=dict, repr=False, description="content.food.")
+    raw_backgrounds: dict[str, Any] = Field(default_factory=dict, repr=False, description="content.backgroundsFlat.")
+    schema_version: int = Field(1, description="CONTENT_SCHEMA_VERSION this cache was built with.")
+    content_hash: str | None = Field(None, description="SHA-256 of the raw payload this model was built from.")
 
     last_fetched_at: datetime | None = Field(None, description="Timestamp when the raw content was last fetched.")
     processed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Timestamp when this processed model was created.")
+    verified_at: datetime | None = Field(None, description="Timestamp when a refetch last confirmed the content unchanged.")
+
+    # Lazy sections and derived lookup tables, built on first use (content is frozen, so they never go stale)
+    _sections: dict[str, LazySection] = PrivateAttr(default_factory=dict)
+    _gear_stat_matrix: np.ndarray | None = PrivateAttr(default=None)
+    _gear_classes: tuple[str | None, ...] = PrivateAttr(default=())
+    _gear_slots: np.ndarray | None = PrivateAttr(default=None)
+    _gear_two_handed: np.ndarray | None = PrivateAttr(default=None)
+    _gear_bonus_tables: dict[str | None, GearBonusTable] = PrivateAttr(default_factory=dict)
+
+    def _section(self, name: str, factory: Callable[[str, dict[str, Any]], ContentItemT], raw: dict[str, Any]) -> LazySection[ContentItemT]:
+        section = self._sections.get(name)
+        if section is None:
+            section = LazySection(name, factory, raw)
+            self._sections[name] = section
+        return section
+
+    @property
+    def gear(self) -> LazySection[Gear]:
+        """Gear items by key, validated on access."""
+        return self._section("gear", _GEAR_FACTORY, self.raw_gear)
+
+    @property
+    def quests(self) -> LazySection[Quest]:
+        """Quests by key, validated on access."""
+        return self._section("quest", _QUEST_FACTORY, self.raw_quests)
+
+    @property
+    def spells(self) -> LazySection[Spell]:
+        """Spells of all classes by key, validated on access."""
+        return self._section("spell", _SPELL_FACTORY, self.raw_spells)
+
+    @property
+    def pets(self) -> LazySection[CompanionRecord]:
+        """Pets by 'Egg-Potion' key; `pets.index_by('egg')` / `('potion')` group them."""
+        return self._section("pet", CompanionRecord, self.raw_pets)
+
+    @property
+    def mounts(self) -> LazySection[CompanionRecord]:
+        """Mounts by 'Egg-Potion' key."""
+        return self._section("mount", CompanionRecord, self.raw_mounts)
+
+    @property
+    def eggs(self) -> LazySection[EggRecord]:
+        return self._section("egg", EggRecord, self.raw_eggs)
+
+    @property
+    def hatching_potions(self) -> LazySection[HatchingPotionRecord]:
+        return self._section("hatching potion", HatchingPotionRecord, self.raw_hatching_potions)
+
+    @property
+    def food(self) -> LazySection[FoodRecord]:
+        """Food by key; `food.index_by('target')` groups it by favourite potion."""
+        return self._section("food", FoodRecord, self.raw_food)
+
+    @property
+    def backgrounds(self) -> LazySection[BackgroundRecord]:
+        """Backgrounds by key; `backgrounds.index_by('set')` groups them by release set."""
+        return self._section("background", BackgroundRecord, self.raw_backgrounds)
+
+    def _build_gear_stat_matrix(self) -> np.ndarray:
+        """Builds the unmultiplied (items, 4) stat matrix in `raw_gear` key order, straight from raw dicts."""
+        items = list(self.raw_gear.values())
+        matrix = np.array(
+            [(_as_float(item.get("str")), _as_float(item.get("con")), _as_float(item.get("int")), _as_float(item.get("per"))) for item in items],
+            dtype=np.float64,
+        ).reshape(len(items), len(GEAR_STAT_KEYS))
+        self._gear_classes = tuple(item.get("specialClass") for item in items)
+        self._gear_slots = np.array([item.get("type") or "" for item in items], dtype=object)
+        self._gear_two_handed = np.fromiter((bool(item.get("twoHanded")) for item in items), dtype=bool, count=len(items))
+        for array in (matrix, self._gear_slots, self._gear_two_handed):
+            array.setflags(write=False)
+        self._gear_stat_matrix = matrix
+        return matrix
+
+    def gear_bonus_table(self, user_class: str | None) -> GearBonusTable:
+        """Gets the gear stat bonus table for a user class, building it on first request.
+
+        Args:
+            user_class: The user's class (e.g. 'warrior'), or None for no class bonus.
+
+        Returns:
+            The GearBonusTable for that class.
+        """
+        table = self._gear_bonus_tables.get(user_class)
+        if table is not None:
+            return table
+
+        base = self._gear_stat_matrix if self._gear_stat_matrix is not None else self._build_gear_stat_matrix()
+        class_match = np.fromiter(
+            (user_class is not None and item_class == user_class for item_class in self._gear_classes),
+            dtype=bool,
+            count=len(self._gear_classes),
+        )
+        bonuses = base * np.where(class_match, CLASS_BONUS_MULTIPLIER, 1.0)[:, None]
+        bonuses.setflags(write=False)
+        keys = tuple(self.raw_gear.keys())
+        table = GearBonusTable(user_class, keys, {key: i for i, key in enumerate(keys)}, bonuses, self._gear_slots, self._gear_two_handed)
+        self._gear_bonus_tables[user_class] = table
+        return table
 
     @classmethod
-    def from_raw_content(cls, raw_content: dict[str, Any], fetched_at: datetime) -> GameContent:
-        """Parses the raw '/content' API response into structured models."""
-        processed_gear: dict[str, Gear] = {}
-        processed_quests: dict[str, Quest] = {}
-        processed_spells: dict[str, Spell] = {}
+    def from_raw_content(cls, raw_content: dict[str, Any], fetched_at: datetime, content_hash: str | None = None) -> GameContent:
+        """Extracts the sections pixabit uses from the raw '/content' API response.
 
-        # --- Process Gear (from gear.flat) ---
+        No item is validated here; see `gear`, `quests` and `spells`.
+
+        Args:
+            raw_content: The '/content' payload.
+            fetched_at: When the payload was fetched.
+            content_hash: Precomputed `hash_raw_content(raw_content)`, computed here if omitted.
+        """
         raw_gear_flat = raw_content.get("gear", {}).get("flat", {})
-        if isinstance(raw_gear_flat, dict):
-            for key, data in raw_gear_flat.items():
-                if not isinstance(data, dict):
-                    continue
-                try:
-                    # Inject key into data dict for validation
-                    data["key"] = key
-                    processed_gear[key] = Gear.model_validate(data)
-                except ValidationError as e:
-                    log.warning(f"Validation failed for gear '{key}': {e}")
-                except Exception as e:
-                    log.exception(f"Unexpected error processing gear '{key}': {e}")
-
-        # --- Process Quests ---
-        raw_quests = raw_content.get("quests", {})
-        if isinstance(raw_quests, dict):
-            for key, data in raw_quests.items():
-                if not isinstance(data, dict):
-                    continue
-                try:
-                    data["key"] = key  # Ensure key is present
-                    processed_quests[key] = Quest.model_validate(data)
-                except ValidationError as e:
-                    log.warning(f"Validation failed for quest '{key}': {e}")
-                except Exception as e:
-                    log.exception(f"Unexpected error processing quest '{key}': {e}")
-
-        # --- Process Spells (flatten all classes into one dict) ---
-        raw_spells = raw_content.get("spells", {})
-        if isinstance(raw_spells, dict):
-            for spell_class, spells_in_class in raw_spells.items():
-                if isinstance(spells_in_class, dict):
-                    for key, data in spells_in_class.items():
-                        if not isinstance(data, dict):
-                            continue
-                        try:
-                            data["key"] = key  # Ensure key is present
-                            data["klass"] = spell_class  # Inject class
-                            processed_spells[key] = Spell.model_validate(data)
-                        except ValidationError as e:
-                            log.warning(f"Validation failed for spell '{key}' (class: {spell_class}): {e}")
-                        except Exception as e:
-                            log.exception(f"Unexpected error processing spell '{key}': {e}")
+        raw_gear = {key: data for key, data in raw_gear_flat.items() if isinstance(data, dict)} if isinstance(raw_gear_flat, dict) else {}
 
-        log.info(f"Processed static content: {len(processed_gear)} gear items, {len(processed_quests)} quests, {len(processed_spells)} spells.")
+        raw_quests_in = raw_content.get("quests", {})
+        raw_quests = {key: data for key, data in raw_quests_in.items() if isinstance(data, dict)} if isinstance(raw_quests_in, dict) else {}
 
-        return cls(gear=processed_gear, quests=processed_quests, spells=processed_spells, last_fetched_at=fetched_at)
+        # Flatten all classes into one dict, remembering the class
+        raw_spells: dict[str, Any] = {}
+        raw_spells_in = raw_content.get("spells", {})
+        if isinstance(raw_spells_in, dict):
+            for spell_class, spells_in_class in raw_spells_in.items():
+                if isinstance(spells_in_class, dict):
+                    for key, data in spells_in_class.items():
+                        if isinstance(data, dict):
+                            raw_spells[key] = {**data, "klass": spell_class}
+
+        # Record sections are plain key -> dict maps in the payload
+        record_sections: dict[str, dict[str, Any]] = {}
+        for field_name, content_key, _ in RECORD_SECTIONS:
+            raw_section = raw_content.get(content_key, {})
+            record_sections[field_name] = {key: data for key, data in raw_section.items() if isinstance(data, dict)} if isinstance(raw_section, dict) else {}
+
+        log.info(
+            f"Indexed static content: {len(raw_gear)} gear items, {len(raw_quests)} quests, {len(raw_spells)} spells, "
+            f"{len(record_sections['raw_pets'])} pets, {len(record_sections['raw_mounts'])} mounts, {len(record_sections['raw_backgrounds'])} backgrounds (built on access)."
+        )
+
+        return cls(
+            raw_gear=raw_gear,
+            raw_quests=raw_quests,
+            raw_spells=raw_spells,
+            **record_sections,
+            schema_version=CONTENT_SCHEMA_VERSION,
+            content_hash=content_hash or hash_raw_content(raw_content),
+            last_fetched_at=fetched_at,
+        )
+
+    def renewed(self, verified_at: datetime) -> GameContent:
+        """Returns a copy marked as re-verified, sharing sections and lookup tables with this one."""
+        return self.model_copy(update={"verified_at": verified_at, "last_fetched_at": verified_at})
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -494,20 +838,24 @@ class StaticContentManager:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def _is_cache_fresh(self, cache_model: GameContent) -> bool:
-        """Check if the processed cache file is still fresh."""
+        """Check if the processed cache is still fresh (built or last verified within the cache duration)."""
         if not cache_model or not cache_model.processed_at:
             return False
-        # Ensure processed_at is timezone-aware for comparison
-        processed_at_aware = cache_model.processed_at
-        if processed_at_aware.tzinfo is None:
-            processed_at_aware = processed_at_aware.replace(tzinfo=timezone.utc)
+        if cache_model.schema_version != CONTENT_SCHEMA_VERSION:
+            return False
+        # Ensure the timestamp is timezone-aware for comparison
+        checked_at = cache_model.verified_at or cache_model.processed_at
+        if checked_at.tzinfo is None:
+            checked_at = checked_at.replace(tzinfo=timezone.utc)
 
-        return (datetime.now(timezone.utc) - processed_at_aware) < self.cache_duration
+        return (datetime.now(timezone.utc) - checked_at) < self.cache_duration
 
     async def load_content(self, force_refresh: bool = False) -> GameContent | None:
         """Loads game content, using cache or fetching from API as needed.
 
-        Handles locking to prevent simultaneous loads.
+        Readers with content already in memory never wait on the lock, so a
+        refresh in progress does not block them; they keep the previous model
+        until the new one is swapped in.
 
         Args:
             force_refresh: If True, bypass all caches and fetch directly from API.
@@ -515,90 +863,121 @@ class StaticContentManager:
         Returns:
             The processed GameContent model, or None if loading fails.
         """
+        # 1. In-memory cache, lock-free (unless forcing refresh)
+        if self._content and not force_refresh:
+            log.debug("Using in-memory static content cache.")
+            return self._content
+
         async with self._lock:  # Acquire lock before proceeding
-            # 1. Check in-memory cache first (unless forcing refresh)
-            if self._content and not force_refresh:
-                # Optional: Re-check freshness even for in-memory? Only needed if long-running process
-                # if self._is_cache_fresh(self._content): # Can add this check if desired
-                log.debug("Using in-memory static content cache.")
+            if self._content and not force_refresh:  # Loaded by another caller while waiting
                 return self._content
 
+            # Baseline to compare a refetch against: what we serve now, else the stale cache
+            baseline = self._content
+
             # 2. Try loading from processed Pydantic model cache (if not forcing refresh)
             if not force_refresh and self.processed_cache_path.exists():
                 log.debug(f"Attempting to load processed content from: {self.processed_cache_path}")
-                cached_model = load_pydantic_model(GameContent, self.processed_cache_path)
+                cached_model = await asyncio.to_thread(load_pydantic_model, GameContent, self.processed_cache_path)
                 if cached_model and self._is_cache_fresh(cached_model):
                     log.info("Using fresh processed static content cache.")
                     self._content = cached_model
                     return self._content
                 elif cached_model:
-                    log.info("Processed static content cache is stale.")
+                    log.info("Processed static content cache is stale; checking the API for changes.")
+                    baseline = baseline or cached_model
                 else:
                     log.warning("Failed to load processed static content cache.")
 
-            # 3. Try loading from raw JSON cache (parse if available)
-            raw_content_data = None
-            raw_fetch_time = None
-            if self.raw_cache_path.exists():
-                log.debug(f"Attempting to load raw content from: {self.raw_cache_path}")
-                raw_content_data = load_json(self.raw_cache_path)
-                if raw_content_data:
-                    # Try to get modification time as fallback fetch time
-                    try:
-                        mtime = self.raw_cache_path.stat().st_mtime
-                        raw_fetch_time = datetime.fromtimestamp(mtime, timezone.utc)
-                        log.info(f"Using raw static content cache (fetched around {raw_fetch_time}). Processing...")
-                    except Exception:
-                        raw_fetch_time = datetime.now(timezone.utc)  # Fallback
-                        log.info("Using raw static content cache (fetch time unknown). Processing...")
-
-                    # Process the raw data loaded from cache
-                    try:
-                        self._content = GameContent.from_raw_content(raw_content_data, raw_fetch_time)
-                        # Save the newly processed data back to processed cache
-                        self.save_processed_content()
-                        return self._content
-                    except Exception as e:
-                        log.exception(f"Error processing raw content from cache: {e}")
-                        self._content = None  # Ensure content is cleared on error
-                else:
-                    log.warning("Failed to load raw static content cache file.")
+            # 3. Raw JSON cache, only when there is no processed cache to compare against
+            if not force_refresh and baseline is None and self.raw_cache_path.exists():
+                content = await self._load_raw_cache()
+                if content:
+                    return content
 
-            # 4. Fetch from API as last resort (or if force_refresh is True)
-            log.info(f"{'Forcing refresh' if force_refresh else 'Fetching new'} static content from Habitica API...")
+            # 4. Fetch from API (stale cache, no cache, or force_refresh)
+            log.info(f"{'Forcing refresh' if force_refresh else 'Fetching'} static content from Habitica API...")
             try:
                 current_time = datetime.now(timezone.utc)
                 fetched_data = await self.api_client.get_content()
+                if not fetched_data:
+                    raise ValueError("Empty '/content' response.")
                 log.success("Successfully fetched raw content from API.")
-
-                # Save the newly fetched raw data
-                save_json(fetched_data, self.raw_cache_path)
-
-                # Process the fetched data
-                self._content = GameContent.from_raw_content(fetched_data, current_time)
-
-                # Save the newly processed data
-                self.save_processed_content()
-                return self._content
+                return await self._apply_fetched_content(fetched_data, current_time, baseline)
 
             except Exception as e:
                 log.exception(f"Failed to fetch or process static content from API: {e}")
-                # If fetch fails, try to return potentially stale in-memory cache if it exists
-                if self._content:
-                    log.warning("API fetch failed. Returning potentially stale in-memory content.")
+                # If fetch fails, fall back to the stale content if there is any
+                if baseline:
+                    log.warning("API fetch failed. Returning potentially stale content.")
+                    self._content = baseline
                     return self._content
                 else:
                     # If absolutely no content could be loaded/fetched
                     log.error("Could not load static content from any source.")
                     return None  # Indicate failure
 
-    def save_processed_content(self) -> None:
-        """Saves the current in-memory _content model to the processed cache file."""
-        if not self._content:
+    async def _load_raw_cache(self) -> GameContent | None:
+        """Processes the raw JSON cache in a worker thread and installs the result."""
+        log.debug(f"Attempting to load raw content from: {self.raw_cache_path}")
+        raw_content_data = await asyncio.to_thread(load_json, self.raw_cache_path)
+        if not raw_content_data:
+            log.warning("Failed to load raw static content cache file.")
+            return None
+
+        # Use the file modification time as the fetch time
+        try:
+            raw_fetch_time = datetime.fromtimestamp(self.raw_cache_path.stat().st_mtime, timezone.utc)
+            log.info(f"Using raw static content cache (fetched around {raw_fetch_time}). Processing...")
+        except OSError:
+            raw_fetch_time = datetime.now(timezone.utc)  # Fallback
+            log.info("Using raw static content cache (fetch time unknown). Processing...")
+
+        try:
+            content = await asyncio.to_thread(GameContent.from_raw_content, raw_content_data, raw_fetch_time)
+        except Exception as e:
+            log.exception(f"Error processing raw content from cache: {e}")
+            return None
+        self._content = content
+        await asyncio.to_thread(self.save_processed_content, content)
+        return content
+
+    async def _apply_fetched_content(self, fetched_data: dict[str, Any], fetched_at: datetime, baseline: GameContent | None) -> GameContent:
+        """Installs freshly fetched content, reprocessing only if the payload changed.
+
+        Hashing, processing and file writes run in worker threads. The new model
+        replaces `_content` in a single assignment, so readers see either the old
+        or the new content, never a partial one.
+
+        Args:
+            fetched_data: The '/content' payload.
+            fetched_at: When it was fetched.
+            baseline: The content currently served or cached, if any.
+
+        Returns:
+            The installed GameContent.
+        """
+        new_hash = await asyncio.to_thread(hash_raw_content, fetched_data)
+        if baseline and baseline.content_hash == new_hash and baseline.schema_version == CONTENT_SCHEMA_VERSION:
+            log.info("Static content unchanged since last fetch; renewing cache timestamp.")
+            content = baseline.renewed(fetched_at)
+        else:
+            log.info("Static content changed; reprocessing.")
+            await asyncio.to_thread(save_json, fetched_data, self.raw_cache_path)
+            content = await asyncio.to_thread(GameContent.from_raw_content, fetched_data, fetched_at, new_hash)
+
+        self._content = content
+        await asyncio.to_thread(self.save_processed_content, content)
+        return content
+
+    def save_processed_content(self, content: GameContent | None = None) -> None:
+        """Saves a GameContent model (default: the in-memory one) to the processed cache file."""
+        content = content or self._content
+        if not content:
             log.warning("No processed content available in memory to save.")
             return
 
-        if save_pydantic_model(self._content, self.processed_cache_path):
+        if save_pydantic_model(content, self.processed_cache_path):
             log.info(f"Saved processed static content to {self.processed_cache_path}")
         else:
             log.error(f"Failed to save processed static content to {self.processed_cache_path}")
@@ -608,45 +987,48 @@ class StaticContentManager:
         return await self.load_content(force_refresh=True)
 
     # --- Accessor Methods ---
-    # These methods ensure content is loaded before returning data
-    # They return the specific dictionaries directly.
+    # These methods ensure content is loaded before returning data.
+    # Sections are LazySection mappings: items are validated on first access.
 
-    async def get_gear(self) -> dict[str, Gear]:
-        """Returns the dictionary of all processed gear items."""
+    @property
+    def content(self) -> GameContent | None:
+        """The loaded content, without triggering a load."""
+        return self._content
+
+    async def get_gear(self) -> Mapping[str, Gear]:
+        """Returns the lazily validated gear section."""
         content = await self.load_content()
         return content.gear if content else {}
 
     async def get_gear_item(self, key: str) -> Gear | None:
-        """Gets a specific gear item by key."""
-        gear_dict = await self.get_gear()
-        return gear_dict.get(key)
+        """Gets a specific gear item by key (validates only that item)."""
+        gear_section = await self.get_gear()
+        return gear_section.get(key)
 
-    async def get_quests(self) -> dict[str, Quest]:
-        """Returns the dictionary of all processed quest items."""
+    async def get_quests(self) -> Mapping[str, Quest]:
+        """Returns the lazily validated quest section."""
         content = await self.load_content()
         return content.quests if content else {}
 
     async def get_quest(self, key: str) -> Quest | None:
-        """Gets a specific quest by key."""
-        quest_dict = await self.get_quests()
-        return quest_dict.get(key)
+        """Gets a specific quest by key (validates only that quest)."""
+        quest_section = await self.get_quests()
+        return quest_section.get(key)
 
-    async def get_spells(self) -> dict[str, Spell]:
-        """Returns the dictionary of all processed spell items."""
+    async def get_spells(self) -> Mapping[str, Spell]:
+        """Returns the lazily validated spell section."""
         content = await self.load_content()
         return content.spells if content else {}
 
     async def get_spell(self, key: str) -> Spell | None:
-        """Gets a specific spell by key."""
-        spell_dict = await self.get_spells()
-        return spell_dict.get(key)
+        """Gets a specific spell by key (validates only that spell)."""
+        spell_section = await self.get_spells()
+        return spell_section.get(key)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 
 # SECTION: MAIN EXECUTION (Example/Test)
-import asyncio  # Needed for running async main
-
 
 async def main():
     """Demo function to initialize and use the StaticContentManager."""
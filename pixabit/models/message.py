@@ -12,57 +12,95 @@ Includes:
 - `Message`: Represents an individual message entity with improved parsing.
 - `MessageList`: A Pydantic `BaseModel` container class to manage a collection
   of Message objects, providing context-aware processing (like conversation IDs),
-  sorting, and filtering.
+  sorting, and filtering. New messages are merged incrementally (`add_messages`):
+  deduplicated by ID, inserted in timestamp order, and indexed by conversation
+  with per-conversation unread counters.
 """
 
 # SECTION: IMPORTS
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
+from bisect import insort
 from datetime import datetime, timezone
-from typing import Any, Iterator  # Use standard lowercase etc.
+from typing import Any, Iterable, Iterator  # Use standard lowercase etc.
 
 # External Libs
-import emoji_data_python
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
     FieldValidationInfo,
+    PrivateAttr,
     ValidationError,
     ValidationInfo,  # For context access
     field_validator,
     model_validator,
 )
 
+from pixabit.helpers._emoji import replace_emoji_colons
+
 # Local Imports
 try:
     from pixabit.config import USER_ID  # Import the actual user ID from config
+    from pixabit.helpers._date import parse_utc_datetime
     from pixabit.helpers._logger import log
-    from pixabit.helpers.DateTimeHandler import DateTimeHandler
 except ImportError:
     log = logging.getLogger(__name__)
     log.addHandler(logging.NullHandler())
     USER_ID = "fallback_user_id_from_config"  # Fallback if config not found
 
-    class DateTimeHandler:
-        def __init__(self, timestamp: Any):
-            self._ts = timestamp
-
-        @property
-        def utc_datetime(self) -> datetime | None:
-            try:
-                return datetime.fromisoformat(str(self._ts).replace("Z", "+00:00"))
-            except:
-                return None
+    def parse_utc_datetime(value: Any) -> datetime | None:
+        try:
+            return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except:
+            return None
 
     log.warning("message.py: Could not import config/helpers. Using fallbacks.")
 
 
+# SECTION: CONSTANTS
+OLDEST_TIMESTAMP = datetime.min.replace(tzinfo=timezone.utc)  # Sort key for messages without a timestamp
+
+
 # SECTION: HELPER FUNCTIONS
 
 
+# FUNC: message_sort_key
+def message_sort_key(message: Message) -> datetime:
+    """Chronological sort key; messages without a timestamp sort first."""
+    return message.timestamp or OLDEST_TIMESTAMP
+
+
+# FUNC: resolve_current_user_id
+def resolve_current_user_id(context: Any) -> str | None:
+    """Gets 'current_user_id' from a validation context, falling back to the configured USER_ID."""
+    current_user_id: str | None = None
+    if context and isinstance(context, dict):
+        current_user_id = context.get("current_user_id")
+    if current_user_id is None:
+        current_user_id = USER_ID
+        if not current_user_id or current_user_id == "fallback_user_id_from_config":  # Check if it's a real ID
+            return None
+    return current_user_id
+
+
+# FUNC: apply_message_context
+def apply_message_context(msg: Message, current_user_id: str | None) -> Message:
+    """Sets the context-dependent fields (sent_by_me, conversation_id, is_pm) on a message."""
+    if current_user_id:
+        # Explicit check against sender ID is primary; the raw 'sent' flag is less reliable
+        msg.sent_by_me = msg.sender_id == current_user_id
+        msg.conversation_id = determine_conversation_id(msg, current_user_id)
+    else:
+        # Cannot reliably determine these without user context
+        msg.sent_by_me = None
+        msg.conversation_id = msg.group_id or ("system" if msg.is_system_message else None)  # Fallback
+    # Can still guess PM structure without context
+    msg.is_pm = not msg.group_id and not msg.is_system_message
+    return msg
+
+
 # FUNC: determine_conversation_id
 def determine_conversation_id(message: Message, current_user_id: str | None) -> str | None:
     """Calculates conversation ID based on processed Message object and current user context.
@@ -259,7 +297,7 @@ class Message(BaseModel):
     def parse_text_fields(cls, value: Any, info: FieldValidationInfo) -> str | None:
         """Parses text fields: replaces emoji, strips whitespace. Handles None for optional."""
         if isinstance(value, str):
-            parsed = emoji_data_python.replace_colons(value).strip()
+            parsed = replace_emoji_colons(value).strip()
             # Defaulting behavior handled by Field(default=...)
             return parsed if parsed else None  # Return None if strip results in empty for optional fields
         # Allow None for optional fields like unformatted_text, sender_username, sender_display_name
@@ -268,11 +306,11 @@ class Message(BaseModel):
     @field_validator("timestamp", mode="before")
     @classmethod
     def parse_timestamp_utc(cls, value: Any) -> datetime | None:
-        """Parses timestamp using DateTimeHandler."""
-        handler = DateTimeHandler(timestamp=value)
-        if value is not None and handler.utc_datetime is None:
+        """Parses timestamp using the cached UTC parser."""
+        parsed = parse_utc_datetime(value)
+        if value is not None and parsed is None:
             log.warning(f"Could not parse timestamp for message field: {value!r}")
-        return handler.utc_datetime
+        return parsed
 
     @field_validator("flag_count", mode="before")
     @classmethod
@@ -323,6 +361,11 @@ class MessageList(BaseModel):
 
     Handles validation, context-dependent field calculation (sent_by_me,
     conversation_id, is_pm), sorting, and provides filtering methods.
+
+    `messages` is kept in chronological order. Messages merged later with
+    `add_messages` are deduplicated by ID and inserted in place, and the
+    ID and conversation indexes and unread counters are updated for the new
+    messages only. Messages present at construction count as read.
     """
 
     model_config = ConfigDict(
@@ -333,7 +376,11 @@ class MessageList(BaseModel):
     # The main data field: list of validated Message objects
     messages: list[Message] = Field(default_factory=list, description="Validated list of Message objects.")
 
-    # Add context field directly? No, use ValidationInfo during validation.
+    _current_user_id: str | None = PrivateAttr(default=None)
+    _by_id: dict[str, Message] = PrivateAttr(default_factory=dict)
+    _by_conversation: dict[str, list[Message]] = PrivateAttr(default_factory=dict)  # Each list chronological
+    _last_read: dict[str, datetime] = PrivateAttr(default_factory=dict)
+    _unread: dict[str, int] = PrivateAttr(default_factory=dict)
 
     @model_validator(mode="before")
     @classmethod
@@ -343,20 +390,9 @@ class MessageList(BaseModel):
         Expects 'current_user_id' in validation context (`info.context`).
         Expects input `data` to be the raw list of message dicts.
         """
-        # --- Get Context ---
-        # Fetch current_user_id from the validation context passed during instantiation.
-        # Use the globally imported USER_ID as a fallback if context is missing (e.g., during tests).
-        current_user_id: str | None = None
-        if info.context and isinstance(info.context, dict):
-            current_user_id = info.context.get("current_user_id")
-
-        # If still None, maybe use the global USER_ID (consider implications)
+        current_user_id = resolve_current_user_id(info.context)
         if current_user_id is None:
-            # Use the one imported from config as a last resort, might not be right context always
-            current_user_id = USER_ID  # Requires USER_ID to be imported from pixabit.config
-            if not current_user_id or current_user_id == "fallback_user_id_from_config":  # Check if it's a real ID
-                log.warning("'current_user_id' not found in context or config. Derived message fields (sent_by_me, conversation_id) may be inaccurate.")
-                current_user_id = None  # Explicitly set to None if unusable
+            log.warning("'current_user_id' not found in context or config. Derived message fields (sent_by_me, conversation_id) may be inaccurate.")
 
         # --- Process Input ---
         # This validator receives the *entire* input intended for the model.
@@ -379,67 +415,136 @@ class MessageList(BaseModel):
                 line_errors=[{"loc": (), "input": data, "type": "list_or_dict_expected"}],
             )
 
-        # --- Validate, Enrich, and Collect Messages ---
+        processed_messages = cls._validate_messages(raw_message_list, current_user_id)
+
+        # Sort messages by timestamp (most recent last)
+        processed_messages.sort(key=message_sort_key)
+        log.debug(f"Processed and sorted {len(processed_messages)} messages.")
+
+        # --- Return Structured Data for Model ---
+        return {"messages": processed_messages}
+
+    @staticmethod
+    def _validate_messages(items: Iterable[Any], current_user_id: str | None, known_ids: Iterable[str] = ()) -> list[Message]:
+        """Validates and enriches raw message dicts, skipping duplicates and IDs in `known_ids`.
+
+        Message instances pass through unchanged (their derived fields are kept).
+        """
+        seen = set(known_ids)
         processed_messages: list[Message] = []
-        validation_errors = []
+        error_count = 0
 
-        for index, item in enumerate(raw_message_list):
+        for index, item in enumerate(items):
+            if isinstance(item, Message):
+                if item.id not in seen:
+                    seen.add(item.id)
+                    processed_messages.append(item)
+                continue
             if not isinstance(item, dict):
                 log.warning(f"Skipping non-dict item at index {index} in message list.")
-                validation_errors.append(f"Item at index {index} is not a dictionary.")
+                error_count += 1
                 continue
 
-            try:
-                # 1. Validate raw dict into Message model
-                msg = Message.model_validate(item)
-
-                # 2. Calculate context-dependent fields if user_id is known
-                if current_user_id:
-                    # Determine if sent by current user
-                    # Explicit check against sender ID is primary.
-                    # The old 'sent' flag from raw data is less reliable.
-                    msg.sent_by_me = msg.sender_id == current_user_id
-                    # Check if recipient is me when sent by someone else
-                    # sent_to_me = not msg.sent_by_me and msg.recipient_id == current_user_id
-
-                    # Determine conversation ID using the helper function
-                    msg.conversation_id = determine_conversation_id(msg, current_user_id)
-
-                    # Determine if PM (no group_id and not system message)
-                    msg.is_pm = not msg.group_id and not msg.is_system_message
-                else:
-                    # Cannot reliably determine these without user context
-                    msg.sent_by_me = None
-                    msg.conversation_id = msg.group_id or ("system" if msg.is_system_message else None)  # Fallback
-                    msg.is_pm = not msg.group_id and not msg.is_system_message  # Can still guess PM structure
+            # Skip known messages before paying for validation
+            item_id = item.get("id", item.get("_id", f"index_{index}"))
+            if item_id in seen:
+                continue
 
+            try:
+                msg = apply_message_context(Message.model_validate(item), current_user_id)
+                seen.add(msg.id)
                 processed_messages.append(msg)
-
             except ValidationError as e:
-                item_id = item.get("id", item.get("_id", f"index_{index}"))
                 log.error(f"Validation failed for message ID '{item_id}': {e}")
-                # Collect detailed errors if needed
-                validation_errors.extend(e.errors(include_input=False))  # Pydantic v2 way
+                error_count += 1
             except Exception as e:
-                item_id = item.get("id", item.get("_id", f"index_{index}"))
                 log.exception(f"Unexpected error processing message ID '{item_id}': {e}")
-                validation_errors.append(f"Unexpected error processing message {item_id}")
-
-        if validation_errors:
-            # Decide how to handle errors: log, raise summary error, or continue
-            # For robustness, log and continue is often preferred for lists.
-            log.warning(f"Encountered {len(validation_errors)} errors during message list processing.")
-            # Example: raise ValidationError.from_exception_data(...) if strictness needed
-
-        # 3. Sort messages by timestamp (most recent last)
-        # Use a safe default time for messages lacking a timestamp
-        default_time = datetime.min.replace(tzinfo=timezone.utc)
-        processed_messages.sort(key=lambda m: m.timestamp or default_time)
-        log.debug(f"Processed and sorted {len(processed_messages)} messages.")
+                error_count += 1
 
-        # --- Return Structured Data for Model ---
-        # Pydantic expects the validator to return a dictionary matching the model fields
-        return {"messages": processed_messages}
+        if error_count:
+            # For robustness, log and continue
+            log.warning(f"Encountered {error_count} errors during message list processing.")
+        return processed_messages
+
+    def model_post_init(self, __context: Any) -> None:
+        """Builds the ID and conversation indexes; existing messages count as read."""
+        self._current_user_id = resolve_current_user_id(__context)
+        for msg in self.messages:
+            self._by_id[msg.id] = msg
+            if msg.conversation_id:
+                self._by_conversation.setdefault(msg.conversation_id, []).append(msg)
+        for conversation_id, conversation in self._by_conversation.items():
+            self._last_read[conversation_id] = message_sort_key(conversation[-1])
+
+    # --- Incremental Updates ---
+
+    def add_messages(self, items: Iterable[dict[str, Any] | Message]) -> list[Message]:
+        """Merges raw or validated messages, ignoring IDs already present.
+
+        Only new messages are validated. Each is inserted at its chronological
+        position and added to its conversation; messages from others newer than
+        the conversation's read mark increment its unread counter.
+
+        Args:
+            items: Raw message dicts (as returned by the API) or Message objects.
+
+        Returns:
+            The newly added messages, oldest first.
+        """
+        new_messages = self._validate_messages(items, self._current_user_id, known_ids=self._by_id.keys())
+        new_messages.sort(key=message_sort_key)
+        for msg in new_messages:
+            self._by_id[msg.id] = msg
+            # Appending is the common case (newer than everything held)
+            if not self.messages or message_sort_key(msg) >= message_sort_key(self.messages[-1]):
+                self.messages.append(msg)
+            else:
+                insort(self.messages, msg, key=message_sort_key)
+            conversation_id = msg.conversation_id
+            if not conversation_id:
+                continue
+            conversation = self._by_conversation.setdefault(conversation_id, [])
+            if not conversation or message_sort_key(msg) >= message_sort_key(conversation[-1]):
+                conversation.append(msg)
+            else:
+                insort(conversation, msg, key=message_sort_key)
+            last_read = self._last_read.get(conversation_id)
+            if not msg.sent_by_me and (last_read is None or message_sort_key(msg) > last_read):
+                self._unread[conversation_id] = self._unread.get(conversation_id, 0) + 1
+        if new_messages:
+            log.debug(f"Merged {len(new_messages)} new messages ({len(self.messages)} total).")
+        return new_messages
+
+    @property
+    def newest(self) -> Message | None:
+        """The most recent message, or None if empty."""
+        return self.messages[-1] if self.messages else None
+
+    def newest_in_conversation(self, conversation_id: str) -> Message | None:
+        """The most recent message of a conversation, or None."""
+        conversation = self._by_conversation.get(conversation_id)
+        return conversation[-1] if conversation else None
+
+    # --- Unread Counters ---
+
+    def unread_count(self, conversation_id: str | None = None) -> int:
+        """Unread messages in one conversation, or in all conversations if None."""
+        if conversation_id is None:
+            return sum(self._unread.values())
+        return self._unread.get(conversation_id, 0)
+
+    def unread_counts(self) -> dict[str, int]:
+        """Unread counters of conversations with unread messages."""
+        return {conversation_id: count for conversation_id, count in self._unread.items() if count}
+
+    def mark_read(self, conversation_id: str | None = None) -> None:
+        """Marks one conversation (or all, if None) as read up to its newest message."""
+        conversation_ids = [conversation_id] if conversation_id is not None else list(self._by_conversation)
+        for cid in conversation_ids:
+            newest = self.newest_in_conversation(cid)
+            if newest is not None:
+                self._last_read[cid] = message_sort_key(newest)
+            self._unread.pop(cid, None)
 
     # --- Access and Filtering Methods ---
     # Operate on the validated `self.messages` list
@@ -457,9 +562,12 @@ class MessageList(BaseModel):
         # Slicing works inherently
         return self.messages[index]
 
+    def __contains__(self, message_id: object) -> bool:
+        return message_id in self._by_id
+
     def get_by_id(self, message_id: str) -> Message | None:
         """Finds a message by its unique ID."""
-        return next((m for m in self.messages if m.id == message_id), None)
+        return self._by_id.get(message_id)
 
     def filter_by_sender(self, sender_id_or_name: str, case_sensitive: bool = False) -> MessageList:
         """Returns messages sent by a specific user ID or username. Returns new MessageList."""
@@ -476,9 +584,8 @@ class MessageList(BaseModel):
 
     def filter_by_conversation(self, conversation_id: str) -> MessageList:
         """Returns messages belonging to a specific conversation ID (group or PM partner). Returns new MessageList."""
-        # Uses the derived conversation_id field
-        filtered = [m for m in self.messages if m.conversation_id == conversation_id]
-        return MessageList(messages=filtered)
+        # Served from the conversation index
+        return MessageList(messages=list(self._by_conversation.get(conversation_id, [])))
 
     def filter_by_group(self, group_id: str) -> MessageList:
         """Returns messages belonging to a specific group ID. Returns new MessageList."""
@@ -510,24 +617,8 @@ class MessageList(BaseModel):
             of Message objects belonging to that conversation, sorted chronologically.
             Conversations themselves are ordered by the timestamp of the latest message.
         """
-        grouped = defaultdict(list)
-        valid_conv_ids = set()
-        for msg in self.messages:
-            # Group only messages that have a valid conversation_id
-            if msg.conversation_id:
-                grouped[msg.conversation_id].append(msg)
-                valid_conv_ids.add(msg.conversation_id)  # Keep track of keys added
-
-        # Sort by most recent activity (using timestamp of the last message in each group)
-        default_time = datetime.min.replace(tzinfo=timezone.utc)
-        sorted_ids = sorted(
-            valid_conv_ids,  # Sort only the keys we actually added to grouped dict
-            key=lambda cid: grouped[cid][-1].timestamp or default_time,
-            reverse=True,  # Most recent conversations first
-        )
-
-        # Return ordered dictionary
-        return {cid: grouped[cid] for cid in sorted_ids}
+        sorted_ids = sorted(self._by_conversation, key=lambda cid: message_sort_key(self._by_conversation[cid][-1]), reverse=True)
+        return {cid: list(self._by_conversation[cid]) for cid in sorted_ids if self._by_conversation[cid]}
 
     def __repr__(self) -> str:
         """Simple representation."""
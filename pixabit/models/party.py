@@ -19,7 +19,6 @@ from pathlib import Path
 from typing import Any, Iterator  # Use standard lowercase etc.
 
 # External Libs
-import emoji_data_python
 from pydantic import (
     BaseModel,
     ConfigDict,
@@ -32,13 +31,15 @@ from pydantic import (
     model_validator,
 )
 
+from pixabit.helpers._emoji import replace_emoji_colons
+
 # Local Imports
 try:
     from pixabit.api.client import HabiticaClient
     from pixabit.config import HABITICA_DATA_PATH, USER_ID  # Import USER_ID
+    from pixabit.helpers._date import parse_utc_datetime
     from pixabit.helpers._json import load_pydantic_model, save_json, save_pydantic_model
     from pixabit.helpers._logger import log
-    from pixabit.helpers.DateTimeHandler import DateTimeHandler
 
     from .game_content import Quest as StaticQuestData  # Rename to avoid clash
     from .game_content import StaticContentManager
@@ -174,8 +175,7 @@ class QuestInfo(BaseModel):
     def completed_timestamp(self) -> datetime | None:
         """Parses completed_status into a datetime if possible."""
         if self.completed_status:
-            handler = DateTimeHandler(timestamp=self.completed_status)
-            return handler.utc_datetime  # Returns None if parsing fails
+            return parse_utc_datetime(self.completed_status)  # Returns None if parsing fails
         return None
 
     @property
@@ -254,8 +254,8 @@ class Party(BaseModel):
     # --- Chat ---
     # Use the MessageList Pydantic model. Validation will happen here.
     # Context (`current_user_id`) is needed for MessageList validation.
-    # Exclude from default serialization unless explicitly included.
-    chat: MessageList | None = Field(None, description="Party chat messages.")
+    # Excluded from serialization: the full history is persisted by MessageSync.
+    chat: MessageList | None = Field(None, exclude=True, description="Party chat messages.")
 
     # --- Sorting Info ---
     # order: str | None = Field(None, description="Field used for sorting members.") # Less commonly used?
@@ -314,7 +314,7 @@ class Party(BaseModel):
         """Parses text fields, replaces emoji, handles defaults."""
         default = "Unnamed Party" if info.field_name == "name" else ""
         if isinstance(value, str):
-            parsed = emoji_data_python.replace_colons(value).strip()
+            parsed = replace_emoji_colons(value).strip()
             return parsed if parsed else default
         return default
 
@@ -332,12 +332,27 @@ class Party(BaseModel):
     # --- Methods ---
 
     @classmethod
-    def create_from_raw_data(cls, raw_data: dict, current_user_id: str | None = None) -> Party:
-        """Factory method to create Party, passing context for chat validation."""
+    def create_from_raw_data(cls, raw_data: dict, current_user_id: str | None = None, chat_history: MessageList | None = None) -> Party:
+        """Factory method to create Party, passing context for chat validation.
+
+        Args:
+            raw_data: Raw '/groups/party' data.
+            current_user_id: The viewing user's ID (chat validation context).
+            chat_history: Existing chat history to merge the raw chat into. Only
+                messages it does not hold yet are validated, and it becomes `chat`.
+        """
         if not isinstance(raw_data, dict):
             log.error(f"Invalid raw data type for Party creation: Expected dict, got {type(raw_data)}")
             raise TypeError("Invalid input data for Party creation.")
 
+        if chat_history is not None:
+            raw_chat = raw_data.get("chat")
+            party_instance = cls.create_from_raw_data({key: value for key, value in raw_data.items() if key != "chat"}, current_user_id)
+            if isinstance(raw_chat, list):
+                chat_history.add_messages(raw_chat)
+            party_instance.chat = chat_history
+            return party_instance
+
         # Define the context required by MessageList validation
         validation_context = {"current_user_id": current_user_id}
 
@@ -14,7 +14,6 @@ import json
 from pathlib import Path
 from typing import Any, Iterator  # Changed List -> list etc below
 
-import emoji_data_python
 from pydantic import (
     BaseModel,
     ConfigDict,
@@ -25,6 +24,7 @@ from pydantic import (
 )
 
 from pixabit.api.client import HabiticaClient
+from pixabit.helpers._emoji import replace_emoji_colons
 from pixabit.helpers._json import load_json, save_json, save_pydantic_model
 
 # Local Imports (assuming helpers and api are accessible)
@@ -74,7 +74,7 @@ class Tag(BaseModel):
     def parse_name_emoji(cls, value: Any) -> str:
         """Parses tag name and replaces emoji shortcodes."""
         if isinstance(value, str):
-            parsed = emoji_data_python.replace_colons(value)
+            parsed = replace_emoji_colons(value)
             # Optional: Strip leading/trailing whitespace
             return parsed.strip()
         log.debug(f"Received non-string value for tag name: {value!r}. Using empty string.")
@@ -187,16 +187,18 @@ class TagList(BaseModel):
             self.update_tag_positions()  # Recalculate positions after remove
         return removed
 
-    def update_tag(self, tag_id: str, update_data: dict[str, Any]) -> bool:
-        """Update a tag by ID. Returns True if updated."""
+    def update_tag(self, tag_id: str, update_data: dict[str, Any]) -> Tag | None:
+        """Update a tag in place by ID (unknown keys ignored). Returns the tag, or None on failure."""
         tag = self.get_by_id(tag_id)
+        if not tag:
+            log.warning(f"Tag ID {tag_id[:8]} not found for editing")
+            return None
         try:
-            updated_tag = tag.model_validate(update_data, update=True)
-            if not updated_tag:
-                log.warning(f"Failed to process metadata for edited tag {tag_id[:8]}")
-            log.info(f"Edited task: {tag_id[:8]})")
-
-            return updated_tag
+            for key, value in update_data.items():
+                if key in Tag.model_fields and key not in ("id", "position"):
+                    setattr(tag, key, value)
+            log.info(f"Edited tag: {tag_id[:8]}")
+            return tag
 
         except ValidationError as e:
             log.error(f"Validation error editing tag {tag_id[:8]}: {e}")
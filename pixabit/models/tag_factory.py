@@ -23,7 +23,6 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any, ClassVar, Iterator, Literal  # Use standard lowercase list etc below
 
-import emoji_data_python
 import tomllib  # Python 3.11+, use tomli library for < 3.11
 
 # --- Third-Party Library Imports ---
@@ -38,6 +37,7 @@ from pydantic import (
 )
 
 from pixabit.api.client import HabiticaClient
+from pixabit.helpers._emoji import replace_emoji_colons
 from pixabit.helpers._json import load_json, save_json, save_pydantic_model
 
 # Local Imports (assuming helpers and api are accessible)
@@ -155,7 +155,7 @@ class BaseTag(BaseModel):
     def parse_name_emoji(cls, value: Any) -> str:
         """Parses tag name, replaces emoji shortcodes, strips whitespace."""
         if isinstance(value, str):
-            parsed = emoji_data_python.replace_colons(value)
+            parsed = replace_emoji_colons(value)
             return parsed.strip()
         log.debug(f"Received non-string for tag name: {value!r}. Using empty string.")
         return ""
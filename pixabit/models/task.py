@@ -17,20 +17,20 @@ from __future__ import annotations
 
 import json
 import logging
-import math
 import uuid
 from collections import defaultdict
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, ClassVar, Iterator, Literal
+from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Iterable, Iterator, Literal
 
-import emoji_data_python
+import numpy as np
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
     PrivateAttr,
+    TypeAdapter,
     ValidationError,
     ValidationInfo,
     computed_field,
@@ -41,21 +41,57 @@ from pydantic_core import PydanticCustomError
 
 from pixabit.api.client import HabiticaClient
 from pixabit.config import HABITICA_DATA_PATH
+from pixabit.helpers._damage import DamageForecast, forecast_daily_damage
+from pixabit.helpers._date import parse_utc_datetime
+from pixabit.helpers._emoji import replace_emoji_colons
+from pixabit.helpers._fts import DEFAULT_LIMIT, HIGHLIGHT, FtsIndex, SearchHit
 from pixabit.helpers._json import save_json
 from pixabit.helpers._logger import log
 from pixabit.helpers._md_to_rich import MarkdownRenderer
 from pixabit.helpers._rich import Text
-from pixabit.helpers.DateTimeHandler import DateTimeHandler
 
 if TYPE_CHECKING:
     from .game_content import Quest as StaticQuestData
     from .game_content import StaticContentManager
+    from .party import Party
     from .tag import TagList
     from .user import User
 
 md_renderer = MarkdownRenderer()
 
 
+# SECTION: DAMAGE CONTEXT
+
+
+# FUNC: active_boss_strength
+def active_boss_strength(party_info: Any) -> float:
+    """Get the strength of the boss in an active, ongoing quest, or 0.0 if there is none."""
+    quest = getattr(party_info, "quest", None)
+    if not quest or not getattr(quest, "is_active_and_ongoing", False):
+        return 0.0
+    static_quest = getattr(party_info, "static_quest_details", None)
+    if static_quest and getattr(static_quest, "is_boss_quest", False) and static_quest.boss:
+        return max(0.0, static_quest.boss.strength)
+    return 0.0
+
+
+# FUNC: damage_context
+def damage_context(user: User | None, party: Party | None = None) -> tuple[float, float] | None:
+    """Get (effective CON, boss strength) for damage forecasts.
+
+    Returns None when dailies deal no damage at cron (no user, resting in the
+    Inn, stealth active) or effective stats have not been calculated yet.
+    """
+    if not user or getattr(user, "is_sleeping", True) or getattr(user, "stealth", 0) > 0:
+        return None
+    eff_stats = getattr(user, "effective_stats", {})
+    if not eff_stats:
+        log.warning("Cannot calculate damage: No effective stats for user")
+        return None
+    party_info = party if party is not None else getattr(user, "party", None)
+    return eff_stats.get("con", 0.0), active_boss_strength(party_info)
+
+
 # SECTION: NESTED DATA MODELS
 
 
@@ -83,7 +119,7 @@ class ChecklistItem(BaseModel):
     @classmethod
     def parse_text_emoji(cls, value: Any) -> str:
         if isinstance(value, str):
-            return emoji_data_python.replace_colons(value).strip()
+            return replace_emoji_colons(value).strip()
         return ""
 
     def __repr__(self) -> str:
@@ -112,7 +148,7 @@ class ChallengeLinkData(BaseModel):
     @classmethod
     def parse_name_emoji(cls, value: Any) -> str | None:
         if isinstance(value, str):
-            return emoji_data_python.replace_colons(value).strip()
+            return replace_emoji_colons(value).strip()
         return None
 
     @model_validator(mode="before")
@@ -149,6 +185,29 @@ class ChallengeLinkData(BaseModel):
         return f"ChallengeLinkData(challenge_id={chid}{name}{status})"
 
 
+# KLASS: TaskHistoryEntry
+class TaskHistoryEntry(BaseModel):
+    """One entry of a habit's or daily's `history` (a score, or a daily's cron result)."""
+
+    model_config = ConfigDict(extra="ignore", populate_by_name=True, frozen=True)
+    date: datetime | None = None  # Entries without a parseable date are dropped by the owning task
+    value: float = 0.0
+    is_due: bool | None = Field(None, alias="isDue")  # Dailies
+    completed: bool | None = None  # Dailies
+    scored_up: int | None = Field(None, alias="scoredUp")  # Habits
+    scored_down: int | None = Field(None, alias="scoredDown")  # Habits
+
+    @field_validator("date", mode="before")
+    @classmethod
+    def parse_date_utc(cls, value: Any) -> datetime | None:
+        return parse_utc_datetime(value)
+
+    @staticmethod
+    def dated(entries: list[TaskHistoryEntry]) -> list[TaskHistoryEntry]:
+        """Keeps entries with a date, oldest first."""
+        return sorted((entry for entry in entries if entry.date is not None), key=lambda entry: entry.date)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 
 
@@ -217,7 +276,7 @@ class Task(BaseModel):
         if value is None or (isinstance(value, str) and not value.strip()):
             return default
         if isinstance(value, str):
-            return emoji_data_python.replace_colons(value).strip()
+            return replace_emoji_colons(value).strip()
         log.warning(f"Field '{info.field_name}': Expected string, got {type(value).__name__}")
         return default
 
@@ -226,10 +285,10 @@ class Task(BaseModel):
     def parse_datetime_utc(cls, value: Any) -> datetime | None:
         if isinstance(value, str) and not value.strip():
             return None
-        handler = DateTimeHandler(timestamp=value)
-        if value is not None and handler.utc_datetime is None and value != "":
+        parsed = parse_utc_datetime(value)
+        if value is not None and parsed is None and value != "":
             log.warning(f"Could not parse timestamp: {value!r}")
-        return handler.utc_datetime
+        return parsed
 
     @field_validator("value", "priority", mode="before")
     @classmethod
@@ -366,6 +425,7 @@ class Habit(Task):
     counter_up: int = Field(0, alias="counterUp")
     counter_down: int = Field(0, alias="counterDown")
     frequency: str = "daily"  # 'daily', 'weekly', 'monthly'
+    history: list[TaskHistoryEntry] = Field(default_factory=list)
 
     @field_validator("counter_up", "counter_down", mode="before")
     @classmethod
@@ -377,6 +437,11 @@ class Habit(Task):
         except (ValueError, TypeError):
             return 0
 
+    @field_validator("history", mode="after")
+    @classmethod
+    def drop_undated_history(cls, value: list[TaskHistoryEntry]) -> list[TaskHistoryEntry]:
+        return TaskHistoryEntry.dated(value)
+
     def update_calculated_status(self):
         if self.up and self.down:
             self.calculated_status = "good_bad"
@@ -414,6 +479,7 @@ class Daily(Task):
     days_of_month: list[int] = Field(default_factory=list, alias="daysOfMonth")
     weeks_of_month: list[int] = Field(default_factory=list, alias="weeksOfMonth")
     start_date: datetime | None = Field(None, alias="startDate")
+    history: list[TaskHistoryEntry] = Field(default_factory=list)
     _calculated_user_damage: float | None = PrivateAttr(default=None)
     _calculated_party_damage: float | None = PrivateAttr(default=None)
 
@@ -430,8 +496,12 @@ class Daily(Task):
     @field_validator("start_date", mode="before")
     @classmethod
     def parse_start_date_utc(cls, value: Any) -> datetime | None:
-        handler = DateTimeHandler(timestamp=value)
-        return handler.utc_datetime
+        return parse_utc_datetime(value)
+
+    @field_validator("history", mode="after")
+    @classmethod
+    def drop_undated_history(cls, value: list[TaskHistoryEntry]) -> list[TaskHistoryEntry]:
+        return TaskHistoryEntry.dated(value)
 
     def update_calculated_status(self):
         if self.completed:
@@ -453,69 +523,39 @@ class Daily(Task):
         """Potential damage to party/boss if missed."""
         return self._calculated_party_damage
 
-    def calculate_and_store_damage(self, user: User, static_content: StaticContentManager | None = None) -> None:
+    @property
+    def is_pending(self) -> bool:
+        """Due today and not completed, i.e. deals damage at the next cron."""
+        return self.is_due and not self.completed
+
+    def calculate_and_store_damage(self, user: User, static_content: StaticContentManager | None = None, party: Party | None = None) -> None:
+        """Forecast this daily's damage alone. Prefer `TaskList.apply_daily_damage` for whole lists."""
         self._calculated_user_damage = None
         self._calculated_party_damage = None
-        # Early returns para casos que no requieren cálculo
-        if not self.is_due or self.completed or not user:
-            return
-        if getattr(user, "is_sleeping", True):
+        if not self.is_pending:
             return
-        stealth = getattr(user, "stealth", 0)
-        if stealth > 0:
+        context = damage_context(user, party)
+        if context is None:
             return
-        try:
-            eff_stats = getattr(user, "effective_stats", {})
-            if not eff_stats:
-                log.warning("Cannot calculate damage: No effective stats for user")
-                return
-            effective_con = eff_stats.get("con", 0.0)
-            # Limitar y calcular valor base
-            value = max(-47.27, min(self.value, 21.27))
-            base_delta = math.pow(0.9747, value)
-            # Mitigación por progreso de checklist
-            checklist_progress = self.calculate_checklist_progress(self.checklist)
-            checklist_mitigation = 1.0 - checklist_progress
-            # Delta efectivo y mitigación por CON
-            effective_delta = base_delta * checklist_mitigation
-            con_mitigation = max(0.1, 1.0 - (effective_con / 250.0))
-            # Daño HP calculado
-            hp_damage = effective_delta * con_mitigation * self.priority * 2.0
-            self._calculated_user_damage = max(0.0, round(hp_damage, 1))
-            # Cálculo de daño de grupo si es aplicable
-            party_info = getattr(user, "party", None)
-            if party_info:
-                party_quest_info = getattr(party_info, "quest", None)
-                if party_quest_info and getattr(party_quest_info, "is_active_and_ongoing", False):
-                    quest_key = getattr(party_quest_info, "key", None)
-                    static_quest = getattr(party_info, "_static_quest_details", None)
-                    if static_quest is None and quest_key and static_content:
-                        log.warning(f"Static quest details not pre-fetched for {quest_key}")
-                    if static_quest and getattr(static_quest, "is_boss_quest", False):
-                        boss_stats = getattr(static_quest, "boss", None)
-                        if boss_stats:
-                            boss_strength = getattr(boss_stats, "strength", 0.0)
-                            if boss_strength > 0:
-                                party_delta = effective_delta * self.priority
-                                party_damage = party_delta * boss_strength
-                                self._calculated_party_damage = max(0.0, round(party_damage, 1))
-        #       log.debug(
-        #          f"Daily {self.id}: UserDmg={self._calculated_user_damage}, "
-        #         f"PartyDmg={self._calculated_party_damage}, Value:{value:.1f}, "
-        #        f"Prio:{self.priority:.1f}, Chk:{checklist_progress:.2f}"
-        #   )
-        except AttributeError as ae:
-            log.error(f"AttributeError during damage calc for Daily {self.id}: {ae}")
-        except Exception as e:
-            log.exception(f"Error calculating damage for daily {self.id}: {e}")
-            self._calculated_user_damage = None
-            self._calculated_party_damage = None
+        effective_con, boss_strength = context
+        forecast = forecast_daily_damage(self.value, self.priority, self.calculate_checklist_progress(self.checklist), effective_con, boss_strength)
+        self.store_damage(float(forecast.user), float(forecast.party) if boss_strength > 0 else None)
+
+    def store_damage(self, user_damage: float | None, party_damage: float | None) -> None:
+        """Store forecast damage computed elsewhere (e.g. by a batched forecast)."""
+        self._calculated_user_damage = user_damage
+        self._calculated_party_damage = party_damage
 
     def process_status_and_metadata(
-        self, user: User | None = None, tags_provider: TagList | None = None, content_manager: StaticContentManager | None = None
+        self,
+        user: User | None = None,
+        tags_provider: TagList | None = None,
+        content_manager: StaticContentManager | None = None,
+        calculate_damage: bool = True,
     ) -> bool:
+        """Process status and tag names; damage is skipped when the caller batches it."""
         result = super().process_status_and_metadata(user, tags_provider, content_manager)
-        if result and user:
+        if result and user and calculate_damage:
             try:
                 self.calculate_and_store_damage(user, content_manager)
             except Exception as e:
@@ -550,8 +590,7 @@ class Todo(Task):
     def parse_todo_datetime_utc(cls, value: Any) -> datetime | None:
         if value == "":
             return None
-        handler = DateTimeHandler(timestamp=value)
-        return handler.utc_datetime
+        return parse_utc_datetime(value)
 
     @property
     def is_past_due(self) -> bool:
@@ -607,6 +646,72 @@ class Reward(Task):
 # Tipo unión para cualquier tarea
 AnyTask = Habit | Daily | Todo | Reward
 
+TASK_TYPE_MAP: dict[str, type[Task]] = {
+    "habit": Habit,
+    "daily": Daily,
+    "todo": Todo,
+    "reward": Reward,
+}
+
+# Discriminated on `type`, so pydantic-core picks the subclass and loops the list in one call
+TaskListAdapter: TypeAdapter[list[AnyTask]] = TypeAdapter(list[Annotated[AnyTask, Field(discriminator="type")]])
+
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+# SECTION: TASK ROW PROJECTION
+
+
+# KLASS: TaskRow
+class TaskRow:
+    """Read-only, display-oriented snapshot of a Task.
+
+    Holds only the fields tables render, sort and filter on, as plain slot
+    attributes, so views avoid pydantic attribute access and `getattr` fallbacks
+    per cell. Rows are built by `TaskList.rows()` once per list version.
+    """
+
+    __slots__ = ("id", "type", "text", "notes", "status", "value", "priority", "due", "tag_names", "text_lower")
+
+    id: str
+    type: str
+    text: str
+    notes: str
+    status: str
+    value: float
+    priority: float
+    due: datetime | None
+    tag_names: tuple[str, ...]
+    text_lower: str
+
+    def __init__(self, task: Task) -> None:
+        set_attr = object.__setattr__
+        set_attr(self, "id", task.id)
+        set_attr(self, "type", task.type)
+        set_attr(self, "text", task.text)
+        set_attr(self, "notes", task.notes)
+        set_attr(self, "status", task.calculated_status)
+        set_attr(self, "value", task.value)
+        set_attr(self, "priority", task.priority)
+        set_attr(self, "due", getattr(task, "due_date", None))
+        set_attr(self, "tag_names", tuple(task.tag_names))
+        set_attr(self, "text_lower", task.text.lower())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def matches_text(self, text_part: str) -> bool:
+        """Case-insensitive substring match on text and tag names."""
+        needle = text_part.lower()
+        return needle in self.text_lower or any(needle in name.lower() for name in self.tag_names)
+
+    def __repr__(self) -> str:
+        return f"TaskRow(id='{self.id[:8]}', type={self.type}, status={self.status}, text='{self.text[:25]}')"
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 
 
@@ -627,9 +732,16 @@ class TaskList(BaseModel):
     _raw_tasks_data: list[dict[str, Any]] | None = PrivateAttr(default=None)
     _tasks_by_id: dict[str, Task] = PrivateAttr(default_factory=dict)
     _tasks_by_type: dict[Literal["habit", "daily", "todo", "reward"], list[Task]] = PrivateAttr(default_factory=lambda: defaultdict(list))
+    # challenge_id -> task IDs. Lists are only mutated in place, so linked Challenges can share them
+    _task_ids_by_challenge: dict[str, list[str]] = PrivateAttr(default_factory=dict)
     _tags_provider: TagList | None = PrivateAttr(default=None)
     _user_data: User | None = PrivateAttr(default=None)
     _content_manager: StaticContentManager | None = PrivateAttr(default=None)
+    _party: Party | None = PrivateAttr(default=None)
+    _damage_forecast: DamageForecast | None = PrivateAttr(default=None)
+    _version: int = PrivateAttr(default=0)
+    _rows_cache: tuple[int, list[TaskRow]] | None = PrivateAttr(default=None)
+    _search_index: tuple[int, FtsIndex] | None = PrivateAttr(default=None)
 
     @classmethod
     def from_raw_api_list(
@@ -640,39 +752,20 @@ class TaskList(BaseModel):
         content_manager: StaticContentManager | None = None,
     ) -> TaskList:
         """Create a TaskList from raw API data with error handling and logging."""
-        parsed_tasks: list[Task] = []
-        errors: list[tuple[str, str, Exception]] = []
-
         log.info(f"Parsing {len(raw_data)} raw task entries from API")
 
-        type_map: dict[str, type[Task]] = {
-            "habit": Habit,
-            "daily": Daily,
-            "todo": Todo,
-            "reward": Reward,
-        }
-
+        known_items: list[dict[str, Any]] = []
         for i, item in enumerate(raw_data):
             type_str = str(item.get("type", "")).lower()
-            task_model = type_map.get(type_str)
-
-            if not task_model:
+            if type_str not in TASK_TYPE_MAP:
                 task_id = item.get("_id", item.get("id", "unknown"))[:8]
                 log.warning(f"Skipping item {i} (ID: {task_id}) with unknown type '{type_str}'")
                 continue
+            if item.get("type") != type_str:
+                item = {**item, "type": type_str}
+            known_items.append(item)
 
-            try:
-                task = task_model(**item)
-                task.position = i
-                parsed_tasks.append(task)
-            except ValidationError as e:
-                task_id = item.get("_id", item.get("id", "unknown"))[:8]
-                log.error(f"Validation error for task {task_id} (Type: {type_str}): {e}")
-                errors.append((item.get("_id", "N/A"), type_str, e))
-            except Exception as e:
-                task_id = item.get("_id", item.get("id", "unknown"))[:8]
-                log.exception(f"Error parsing task {task_id} (Type: {type_str}): {e}")
-                errors.append((item.get("_id", "N/A"), type_str, e))
+        parsed_tasks, errors = cls._validate_bulk(known_items)
 
         log.info(f"Successfully parsed {len(parsed_tasks)} tasks. Encountered {len(errors)} errors")
 
@@ -694,31 +787,69 @@ class TaskList(BaseModel):
 
         log.debug(f"Processing {len(processed_task_dicts)} task dictionaries")
 
-        validated_tasks: list[AnyTask] = []
-        task_map = {"habit": Habit, "daily": Daily, "todo": Todo, "reward": Reward}
-
+        known_items: list[dict[str, Any]] = []
         for index, task_data in enumerate(processed_task_dicts):
             if not isinstance(task_data, dict):
                 continue
 
             type = task_data.get("type")
-            model_class = task_map.get(type)
-
-            if not model_class:
+            if type not in TASK_TYPE_MAP:
                 task_id = task_data.get("id", f"index_{index}")
                 log.warning(f"Unknown task type '{type!r}' for task ID '{task_id}'. Skipping")
                 continue
+            known_items.append(task_data)
 
-            try:
-                task = model_class.model_validate(task_data)
-                validated_tasks.append(task)
-            except Exception as e:
-                task_id = task_data.get("id", f"index_{index}")
-                log.exception(f"Error validating task '{task_id}' (Type: {type}): {e}")
+        validated_tasks, _ = cls._validate_bulk(known_items)
 
         log.info(f"Validated {len(validated_tasks)} tasks from processed dictionary data")
         return cls(tasks=validated_tasks)
 
+    @staticmethod
+    def _validate_bulk(items: list[dict[str, Any]]) -> tuple[list[Task], list[tuple[str, str, Exception]]]:
+        """Validate task dicts of known type in one TypeAdapter call.
+
+        If the bulk call fails, the items it reported are re-validated one by one
+        (to log and collect their errors) and the rest are bulk-validated again.
+        Errors raised outside pydantic name no item, so every item is then
+        validated on its own. Returned tasks keep the input order.
+        """
+        if not items:
+            return [], []
+        try:
+            return TaskListAdapter.validate_python(items), []
+        except ValidationError as bulk_error:
+            failed_indexes = {err["loc"][0] for err in bulk_error.errors() if err["loc"] and isinstance(err["loc"][0], int)}
+        except Exception:
+            # A validator raised outside pydantic (TypeError, KeyError, ...); the bad item is unknown
+            failed_indexes = set(range(len(items)))
+
+        valid_indexes = [i for i in range(len(items)) if i not in failed_indexes]
+        results: dict[int, Task] = {}
+        errors: list[tuple[str, str, Exception]] = []
+
+        if valid_indexes:
+            try:
+                results.update(zip(valid_indexes, TaskListAdapter.validate_python([items[i] for i in valid_indexes]), strict=True))
+            except Exception:
+                # Should not happen; validate everything individually instead
+                failed_indexes = set(range(len(items)))
+
+        for i in sorted(failed_indexes):
+            item = items[i]
+            type_str = item.get("type")
+            try:
+                results[i] = TASK_TYPE_MAP[type_str].model_validate(item)
+            except ValidationError as e:
+                task_id = str(item.get("_id", item.get("id", "unknown")))[:8]
+                log.error(f"Validation error for task {task_id} (Type: {type_str}): {e}")
+                errors.append((item.get("_id", item.get("id", "N/A")), type_str, e))
+            except Exception as e:
+                task_id = str(item.get("_id", item.get("id", "unknown")))[:8]
+                log.exception(f"Error parsing task {task_id} (Type: {type_str}): {e}")
+                errors.append((item.get("_id", item.get("id", "N/A")), type_str, e))
+
+        return [results[i] for i in sorted(results)], errors
+
     def process_tasks(
         self,
         user: User | None = None,
@@ -736,23 +867,175 @@ class TaskList(BaseModel):
         if content_manager:
             self._content_manager = content_manager
 
-        # Reset internal dictionaries
+        # Reset internal dictionaries (challenge lists are cleared in place, see _task_ids_by_challenge)
         self._tasks_by_id = {}
         self._tasks_by_type = defaultdict(list)
+        for task_ids in self._task_ids_by_challenge.values():
+            task_ids.clear()
 
-        # Process each task
+        # Process each task; daily damage is forecast for all dailies at once below
         for i, task in enumerate(self.tasks):
             task.position = i
             self._tasks_by_id[task.id] = task
             self._tasks_by_type[task.type].append(task)
-            task.process_status_and_metadata(user=self._user_data, tags_provider=self._tags_provider, content_manager=self._content_manager)
+            self._index_challenge_link(task)
+            if isinstance(task, Daily):
+                task.process_status_and_metadata(
+                    user=self._user_data, tags_provider=self._tags_provider, content_manager=self._content_manager, calculate_damage=False
+                )
+            else:
+                task.process_status_and_metadata(user=self._user_data, tags_provider=self._tags_provider, content_manager=self._content_manager)
 
+        self.apply_daily_damage()
+        self._bump_version()
         log.info("Task processing complete")
 
+    def apply_daily_damage(self, party: Party | None = None) -> DamageForecast | None:
+        """Forecast cron damage for all pending dailies in one vectorized call.
+
+        Stores each daily's user/party damage and keeps the forecast for totals.
+        Call again with the loaded Party once its static quest details are known.
+
+        Args:
+            party: The user's party; used for boss strength instead of `user.party`.
+
+        Returns:
+            The forecast for pending dailies (in `pending_dailies()` order), or None if no damage applies.
+        """
+        if party is not None:
+            self._party = party
+
+        dailies: list[Daily] = self._tasks_by_type.get("daily", [])
+        for daily in dailies:
+            daily.store_damage(None, None)
+        self._damage_forecast = None
+
+        context = damage_context(self._user_data, self._party)
+        pending = self.pending_dailies()
+        if context is None or not pending:
+            return None
+
+        effective_con, boss_strength = context
+        count = len(pending)
+        forecast = forecast_daily_damage(
+            np.fromiter((daily.value for daily in pending), dtype=np.float64, count=count),
+            np.fromiter((daily.priority for daily in pending), dtype=np.float64, count=count),
+            np.fromiter((daily.calculate_checklist_progress(daily.checklist) for daily in pending), dtype=np.float64, count=count),
+            effective_con,
+            boss_strength,
+        )
+        has_boss = boss_strength > 0
+        for daily, user_damage, party_damage in zip(pending, forecast.user.tolist(), forecast.party.tolist(), strict=True):
+            daily.store_damage(user_damage, party_damage if has_boss else None)
+
+        self._damage_forecast = forecast
+        return forecast
+
+    def pending_dailies(self) -> list[Daily]:
+        """Get dailies that are due and not completed, in list order."""
+        return [daily for daily in self._tasks_by_type.get("daily", []) if daily.is_pending]
+
+    @property
+    def total_user_damage(self) -> float:
+        """Total HP damage forecast for the next cron."""
+        return float(self._damage_forecast.total_user) if self._damage_forecast is not None else 0.0
+
+    @property
+    def total_party_damage(self) -> float:
+        """Total boss damage to the party forecast for the next cron."""
+        return float(self._damage_forecast.total_party) if self._damage_forecast is not None else 0.0
+
+    # Row projection
+    @property
+    def version(self) -> int:
+        """Counter bumped on every mutation; consumers compare it to skip rebuilds."""
+        return self._version
+
+    def _bump_version(self) -> None:
+        self._version += 1
+
+    def rows(self) -> list[TaskRow]:
+        """Get the TaskRow projection of all tasks, built once per list version."""
+        cache = self._rows_cache
+        if cache is None or cache[0] != self._version:
+            cache = (self._version, [TaskRow(task) for task in self.tasks])
+            self._rows_cache = cache
+        return cache[1]
+
+    def get_rows(
+        self,
+        task_type: Literal["habit", "daily", "todo", "reward"] | None = None,
+        text_filter: str = "",
+    ) -> list[TaskRow]:
+        """Get TaskRows, optionally filtered by type and a text filter.
+
+        A row matches the filter on a case-insensitive text/tag substring or a full-text
+        hit in its text, notes or checklist items (the last word matched as a prefix).
+        """
+        rows = self.rows()
+        if task_type:
+            rows = [row for row in rows if row.type == task_type]
+        if text_filter:
+            hit_ids = {hit.id for hit in self.search(text_filter, limit=max(1, len(self.tasks)), task_type=task_type)}
+            rows = [row for row in rows if row.id in hit_ids or row.matches_text(text_filter)]
+        return rows
+
+    def search(
+        self,
+        query: str,
+        limit: int = DEFAULT_LIMIT,
+        task_type: Literal["habit", "daily", "todo", "reward"] | None = None,
+        highlight: tuple[str, str] = HIGHLIGHT,
+    ) -> list[SearchHit]:
+        """Ranked full-text search over task text, notes and checklist items.
+
+        Uses an in-memory FTS5 index, rebuilt on the first search after the list version changes.
+        """
+        cached = self._search_index
+        if cached is None or cached[0] != self._version:
+            index = cached[1] if cached else FtsIndex()
+            index.index_tasks(self.tasks)
+            cached = self._search_index = (self._version, index)
+        return cached[1].search_tasks(query, limit, task_type=task_type, highlight=highlight)
+
     def get_task_by_id(self, task_id: str) -> Task | None:
         """Get a task by its ID."""
         return self._tasks_by_id.get(task_id)
 
+    # Challenge link index
+    @staticmethod
+    def _challenge_id_of(task: Task) -> str | None:
+        return task.challenge.challenge_id if task.challenge else None
+
+    def _index_challenge_link(self, task: Task) -> None:
+        challenge_id = self._challenge_id_of(task)
+        if challenge_id:
+            task_ids = self._task_ids_by_challenge.setdefault(challenge_id, [])
+            if task.id not in task_ids:
+                task_ids.append(task.id)
+
+    def _unindex_challenge_link(self, task_id: str, challenge_id: str | None) -> None:
+        task_ids = self._task_ids_by_challenge.get(challenge_id) if challenge_id else None
+        if task_ids and task_id in task_ids:
+            task_ids.remove(task_id)
+
+    def task_ids_for_challenge(self, challenge_id: str) -> list[str]:
+        """Get the live list of task IDs linked to a challenge.
+
+        The same list object is kept up to date by add/edit/delete, so callers
+        may hold on to it instead of copying.
+        """
+        return self._task_ids_by_challenge.setdefault(challenge_id, [])
+
+    def get_tasks_by_challenge(self, challenge_id: str) -> list[Task]:
+        """Get the tasks linked to a challenge, in list order."""
+        task_ids = self._task_ids_by_challenge.get(challenge_id, ())
+        return [task for task_id in task_ids if (task := self._tasks_by_id.get(task_id))]
+
+    def linked_challenge_ids(self) -> set[str]:
+        """Get the IDs of all challenges that have at least one task in this list."""
+        return {challenge_id for challenge_id, task_ids in self._task_ids_by_challenge.items() if task_ids}
+
     def get_tasks_by_type(self, type: Literal["habit", "daily", "todo", "reward"]) -> list[Task]:
         """Get all tasks of a specific type."""
         return self._tasks_by_type.get(type, [])
@@ -765,15 +1048,7 @@ class TaskList(BaseModel):
             new_task = task_data
         elif isinstance(task_data, dict):
             type_str = str(task_data.get("type", "")).lower()
-
-            type_map: dict[str, type[Task]] = {
-                "habit": Habit,
-                "daily": Daily,
-                "todo": Todo,
-                "reward": Reward,
-            }
-
-            task_model = type_map.get(type_str)
+            task_model = TASK_TYPE_MAP.get(type_str)
             if not task_model:
                 log.error(f"Cannot add task with unknown type '{type_str}'")
                 return None
@@ -801,6 +1076,7 @@ class TaskList(BaseModel):
         self.tasks.append(new_task)
         self._tasks_by_id[new_task.id] = new_task
         self._tasks_by_type[new_task.type].append(new_task)
+        self._index_challenge_link(new_task)
         new_task.position = len(self.tasks) - 1
 
         # Process task metadata
@@ -809,27 +1085,60 @@ class TaskList(BaseModel):
         if not success:
             log.warning(f"Failed to process metadata for task {new_task.id[:8]}")
 
+        if isinstance(new_task, Daily):
+            self.apply_daily_damage()
+        self._bump_version()
+
         log.info(f"Added task: {new_task.id[:8]} (Type: {new_task.type})")
         return new_task
 
+    @staticmethod
+    def _field_names_by_key(model: type[Task]) -> dict[str, str]:
+        """Maps API aliases and field names to field names (`type` and `id` excluded)."""
+        keys: dict[str, str] = {}
+        for name, field in model.model_fields.items():
+            if name in ("id", "type") or field.frozen:
+                continue
+            keys[name] = name
+            if field.alias:
+                keys[field.alias] = name
+        return keys
+
     def edit_task(self, task_id: str, update_data: dict[str, Any]) -> Task | None:
-        """Update an existing task with new data."""
+        """Update an existing task in place with new data (API aliases or field names).
+
+        Unknown keys are ignored; each known field is validated on assignment.
+        """
         task = self.get_task_by_id(task_id)
         if not task:
             log.warning(f"Task ID {task_id[:8]} not found for editing")
             return None
         try:
-            # Use Pydantic's update mechanism
-            updated_task = task.model_validate(update_data, update=True)
+            old_challenge_id = self._challenge_id_of(task)
+            field_names = self._field_names_by_key(type(task))
+            for key, value in update_data.items():
+                name = field_names.get(key)
+                if name is not None:
+                    setattr(task, name, value)
 
             # Process updated task metadata
-            success = updated_task.process_status_and_metadata(user=self._user_data, tags_provider=self._tags_provider, content_manager=self._content_manager)
+            success = task.process_status_and_metadata(user=self._user_data, tags_provider=self._tags_provider, content_manager=self._content_manager)
 
             if not success:
                 log.warning(f"Failed to process metadata for edited task {task_id[:8]}")
 
-            log.info(f"Edited task: {task_id[:8]} (Type: {updated_task.type})")
-            return updated_task
+            # Move the challenge link only if it changed
+            new_challenge_id = self._challenge_id_of(task)
+            if old_challenge_id != new_challenge_id:
+                self._unindex_challenge_link(task_id, old_challenge_id)
+                self._index_challenge_link(task)
+
+            if isinstance(task, Daily):
+                self.apply_daily_damage()
+            self._bump_version()
+
+            log.info(f"Edited task: {task_id[:8]} (Type: {task.type})")
+            return task
         except ValidationError as e:
             log.error(f"Validation error editing task {task_id[:8]}: {e}")
             return None
@@ -837,6 +1146,52 @@ class TaskList(BaseModel):
             log.exception(f"Error editing task {task_id[:8]}: {e}")
             return None
 
+    def refresh_task(self, task_id: str) -> Task | None:
+        """Re-derives a task's status after its fields were changed in place (e.g. by a local score)."""
+        task = self.get_task_by_id(task_id)
+        if not task:
+            return None
+        task.process_status_and_metadata(user=self._user_data, tags_provider=self._tags_provider, content_manager=self._content_manager)
+        if isinstance(task, Daily):
+            self.apply_daily_damage()
+        self._bump_version()
+        return task
+
+    def refresh_tag_names(self, tag_ids: Iterable[str] | None = None, tags_provider: TagList | None = None) -> list[Task]:
+        """Re-resolves tag names of the tasks carrying any of `tag_ids` (every task if None).
+
+        Args:
+            tag_ids: Tags that were added, renamed or deleted.
+            tags_provider: New TagList to resolve from (kept for later tasks); the current one if None.
+
+        Returns:
+            The tasks whose names were re-resolved.
+        """
+        if tags_provider is not None:
+            self._tags_provider = tags_provider
+        wanted = None if tag_ids is None else set(tag_ids)
+        touched = [task for task in self.tasks if wanted is None or wanted.intersection(task.tags_id)]
+        for task in touched:
+            task.set_tag_names_from_provider(self._tags_provider)
+        if touched:
+            self._bump_version()
+        return touched
+
+    def remove_tag_id(self, tag_id: str) -> list[Task]:
+        """Drops a deleted tag from every task carrying it (as the server does)."""
+        touched = [task for task in self.tasks if tag_id in task.tags_id]
+        for task in touched:
+            task.tags_id = [tid for tid in task.tags_id if tid != tag_id]
+            task.set_tag_names_from_provider(self._tags_provider)
+        if touched:
+            self._bump_version()
+        return touched
+
+    def set_user(self, user: User | None, party: Party | None = None) -> DamageForecast | None:
+        """Swaps in a reloaded User (and Party) and re-forecasts daily damage only."""
+        self._user_data = user
+        return self.apply_daily_damage(party=party)
+
     def delete_task(self, task_id: str) -> Task | None:
         """Remove a task from the list and all internal data structures."""
         task = self.get_task_by_id(task_id)
@@ -865,6 +1220,11 @@ class TaskList(BaseModel):
             else:
                 log.warning(f"Task ID {task_id[:8]} not found in ID dictionary")
 
+            self._unindex_challenge_link(task_id, self._challenge_id_of(task))
+
+            if isinstance(task, Daily):
+                self.apply_daily_damage()
+            self._bump_version()
             log.info(f"Deleted task: {task_id[:8]} (Type: {task.type})")
             return task
         except Exception as e:
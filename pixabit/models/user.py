@@ -21,7 +21,6 @@ from pathlib import Path
 from typing import Any, Literal  # Use standard types
 
 # External Libs
-import emoji_data_python
 from pydantic import (
     BaseModel,
     ConfigDict,
@@ -34,16 +33,18 @@ from pydantic import (
     model_validator,
 )
 
+from pixabit.helpers._emoji import replace_emoji_colons
+
 # Local Imports
 try:
     from pixabit.api.client import HabiticaClient
     from pixabit.config import HABITICA_DATA_PATH, USER_ID  # If USER_ID needed as fallback
+    from pixabit.helpers._date import parse_utc_datetime
     from pixabit.helpers._json import load_pydantic_model, save_json, save_pydantic_model
     from pixabit.helpers._logger import log
-    from pixabit.helpers.DateTimeHandler import DateTimeHandler
 
     # Dependent models (use TYPE_CHECKING if circularity is a risk)
-    from .game_content import Gear, StaticContentManager  # Need Gear model + manager for stats
+    from .game_content import Gear, GearBonusTable, StaticContentManager  # Need Gear model + manager for stats
     from .message import Message, MessageList  # For inbox
     from .party import QuestInfo  # For user's view of party quest
     from .tag import Tag, TagList  # For user tags
@@ -63,13 +64,8 @@ except ImportError:
     def load_pydantic_model(cls, p, **k):
         return None
 
-    class DateTimeHandler:
-        def __init__(self, timestamp):
-            self._ts = timestamp
-
-        @property
-        def utc_datetime(self):
-            return None
+    def parse_utc_datetime(value):
+        return None
 
     log.warning("user.py: Could not import dependencies. Using fallbacks.")
 
@@ -90,7 +86,7 @@ class UserProfile(BaseModel):
     def parse_text_emoji(cls, value: Any) -> str | None:
         """Parse text and replace emoji shortcodes, strips whitespace."""
         if isinstance(value, str):
-            parsed = emoji_data_python.replace_colons(value).strip()
+            parsed = replace_emoji_colons(value).strip()
             return parsed  # Return potentially empty string or None
         # Handle name default elsewhere if needed
         return None
@@ -117,14 +113,14 @@ class UserAuthTimestamps(BaseModel):
     @field_validator("created", "updated", "loggedin", mode="before")
     @classmethod
     def parse_datetime_utc(cls, value: Any) -> datetime | None:
-        """Parses timestamp using DateTimeHandler."""
+        """Parses timestamp using the cached UTC parser."""
         # Allow null values through
         if value is None:
             return None
-        handler = DateTimeHandler(timestamp=value)
-        if handler.utc_datetime is None and value is not None:
+        parsed = parse_utc_datetime(value)
+        if parsed is None:
             log.warning(f"Could not parse auth timestamp: {value!r}")
-        return handler.utc_datetime
+        return parsed
 
 
 # KLASS: UserAuth
@@ -249,16 +245,24 @@ class EquippedGear(BaseModel):
         # Use model_dump to get values respecting aliases, exclude None
         return [val for val in self.model_dump(exclude_none=True).values() if isinstance(val, str)]
 
-    def calculate_total_bonus(self, user_class: str | None, gear_data: dict[str, Gear]) -> dict[str, float]:
+    def calculate_total_bonus(
+        self, user_class: str | None, gear_data: dict[str, Gear] | None = None, bonus_table: GearBonusTable | None = None
+    ) -> dict[str, float]:
         """Calculates total stat bonuses from equipped gear, considering class match.
 
         Args:
              user_class: User's character class (e.g., 'warrior').
              gear_data: Dict mapping gear keys to validated Gear objects.
+             bonus_table: Precomputed table from `GameContent.gear_bonus_table(user_class)`.
+                 When given, the bonus is a few row lookups and `gear_data` is ignored.
 
         Returns:
              Dictionary {'str': bonus, 'con': bonus, 'int': bonus, 'per': bonus}.
         """
+        if bonus_table is not None:
+            return bonus_table.total_bonus(self.get_equipped_item_keys())
+
+        gear_data = gear_data or {}
         total_bonus = {"str": 0.0, "con": 0.0, "int": 0.0, "per": 0.0}
         # Note: Gear model fields are already corrected (strength, intelligence etc.)
         # Mapping direct gear field names to the bonus keys
@@ -282,7 +286,6 @@ class EquippedGear(BaseModel):
                     stat_value = getattr(item, gear_stat_field, 0.0)
                     total_bonus[bonus_key] += stat_value * bonus_multiplier
             # else: log.debug(f"Gear key '{gear_key}' not found in provided gear_data or is not a Gear object.")
-        print(total_bonus)
         return total_bonus
 
 
@@ -295,7 +298,7 @@ class UserItems(BaseModel):
     gear_equipped: EquippedGear = Field(default_factory=EquippedGear, alias="equipped")
     gear_costume: EquippedGear = Field(default_factory=EquippedGear, alias="costume")
     # gear.owned maps key -> True/False
-    # gear_owned: dict[str, bool] = Field(default_factory=dict, alias="owned")
+    gear_owned: dict[str, bool] = Field(default_factory=dict, alias="owned")
     # Consumables
     # eggs: dict[str, int] = Field(default_factory=dict)
     # food: dict[str, int] = Field(default_factory=dict)
@@ -330,6 +333,10 @@ class UserItems(BaseModel):
         # Validate counts for items? Pydantic handles dict[str, int] usually
         return values
 
+    def owned_gear_keys(self) -> list[str]:
+        """Returns keys of gear the user currently owns (lost/sold items are False)."""
+        return [key for key, owned in self.gear_owned.items() if owned]
+
 
 # KLASS: UserAchievements
 class UserAchievements(BaseModel):
@@ -545,9 +552,8 @@ class User(BaseModel):
     @field_validator("last_cron", mode="before")
     @classmethod
     def parse_last_cron_utc(cls, value: Any) -> datetime | None:
-        """Parse lastCron timestamp using DateTimeHandler."""
-        handler = DateTimeHandler(timestamp=value)
-        return handler.utc_datetime
+        """Parse lastCron timestamp using the cached UTC parser."""
+        return parse_utc_datetime(value)
 
     @field_validator("balance", mode="before")
     @classmethod
@@ -662,16 +668,17 @@ class User(BaseModel):
 
     # --- Calculation Method ---
 
-    def calculate_effective_stats(self, gear_data: dict[str, Gear] | None = None) -> None:
+    def calculate_effective_stats(self, gear_data: dict[str, Gear] | None = None, bonus_table: GearBonusTable | None = None) -> None:
         """Calculates total effective stats (base, buffs, training, level, gear)
         and max HP/MP. Stores the results in the internal `_calculated_stats` dict.
 
         Args:
             gear_data: A dictionary mapping gear keys to **validated Gear objects**.
                        Required for accurate calculations. If None, gear bonus will be 0.
+            bonus_table: Precomputed gear bonus table for this user's class; preferred over `gear_data`.
         """
         log.debug(f"Calculating effective stats for user {self.id}...")
-        if gear_data is None:
+        if gear_data is None and bonus_table is None:
             log.warning("No gear_data provided to calculate_effective_stats. Gear bonus will be zero.")
             gear_data = {}  # Use empty dict
 
@@ -679,7 +686,7 @@ class User(BaseModel):
         stats_before_gear = self.stats.calculate_stats_before_gear()
 
         # 2. Calculate gear bonus
-        gear_bonus = self.items.gear_equipped.calculate_total_bonus(self.klass, gear_data)
+        gear_bonus = self.items.gear_equipped.calculate_total_bonus(self.klass, gear_data, bonus_table=bonus_table)
 
         # 3. Combine for final effective stats
         eff_stats: dict[str, float] = {}
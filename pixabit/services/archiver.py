@@ -5,279 +5,1360 @@
 # ──────────────────────────────────────────────────────────────────────────────
 
 # SECTION: MODULE DOCSTRING
-"""
-Provides the Archiver class for long-term persistent storage of Habitica data
-(e.g., Challenges, completed Todos) using an SQLite database. Separates archival
-logic from the main live data management.
+"""Provides the Archiver class for long-term persistent storage of Habitica data.
+
+Challenges, task history and completed Todos are kept in an SQLite database.
+Archival logic is separate from the main live data management.
+
+Schema (normalized, one row per entity):
+- `challenges`: one row per challenge, nested leader/group flattened into columns.
+- `challenge_tasks`: one row per (challenge_id, task_id), with the columns used for
+  querying (type, text, priority, ...) and the full task dump in `data_json`.
+- `challenge_task_tags`: one row per (challenge_id, task_id, tag_id).
+
+Queries such as "archived dailies tagged X" run in SQLite (`find_archived_tasks`)
+without deserializing any challenge.
+
+The Archiver keeps one tuned connection open (WAL, synchronous=NORMAL, statement
+cache) until `close()`. All SQL is fixed module-level text, so repeated calls hit
+sqlite3's prepared-statement cache, and batches go through `executemany`. The
+`*_async` methods run the same operations on a single dedicated DB thread, so the
+event loop never blocks on SQLite and DB work is serialized.
+
+`iter_challenges` / `iter_challenge_rows` (and their async counterparts) stream the
+archive in keyset-paginated pages with filters applied in SQL, so browsing or
+exporting a large archive holds only one page in memory.
+
+Every challenge and task row carries a `content_hash` of its content fields.
+Archiving compares hashes first and writes only added or changed rows (and
+removes tasks that left a challenge), recording each write in `archive_changes`
+with the names of the fields that changed.
+
+FTS5 indexes (`challenges_fts`, `challenge_tasks_fts`, layout shared with the live
+lists via `pixabit.helpers._fts`) are updated in the same transaction for exactly
+the rows written, and back `search_challenges` / `search_tasks`.
+
+Task history (habit/daily `history` entries and todo completions) goes to the
+`task_history` time series keyed by (task_id, ts). Daily and todo entries are
+append-only. Habitica keeps one habit entry per day and updates it in place
+(later `date`, higher `scoredUp`), so habit rows are one per (task_id, day) and
+replaced when that day's entry changes. Each write applies its difference to
+`task_history_weekly`, so per-week and per-tag completion rates over years of
+history are a small GROUP BY over the rollup.
 """
 
 # SECTION: IMPORTS
 from __future__ import annotations
 
-import sqlite3
+import asyncio
+import hashlib
 import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from functools import partial
 from pathlib import Path
-from datetime import datetime, timezone
-from typing import List, Dict, Optional
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, NamedTuple, Sequence, TypeVar
 
 # Project Imports (Ensure these resolve)
 try:
-    # Import necessary MODELS that will be archived/retrieved
-    from pixabit.models.challenge import Challenge
-    from pixabit.models.task import Task, AnyTask, TaskList # For deserializing tasks/todos
     # Import Pydantic specifically for Validation Error if validating on load
     from pydantic import ValidationError
+
+    from pixabit.helpers._fts import (
+        CHALLENGE_FTS_COLUMNS,
+        DEFAULT_LIMIT,
+        HIGHLIGHT,
+        TASK_FTS_COLUMNS,
+        SearchHit,
+        challenge_fts_row,
+        challenge_fts_schema,
+        checklist_text,
+        fts_rowid,
+        insert_sql,
+        search_challenges,
+        search_tasks,
+        task_fts_row,
+        task_fts_schema,
+    )
     from pixabit.helpers._logger import log
-    from pixabit.helpers.DateTimeHandler import DateTimeHandler # For parsing dates from DB
-    # Add other models here if they will be archived (e.g., Todo)
+
+    # Import necessary MODELS that will be archived/retrieved
+    from pixabit.models.challenge import Challenge
+    from pixabit.models.task import Task, TaskList  # For deserializing tasks/todos
 except ImportError as e:
-     import logging
-     log = logging.getLogger(__name__); log.addHandler(logging.NullHandler())
-     log.critical(f"Archiver failed imports: {e}. Check structure."); raise
+    import logging
+
+    log = logging.getLogger(__name__)
+    log.addHandler(logging.NullHandler())
+    log.critical(f"Archiver failed imports: {e}. Check structure.")
+    raise
+
+T = TypeVar("T")
 
 # SECTION: CONSTANTS & CONFIG
 
-ARCHIVE_DB_FILENAME = "persistent_archive.db" # Default filename
+ARCHIVE_DB_FILENAME = "persistent_archive.db"  # Default filename
+LEGACY_CHALLENGES_TABLE = "challenges_archive"  # Pre-normalization table (tasks as one JSON blob)
+TASK_DUMP_EXCLUDE = {"styled_text", "styled_notes", "history"}  # History has its own time-series tables
+
+CONNECT_TIMEOUT = 10  # Seconds to wait on a locked database
+STATEMENT_CACHE_SIZE = 128  # sqlite3 prepared-statement cache per connection
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",  # Safe with WAL; fsync on checkpoint only
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -8000",  # ~8 MB page cache
+)
+
+LOOKUP_CHUNK = 500  # IDs per `IN (...)` lookup, well below SQLite's variable limit
+
+# Content fields are hashed; content_hash and last_archived_at are bookkeeping
+CHALLENGE_FIELDS = (
+    "id", "name", "short_name", "summary", "description",
+    "leader_id", "leader_name", "group_id", "group_name", "group_type", "group_privacy",
+    "prize", "member_count", "official", "created_at", "updated_at", "broken",
+)  # fmt: skip
+CHALLENGE_COLUMNS = CHALLENGE_FIELDS + ("content_hash", "last_archived_at")
+TASK_FIELDS = (
+    "challenge_id", "task_id", "position", "type", "text", "notes", "priority", "value", "attribute",
+    "created_at", "updated_at", "data_json",
+)  # fmt: skip
+TASK_COLUMNS = TASK_FIELDS + ("content_hash", "last_archived_at")
+SUMMARY_COLUMNS = (
+    "id", "name", "short_name", "summary", "leader_id", "leader_name",
+    "group_id", "group_name", "member_count", "prize", "official", "created_at",
+)  # fmt: skip
+DEFAULT_PAGE_SIZE = 100  # Challenges per page when streaming
+CHALLENGE_HASH_INDEX = CHALLENGE_COLUMNS.index("content_hash")
+TASK_HASH_INDEX = TASK_COLUMNS.index("content_hash")
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS challenges (
+    id TEXT PRIMARY KEY,
+    name TEXT, short_name TEXT, summary TEXT, description TEXT,
+    leader_id TEXT, leader_name TEXT,
+    group_id TEXT, group_name TEXT, group_type TEXT, group_privacy TEXT,
+    prize INTEGER, member_count INTEGER, official INTEGER,
+    created_at TEXT, updated_at TEXT, broken TEXT,
+    content_hash TEXT,
+    last_archived_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_challenges_leader ON challenges(leader_id);
+CREATE INDEX IF NOT EXISTS idx_challenges_group ON challenges(group_id);
+CREATE INDEX IF NOT EXISTS idx_challenges_created_at ON challenges(created_at);
+
+CREATE TABLE IF NOT EXISTS challenge_tasks (
+    challenge_id TEXT NOT NULL REFERENCES challenges(id) ON DELETE CASCADE,
+    task_id TEXT NOT NULL,
+    position INTEGER NOT NULL DEFAULT 0,
+    type TEXT NOT NULL,
+    text TEXT, notes TEXT,
+    priority REAL, value REAL, attribute TEXT,
+    created_at TEXT, updated_at TEXT,
+    data_json TEXT NOT NULL,
+    content_hash TEXT,
+    last_archived_at TEXT NOT NULL,
+    PRIMARY KEY (challenge_id, task_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_challenge_tasks_type ON challenge_tasks(type);
+
+CREATE TABLE IF NOT EXISTS challenge_task_tags (
+    challenge_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    tag_id TEXT NOT NULL,
+    tag_name TEXT,
+    PRIMARY KEY (challenge_id, task_id, tag_id),
+    FOREIGN KEY (challenge_id, task_id) REFERENCES challenge_tasks(challenge_id, task_id) ON DELETE CASCADE
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_challenge_task_tags_tag ON challenge_task_tags(tag_id);
+CREATE INDEX IF NOT EXISTS idx_challenge_task_tags_name ON challenge_task_tags(tag_name);
+
+-- No foreign keys: the log outlives the rows it describes
+CREATE TABLE IF NOT EXISTS archive_changes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    changed_at TEXT NOT NULL,
+    challenge_id TEXT NOT NULL,
+    task_id TEXT,
+    change TEXT NOT NULL,
+    fields TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_archive_changes_challenge ON archive_changes(challenge_id, changed_at);
+CREATE INDEX IF NOT EXISTS idx_archive_changes_time ON archive_changes(changed_at);
+
+-- Task history time series: one row per (task, entry time); habits keep one row per (task, day)
+CREATE TABLE IF NOT EXISTS task_history (
+    task_id TEXT NOT NULL,
+    ts INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    type TEXT NOT NULL,
+    value REAL,
+    is_due INTEGER, completed INTEGER,
+    scored_up INTEGER, scored_down INTEGER,
+    PRIMARY KEY (task_id, ts)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_task_history_day ON task_history(day);
+
+-- Weekly rollup of task_history, updated with every write
+CREATE TABLE IF NOT EXISTS task_history_weekly (
+    task_id TEXT NOT NULL,
+    week TEXT NOT NULL,
+    type TEXT NOT NULL,
+    entries INTEGER NOT NULL DEFAULT 0,
+    due INTEGER NOT NULL DEFAULT 0,
+    completed INTEGER NOT NULL DEFAULT 0,
+    completed_due INTEGER NOT NULL DEFAULT 0,
+    scored_up INTEGER NOT NULL DEFAULT 0,
+    scored_down INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (task_id, week)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_task_history_weekly_week ON task_history_weekly(week, type);
+
+CREATE TABLE IF NOT EXISTS history_tasks (
+    task_id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    text TEXT,
+    challenge_id TEXT,
+    tag_key TEXT,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS history_task_tags (
+    task_id TEXT NOT NULL,
+    tag_id TEXT NOT NULL,
+    tag_name TEXT,
+    PRIMARY KEY (task_id, tag_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_history_task_tags_tag ON history_task_tags(tag_id);
+CREATE INDEX IF NOT EXISTS idx_history_task_tags_name ON history_task_tags(tag_name);
+
+CREATE TABLE IF NOT EXISTS completed_todos (
+    task_id TEXT PRIMARY KEY,
+    text TEXT, notes TEXT, priority REAL,
+    created_at TEXT,
+    completed_at TEXT NOT NULL,
+    day TEXT NOT NULL,
+    data_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_completed_todos_day ON completed_todos(day);
+"""
+HASHED_TABLES = ("challenges", "challenge_tasks")  # Tables that gained content_hash after first release
+CHALLENGES_FTS = "challenges_fts"
+TASKS_FTS = "challenge_tasks_fts"
+
+# Upsert (not INSERT OR REPLACE): REPLACE deletes the old row first, which cascades to its tasks
+UPSERT_CHALLENGE_SQL = (
+    f"INSERT INTO challenges ({', '.join(CHALLENGE_COLUMNS)}) VALUES ({', '.join('?' * len(CHALLENGE_COLUMNS))}) "
+    f"ON CONFLICT(id) DO UPDATE SET {', '.join(f'{c} = excluded.{c}' for c in CHALLENGE_COLUMNS[1:])}"
+)
+UPSERT_TASK_SQL = (
+    f"INSERT INTO challenge_tasks ({', '.join(TASK_COLUMNS)}) VALUES ({', '.join('?' * len(TASK_COLUMNS))}) "
+    f"ON CONFLICT(challenge_id, task_id) DO UPDATE SET {', '.join(f'{c} = excluded.{c}' for c in TASK_COLUMNS[2:])}"
+)
+DELETE_TASK_SQL = "DELETE FROM challenge_tasks WHERE challenge_id = ? AND task_id = ?"
+DELETE_TASK_TAGS_SQL = "DELETE FROM challenge_task_tags WHERE challenge_id = ? AND task_id = ?"
+INSERT_CHANGE_SQL = "INSERT INTO archive_changes (changed_at, challenge_id, task_id, change, fields) VALUES (?, ?, ?, ?, ?)"
+INSERT_CHALLENGE_FTS_SQL = insert_sql(CHALLENGES_FTS, CHALLENGE_FTS_COLUMNS)
+INSERT_TASK_FTS_SQL = insert_sql(TASKS_FTS, TASK_FTS_COLUMNS)
+DELETE_TASK_FTS_SQL = f"DELETE FROM {TASKS_FTS} WHERE rowid = ?"
+INSERT_TASK_TAG_SQL = "INSERT OR REPLACE INTO challenge_task_tags (challenge_id, task_id, tag_id, tag_name) VALUES (?, ?, ?, ?)"
+SELECT_CHALLENGE_SQL = "SELECT * FROM challenges WHERE id = ?"
+SELECT_TASK_DATA_SQL = "SELECT data_json FROM challenge_tasks WHERE challenge_id = ? ORDER BY position"
+HISTORY_COLUMNS = ("task_id", "ts", "day", "type", "value", "is_due", "completed", "scored_up", "scored_down")
+ROLLUP_COUNTS = ("entries", "due", "completed", "completed_due", "scored_up", "scored_down")
+INSERT_HISTORY_SQL = f"INSERT OR IGNORE INTO task_history ({', '.join(HISTORY_COLUMNS)}) VALUES ({', '.join('?' * len(HISTORY_COLUMNS))})"
+UPSERT_WEEKLY_SQL = (
+    f"INSERT INTO task_history_weekly (task_id, week, type, {', '.join(ROLLUP_COUNTS)}) VALUES ({', '.join('?' * (3 + len(ROLLUP_COUNTS)))}) "
+    f"ON CONFLICT(task_id, week) DO UPDATE SET {', '.join(f'{c} = {c} + excluded.{c}' for c in ROLLUP_COUNTS)}"
+)
+UPSERT_HISTORY_TASK_SQL = (
+    "INSERT INTO history_tasks (task_id, type, text, challenge_id, tag_key, updated_at) VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(task_id) DO UPDATE SET type = excluded.type, text = excluded.text, challenge_id = excluded.challenge_id, "
+    "tag_key = excluded.tag_key, updated_at = excluded.updated_at"
+)
+DELETE_HISTORY_TAGS_SQL = "DELETE FROM history_task_tags WHERE task_id = ?"
+DELETE_HISTORY_SQL = "DELETE FROM task_history WHERE task_id = ? AND ts = ?"
+SELECT_HISTORY_SINCE_SQL = f"SELECT {', '.join(HISTORY_COLUMNS)} FROM task_history WHERE task_id = ? AND ts >= ?"
+ARCHIVE_SCHEMA_VERSION = 1  # PRAGMA user_version; 1 = habit history deduplicated per day
+INSERT_HISTORY_TAG_SQL = "INSERT OR REPLACE INTO history_task_tags (task_id, tag_id, tag_name) VALUES (?, ?, ?)"
+UPSERT_COMPLETED_TODO_SQL = (
+    "INSERT INTO completed_todos (task_id, text, notes, priority, created_at, completed_at, day, data_json) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(task_id) DO UPDATE SET text = excluded.text, notes = excluded.notes, priority = excluded.priority, "
+    "completed_at = excluded.completed_at, day = excluded.day, data_json = excluded.data_json "
+    "WHERE excluded.completed_at > completed_todos.completed_at"
+)
+SELECT_PAGE_TASK_DATA_SQL = "SELECT challenge_id, data_json FROM challenge_tasks WHERE challenge_id IN ({}) ORDER BY challenge_id, position"
+
+
+# SECTION: FUNCTIONS
+
+
+# FUNC: _iso
+def _iso(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+# FUNC: content_hash
+def content_hash(values: Sequence[Any]) -> str:
+    """Stable hash of a row's content fields, used to skip rewriting unchanged rows."""
+    return hashlib.sha256(json.dumps(values, ensure_ascii=False, default=str).encode("utf-8")).hexdigest()
+
+
+# FUNC: challenge_row
+def challenge_row(challenge: Challenge, archived_at: str) -> tuple[Any, ...]:
+    """Flattens a Challenge into a `challenges` row (CHALLENGE_COLUMNS order)."""
+    leader, group = challenge.leader, challenge.group
+    values = (
+        challenge.id, challenge.name, challenge.short_name, challenge.summary, challenge.description,
+        leader.id if leader else None, leader.name if leader else None,
+        group.id if group else None, group.name if group else None,
+        group.type if group else None, group.privacy if group else None,
+        challenge.prize, challenge.member_count, int(challenge.official),
+        _iso(challenge.created_at), _iso(challenge.updated_at), challenge.broken,
+    )  # fmt: skip
+    return values + (content_hash(values), archived_at)
+
+
+# FUNC: task_dump
+def task_dump(task: Task) -> dict[str, Any]:
+    """JSON-compatible dump of a task, as stored in `challenge_tasks.data_json`."""
+    return task.model_dump(mode="json", exclude=TASK_DUMP_EXCLUDE)
+
+
+# FUNC: task_rows
+def task_rows(
+    challenge_id: str, dump: dict[str, Any], archived_at: str, tag_names: Iterable[str] = (), position: int = 0
+) -> tuple[tuple[Any, ...], list[tuple[Any, ...]]]:
+    """Builds the `challenge_tasks` row and `challenge_task_tags` rows for one task dump.
+
+    Args:
+        challenge_id: Owning challenge.
+        dump: The task as produced by `task_dump` (or a legacy archived dict).
+        archived_at: ISO timestamp of this archive run.
+        tag_names: Resolved tag names, positionally matching `dump["tags_id"]`.
+        position: Index of the task within the challenge, to restore task order.
+    """
+    task_id = dump.get("id") or dump.get("_id")
+    values = (
+        challenge_id, task_id, position, dump.get("type"), dump.get("text"), dump.get("notes"),
+        dump.get("priority"), dump.get("value"), dump.get("attribute"),
+        dump.get("created_at"), dump.get("updated_at"), json.dumps(dump, ensure_ascii=False, sort_keys=True),
+    )  # fmt: skip
+    tag_ids = dump.get("tags_id") or dump.get("tags") or []
+    names = list(tag_names)
+    tags = [(challenge_id, task_id, tag_id, names[i] if i < len(names) else None) for i, tag_id in enumerate(tag_ids)]
+    return values + (content_hash((values, tags)), archived_at), tags
+
+
+# FUNC: changed_fields
+def changed_fields(old: dict[str, Any], new: dict[str, Any], fields: Iterable[str]) -> list[str]:
+    """Names of the fields whose values differ between two versions of a row."""
+    return [field for field in fields if old.get(field) != new.get(field)]
+
+
+# FUNC: _ms
+def _ms(value: datetime) -> int:
+    return int(value.timestamp() * 1000)
+
+
+# FUNC: _flag
+def _flag(value: bool | None) -> int | None:
+    return None if value is None else int(value)
+
+
+# FUNC: week_of
+def week_of(day: date | datetime | str) -> str:
+    """ISO date of the Monday starting the (UTC) week of `day`."""
+    if isinstance(day, str):
+        day = date.fromisoformat(day[:10])
+    elif isinstance(day, datetime):
+        day = day.astimezone(timezone.utc).date()
+    return (day - timedelta(days=day.weekday())).isoformat()
+
+
+# FUNC: history_rows
+def history_rows(task: Task) -> list[tuple[Any, ...]]:
+    """`task_history` rows (HISTORY_COLUMNS order) for a task.
+
+    Habits and dailies contribute their `history` entries (habits only the latest
+    entry of each day); a completed todo contributes its completion. Other tasks
+    contribute nothing.
+    """
+    if task.type == "todo":
+        completed_at = getattr(task, "completed_date", None)
+        if not getattr(task, "completed", False) or completed_at is None:
+            return []
+        return [(task.id, _ms(completed_at), completed_at.astimezone(timezone.utc).date().isoformat(), "todo", task.value, None, 1, None, None)]
+    rows = [
+        (
+            task.id, _ms(entry.date), entry.date.astimezone(timezone.utc).date().isoformat(), task.type, entry.value,
+            _flag(entry.is_due), _flag(entry.completed), entry.scored_up, entry.scored_down,
+        )  # fmt: skip
+        for entry in getattr(task, "history", ())
+    ]
+    if task.type == "habit":
+        latest: dict[str, tuple[Any, ...]] = {}
+        for row in rows:
+            if row[2] not in latest or row[1] > latest[row[2]][1]:
+                latest[row[2]] = row
+        rows = list(latest.values())
+    return rows
+
+
+# FUNC: weekly_rollup_rows
+def weekly_rollup_rows(rows: Iterable[tuple[Any, ...]], removed: Iterable[tuple[Any, ...]] = ()) -> list[tuple[Any, ...]]:
+    """Aggregates `task_history` rows into `task_history_weekly` increments.
+
+    Args:
+        rows: Rows being inserted; their counts are added.
+        removed: Stored rows being replaced or deleted; their counts are subtracted.
+    """
+    totals: dict[tuple[str, str, str], list[int]] = {}
+    for sign, batch in ((1, rows), (-1, removed)):
+        for task_id, _ts, day, task_type, _value, is_due, completed, scored_up, scored_down in batch:
+            counts = totals.setdefault((task_id, week_of(day), task_type), [0] * len(ROLLUP_COUNTS))
+            counts[0] += sign
+            counts[1] += sign * (is_due == 1)
+            counts[2] += sign * (completed == 1)
+            counts[3] += sign * (is_due == 1 and completed == 1)
+            counts[4] += sign * (scored_up or 0)
+            counts[5] += sign * (scored_down or 0)
+    return [(*key, *counts) for key, counts in totals.items() if any(counts)]
+
+
+# FUNC: with_rates
+def with_rates(row: sqlite3.Row) -> dict[str, Any]:
+    """Rollup row as dict plus `completion_rate` (completed of due, dailies) and `up_ratio` (habits)."""
+    data = dict(row)
+    data["completion_rate"] = data["completed_due"] / data["due"] if data.get("due") else None
+    scored = (data.get("scored_up") or 0) + (data.get("scored_down") or 0)
+    data["up_ratio"] = data["scored_up"] / scored if scored else None
+    return data
+
 
 # SECTION: ARCHIVER CLASS
 
+
+# KLASS: ArchiveStats
+class ArchiveStats(NamedTuple):
+    """Row counts of one archive write."""
+
+    challenges_added: int
+    challenges_updated: int
+    challenges_unchanged: int
+    tasks_added: int
+    tasks_updated: int
+    tasks_removed: int
+
+
+# KLASS: ChallengeFilter
+class ChallengeFilter(NamedTuple):
+    """Filters for streaming archived challenges, evaluated in SQL. Unset fields don't filter."""
+
+    leader_id: str | None = None
+    group_id: str | None = None
+    group_type: str | None = None
+    official: bool | None = None
+    created_after: datetime | None = None
+    created_before: datetime | None = None
+    name_contains: str | None = None  # Case-insensitive (ASCII) substring of name or short name
+    task_type: str | None = None  # Has at least one archived task of this type
+
+    def to_sql(self) -> tuple[list[str], list[Any]]:
+        """WHERE clauses (on alias `c` for challenges) and their parameters."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column in ("leader_id", "group_id", "group_type"):
+            value = getattr(self, column)
+            if value is not None:
+                clauses.append(f"c.{column} = ?")
+                params.append(value)
+        if self.official is not None:
+            clauses.append("c.official = ?")
+            params.append(int(self.official))
+        if self.created_after:
+            clauses.append("c.created_at >= ?")
+            params.append(self.created_after.astimezone(timezone.utc).isoformat())
+        if self.created_before:
+            clauses.append("c.created_at < ?")
+            params.append(self.created_before.astimezone(timezone.utc).isoformat())
+        if self.name_contains:
+            clauses.append("(c.name LIKE ? OR c.short_name LIKE ?)")
+            params.extend([f"%{self.name_contains}%"] * 2)
+        if self.task_type:
+            clauses.append("EXISTS (SELECT 1 FROM challenge_tasks t WHERE t.challenge_id = c.id AND t.type = ?)")
+            params.append(self.task_type)
+        return clauses, params
+
+
 # KLASS: Archiver
 class Archiver:
+    """Handles persistent storage and retrieval of Habitica data using SQLite.
+
+    Manages challenges, task history and completed Todos.
     """
-    Handles persistent storage and retrieval of Habitica data using SQLite.
-    Manages challenges, and potentially completed tasks like Todos.
-    """
+
     def __init__(self, db_path: Path):
-        """
-        Initializes the Archiver and connects to the database.
+        """Initializes the Archiver and connects to the database.
 
         Args:
             db_path: The full path to the SQLite database file.
         """
         self.db_path = db_path
         self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()  # Serializes sync callers with the DB thread
+        self._executor: ThreadPoolExecutor | None = None
         log.info(f"Initializing Archiver with DB: {self.db_path}")
         try:
-            self._ensure_tables_exist() # Creates DB and tables if needed
+            self._ensure_tables_exist()  # Creates DB and tables if needed
         except Exception as e:
             log.critical(f"CRITICAL: Failed to initialize Archiver DB at {db_path}: {e}", exc_info=True)
             # Application might need to handle this critical failure
 
     def _get_conn(self) -> sqlite3.Connection | None:
-        """Gets or establishes a connection to the archive SQLite database."""
-        # Basic connection management (re-establish if closed)
+        """Gets the long-lived connection, opening and tuning it on first use."""
+        if self._conn is not None:
+            return self._conn
         try:
-             # Check if connection exists and is usable
-            if self._conn:
-                 # Quick check if connection is still active (may not be fully reliable)
-                 try:
-                    self._conn.execute("SELECT 1")
-                    return self._conn
-                 except sqlite3.Error:
-                     self._close_db_conn() # Close broken connection
-
-            # Establish new connection
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
-            self._conn = sqlite3.connect(self.db_path, timeout=10)
-            self._conn.row_factory = sqlite3.Row
-            self._conn.execute("PRAGMA foreign_keys = ON;")
-            self._conn.execute("PRAGMA journal_mode=WAL;")
+            # Used from the DB thread and from sync callers; _lock keeps access serialized
+            conn = sqlite3.connect(self.db_path, timeout=CONNECT_TIMEOUT, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+            conn.row_factory = sqlite3.Row
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._conn = conn
             log.debug(f"Established connection to DB: {self.db_path}")
             return self._conn
         except sqlite3.Error as e:
             log.error(f"Failed to connect to archive DB {self.db_path}: {e}")
-            self._conn = None # Ensure conn is None on failure
+            self._conn = None  # Ensure conn is None on failure
             return None
 
     def _close_db_conn(self):
         """Closes the database connection if open."""
-        if self._conn:
-            log.debug(f"Closing Archiver DB connection to {self.db_path}")
+        with self._lock:
+            if self._conn:
+                log.debug(f"Closing Archiver DB connection to {self.db_path}")
+                try:
+                    self._conn.execute("PRAGMA optimize")
+                    self._conn.close()
+                except sqlite3.Error as e:
+                    log.error(f"Error closing archiver DB: {e}")
+                self._conn = None
+
+    def _ensure_tables_exist(self):
+        """Creates database tables if they don't already exist, migrating older layouts."""
+        with self._lock:
+            conn = self._get_conn()
+            if not conn:
+                return  # Cannot proceed
+
             try:
-                self._conn.close()
+                log.debug("Ensuring Archiver tables exist...")
+                existing = {row["name"] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+                conn.executescript(SCHEMA_SQL)
+                with conn:
+                    conn.execute(challenge_fts_schema(CHALLENGES_FTS))
+                    conn.execute(task_fts_schema(TASKS_FTS))
+                    self._add_hash_columns(conn)
+                    if "challenges" in existing and not {CHALLENGES_FTS, TASKS_FTS} <= existing:
+                        self._rebuild_search_index(conn)  # Archive predates full-text search
+                    self._migrate_legacy_challenges(conn)
+                    if conn.execute("PRAGMA user_version").fetchone()[0] < ARCHIVE_SCHEMA_VERSION:
+                        self._dedupe_habit_history(conn)
+                        conn.execute(f"PRAGMA user_version = {ARCHIVE_SCHEMA_VERSION}")
+                log.debug("Archiver tables ensured.")
             except sqlite3.Error as e:
-                log.error(f"Error closing archiver DB: {e}")
-            self._conn = None
+                log.exception(f"Archiver failed to ensure tables: {e}")
+                raise  # Critical error
 
-    def _ensure_tables_exist(self):
-        """Creates database tables if they don't already exist."""
-        conn = self._get_conn()
-        if not conn: return # Cannot proceed
+    @staticmethod
+    def _add_hash_columns(conn: sqlite3.Connection) -> None:
+        """Adds `content_hash` to tables created before change detection; their rows are rewritten once."""
+        for table in HASHED_TABLES:
+            columns = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+            if "content_hash" not in columns:
+                log.info(f"Adding content_hash column to archive table '{table}'.")
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN content_hash TEXT")
+
+    @staticmethod
+    def _dedupe_habit_history(conn: sqlite3.Connection) -> None:
+        """Keeps only the latest stored habit row per (task, day), taking the extra rows out of the weekly rollup.
+
+        Archives written before habit rows were keyed by day hold one row per in-place update of a day's entry.
+        """
+        duplicates = conn.execute(
+            "SELECT task_id, day FROM task_history WHERE type = 'habit' GROUP BY task_id, day HAVING COUNT(*) > 1"
+        ).fetchall()
+        removed: list[tuple[Any, ...]] = []
+        for task_id, day in duplicates:
+            rows = conn.execute(f"SELECT {', '.join(HISTORY_COLUMNS)} FROM task_history WHERE task_id = ? AND day = ? ORDER BY ts", (task_id, day)).fetchall()
+            removed.extend(tuple(row) for row in rows[:-1])
+        if not removed:
+            return
+        log.info(f"Removing {len(removed)} superseded habit history rows from the archive.")
+        conn.executemany(DELETE_HISTORY_SQL, [(row[0], row[1]) for row in removed])
+        conn.executemany(UPSERT_WEEKLY_SQL, weekly_rollup_rows((), removed=removed))
+
+    def _migrate_legacy_challenges(self, conn: sqlite3.Connection) -> None:
+        """Moves rows of the old `challenges_archive` table (tasks as a JSON blob) into the normalized tables."""
+        legacy = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?", (LEGACY_CHALLENGES_TABLE,)).fetchone()
+        if not legacy:
+            return
+        log.info("Migrating legacy challenge archive to normalized tables...")
+        challenge_params: list[tuple[Any, ...]] = []
+        task_params: dict[str, list[tuple[tuple[Any, ...], list[tuple[Any, ...]]]]] = {}
+        for row in conn.execute(f"SELECT * FROM {LEGACY_CHALLENGES_TABLE}").fetchall():
+            data = dict(row)
+            archived_at = data.get("last_archived_at") or datetime.now(timezone.utc).isoformat()
+            values = tuple(data.get(column) for column in CHALLENGE_FIELDS)
+            challenge_params.append(values + (content_hash(values), archived_at))
+            try:
+                raw_tasks = json.loads(data.get("tasks_json") or "[]")
+            except json.JSONDecodeError:
+                log.warning(f"Invalid tasks JSON in legacy archive for {data.get('id')}")
+                raw_tasks = []
+            dumps = [dump for dump in raw_tasks if isinstance(dump, dict)]
+            task_params[data["id"]] = self._task_entries(data["id"], [(dump, ()) for dump in dumps], archived_at)
+        self._apply_batch(conn, challenge_params, task_params, datetime.now(timezone.utc).isoformat())
+        conn.execute(f"DROP TABLE {LEGACY_CHALLENGES_TABLE}")
+        log.info(f"Migrated {len(challenge_params)} legacy archived challenges.")
+
+    @staticmethod
+    def _rebuild_search_index(conn: sqlite3.Connection) -> None:
+        """Refills both FTS indexes from the archive tables."""
+        challenges = conn.execute("SELECT id, name, summary, description FROM challenges").fetchall()
+        tasks = conn.execute("SELECT challenge_id, task_id, type, text, notes, data_json FROM challenge_tasks").fetchall()
+        conn.execute(f"DELETE FROM {CHALLENGES_FTS}")
+        conn.execute(f"DELETE FROM {TASKS_FTS}")
+        conn.executemany(INSERT_CHALLENGE_FTS_SQL, [challenge_fts_row(r["id"], r["name"], r["summary"], r["description"]) for r in challenges])
+        conn.executemany(
+            INSERT_TASK_FTS_SQL,
+            [
+                task_fts_row(r["task_id"], r["challenge_id"], r["type"], r["text"], r["notes"], checklist_text(json.loads(r["data_json"]).get("checklist")))
+                for r in tasks
+            ],
+        )
+        log.info(f"Rebuilt archive search index ({len(challenges)} challenges, {len(tasks)} tasks).")
+
+    @staticmethod
+    def _task_entries(
+        challenge_id: str, dumps: list[tuple[dict[str, Any], Iterable[str]]], archived_at: str
+    ) -> list[tuple[tuple[Any, ...], list[tuple[Any, ...]]]]:
+        """Builds (task row, tag rows) for a challenge's tasks, dropping tasks without ID or type."""
+        entries = []
+        for position, (dump, tag_names) in enumerate(dumps):
+            row, tags = task_rows(challenge_id, dump, archived_at, tag_names, position)
+            if row[1] and row[3]:
+                entries.append((row, tags))
+        return entries
+
+    @staticmethod
+    def _task_fts_row(row: tuple[Any, ...]) -> tuple[Any, ...]:
+        """FTS row for a `challenge_tasks` row (TASK_COLUMNS order)."""
+        data = dict(zip(TASK_COLUMNS, row, strict=True))
+        checklist = checklist_text(json.loads(data["data_json"]).get("checklist"))
+        return task_fts_row(data["task_id"], data["challenge_id"], data["type"], data["text"], data["notes"], checklist)
+
+    @staticmethod
+    def _select_in(conn: sqlite3.Connection, sql: str, ids: Sequence[str]) -> Iterator[sqlite3.Row]:
+        """Runs `sql` (with one `IN ({})` placeholder group) over `ids` in chunks."""
+        for start in range(0, len(ids), LOOKUP_CHUNK):
+            chunk = ids[start : start + LOOKUP_CHUNK]
+            yield from conn.execute(sql.format(", ".join("?" * len(chunk))), chunk)
+
+    def _apply_batch(
+        self,
+        conn: sqlite3.Connection,
+        challenge_params: list[tuple[Any, ...]],
+        task_params: dict[str, list[tuple[tuple[Any, ...], list[tuple[Any, ...]]]]],
+        changed_at: str,
+    ) -> ArchiveStats:
+        """Writes only the challenge and task rows whose content hash changed, and logs each change.
+
+        Args:
+            conn: Connection inside an open transaction.
+            challenge_params: `challenges` rows (CHALLENGE_COLUMNS order).
+            task_params: Per challenge ID, (task row, tag rows) for every current task.
+                Stored tasks of these challenges that are missing here are removed.
+            changed_at: Timestamp recorded in the change log.
+        """
+        ids = [row[0] for row in challenge_params]
+        changes: list[tuple[Any, ...]] = []
+
+        # --- Challenges ---
+        stored = {r["id"]: r["content_hash"] for r in self._select_in(conn, "SELECT id, content_hash FROM challenges WHERE id IN ({})", ids)}
+        changed = [row for row in challenge_params if stored.get(row[0]) != row[CHALLENGE_HASH_INDEX]]
+        updated_ids = [row[0] for row in changed if row[0] in stored]
+        old_challenges = {r["id"]: dict(r) for r in self._select_in(conn, "SELECT * FROM challenges WHERE id IN ({})", updated_ids)}
+        for row in changed:
+            old = old_challenges.get(row[0])
+            if old is None:
+                changes.append((changed_at, row[0], None, "added", None))
+            else:
+                fields = changed_fields(old, dict(zip(CHALLENGE_COLUMNS, row, strict=True)), CHALLENGE_FIELDS[1:])
+                changes.append((changed_at, row[0], None, "updated", json.dumps(fields)))
+        conn.executemany(UPSERT_CHALLENGE_SQL, changed)
+
+        # --- Tasks ---
+        stored_tasks = {
+            (r["challenge_id"], r["task_id"]): r["content_hash"]
+            for r in self._select_in(conn, "SELECT challenge_id, task_id, content_hash FROM challenge_tasks WHERE challenge_id IN ({})", ids)
+        }
+        changed_tasks: list[tuple[Any, ...]] = []
+        tag_params: list[tuple[Any, ...]] = []
+        current: set[tuple[str, str]] = set()
+        for challenge_id, entries in task_params.items():
+            for row, tags in entries:
+                key = (challenge_id, row[1])
+                current.add(key)
+                if stored_tasks.get(key) != row[TASK_HASH_INDEX]:
+                    changed_tasks.append(row)
+                    tag_params.extend(tags)
+        removed = [key for key in stored_tasks if key not in current]
+        updated_keys = {(row[0], row[1]) for row in changed_tasks if (row[0], row[1]) in stored_tasks}
+        old_tasks = {
+            (r["challenge_id"], r["task_id"]): r
+            for r in self._select_in(
+                conn,
+                "SELECT challenge_id, task_id, position, data_json FROM challenge_tasks WHERE challenge_id IN ({})",
+                sorted({challenge_id for challenge_id, _ in updated_keys}),
+            )
+            if (r["challenge_id"], r["task_id"]) in updated_keys
+        }
+        for row in changed_tasks:
+            old = old_tasks.get((row[0], row[1]))
+            if old is None:
+                changes.append((changed_at, row[0], row[1], "added", None))
+                continue
+            old_data, new_data = json.loads(old["data_json"]), json.loads(row[TASK_FIELDS.index("data_json")])
+            fields = changed_fields(old_data, new_data, sorted(old_data.keys() | new_data.keys()))
+            if old["position"] != row[2]:
+                fields.append("position")
+            changes.append((changed_at, row[0], row[1], "updated", json.dumps(fields or ["tag_names"])))
+        changes.extend((changed_at, challenge_id, task_id, "removed", None) for challenge_id, task_id in removed)
+
+        conn.executemany(DELETE_TASK_SQL, removed)  # Tags cascade
+        conn.executemany(DELETE_TASK_TAGS_SQL, updated_keys)
+        conn.executemany(UPSERT_TASK_SQL, changed_tasks)
+        conn.executemany(INSERT_TASK_TAG_SQL, tag_params)
+        conn.executemany(INSERT_CHANGE_SQL, changes)
 
+        # --- Search index (same rows) ---
+        text_columns = [CHALLENGE_COLUMNS.index(column) for column in ("id", "name", "summary", "description")]
+        conn.executemany(INSERT_CHALLENGE_FTS_SQL, [challenge_fts_row(*(row[i] for i in text_columns)) for row in changed])
+        conn.executemany(DELETE_TASK_FTS_SQL, [(fts_rowid(challenge_id, task_id),) for challenge_id, task_id in removed])
+        conn.executemany(INSERT_TASK_FTS_SQL, [self._task_fts_row(row) for row in changed_tasks])
+
+        return ArchiveStats(
+            challenges_added=len(changed) - len(updated_ids),
+            challenges_updated=len(updated_ids),
+            challenges_unchanged=len(challenge_params) - len(changed),
+            tasks_added=len(changed_tasks) - len(updated_keys),
+            tasks_updated=len(updated_keys),
+            tasks_removed=len(removed),
+        )
+
+    def _deserialize_challenge(self, row: sqlite3.Row, task_data: list[str] | None = None) -> Challenge | None:
+        """Helper to convert a `challenges` row (and its tasks' data_json) into a Challenge object."""
+        if not row:
+            return None
+        challenge_data = dict(row)
+        challenge_id = challenge_data.get("id")
         try:
-            cursor = conn.cursor()
-            log.debug("Ensuring Archiver tables exist...")
-
-            # --- Challenges Table ---
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS challenges_archive (
-                    id TEXT PRIMARY KEY,
-                    name TEXT, short_name TEXT, summary TEXT, description TEXT,
-                    leader_id TEXT, leader_name TEXT,
-                    group_id TEXT, group_name TEXT, group_type TEXT, group_privacy TEXT,
-                    prize INTEGER, official INTEGER, created_at TEXT, broken TEXT,
-                    tasks_json TEXT, last_archived_at TEXT NOT NULL
-                )
-            """)
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_challenges_archive_id ON challenges_archive(id)")
-
-            # --- Add other tables as needed (e.g., Todos) ---
-            # cursor.execute(""" CREATE TABLE IF NOT EXISTS todos_archive (...) """)
-            # cursor.execute("CREATE INDEX IF NOT EXISTS ...")
-
-            conn.commit()
-            log.debug("Archiver tables ensured.")
-        except sqlite3.Error as e:
-            log.exception(f"Archiver failed to ensure tables: {e}")
-            raise # Critical error
-        # Keep connection open briefly? Or close? Close for simplicity unless bulk ops common.
-        # self._close_db_conn()
-
-    def _deserialize_challenge(self, row: sqlite3.Row) -> Challenge | None:
-         """Helper to convert a DB row into a Challenge object."""
-         if not row: return None
-         try:
-             challenge_data = dict(row)
-             challenge_id = challenge_data.get("id")
-
-             # Deserialize tasks from JSON
-             tasks_list: list[AnyTask] = []
-             tasks_json_str = challenge_data.pop("tasks_json", None)
-             if tasks_json_str:
-                  try:
-                       raw_task_list = json.loads(tasks_json_str)
-                       if isinstance(raw_task_list, list):
-                            # Assuming TaskList class and from_processed_dicts are available
-                            tasks_list = TaskList.from_processed_dicts(raw_task_list).tasks
-                  except json.JSONDecodeError: log.warning(f"Invalid tasks JSON in archive for {challenge_id}")
-                  except Exception as e: log.error(f"Error parsing tasks for {challenge_id} from archive: {e}")
-
-             # Reconstruct nested models (if stored flat) and convert types
-             challenge_data["official"] = bool(challenge_data.get("official", 0))
-             challenge_data["created_at"] = DateTimeHandler(challenge_data.get("created_at")).utc_datetime
-             # Rebuild leader dict if stored flat
-             leader_data = None
-             lid = challenge_data.pop('leader_id', None)
-             if lid: leader_data = {'id': lid, 'name': challenge_data.pop('leader_name', None)}
-             challenge_data['leader'] = leader_data
-             # Rebuild group dict
-             group_data = None
-             gid = challenge_data.pop('group_id', None)
-             if gid: group_data = {'id': gid, 'name': challenge_data.pop('group_name', None),
-                                     'type': challenge_data.pop('group_type', None),
-                                     'privacy': challenge_data.pop('group_privacy', None)}
-             challenge_data['group'] = group_data
-
-             # Validate dictionary against Challenge model
-             challenge_instance = Challenge.model_validate(challenge_data)
-             challenge_instance.tasks = tasks_list # Assign deserialized tasks
-             return challenge_instance
-         except ValidationError as e:
-             log.warning(f"Skipping invalid archived challenge {challenge_id}: {e}")
-             return None
-         except Exception as e:
-             log.exception(f"Error deserializing archived challenge {challenge_id} from DB")
-             return None
+            # Reconstruct nested models and convert types
+            challenge_data["official"] = bool(challenge_data.get("official", 0))
+            lid = challenge_data.pop("leader_id", None)
+            leader_name = challenge_data.pop("leader_name", None)
+            challenge_data["leader"] = {"id": lid, "name": leader_name} if lid else None
+            gid = challenge_data.pop("group_id", None)
+            group_fields = {key: challenge_data.pop(f"group_{key}", None) for key in ("name", "type", "privacy")}
+            challenge_data["group"] = {"id": gid, **{k: v for k, v in group_fields.items() if v is not None}} if gid else None
 
+            # Validate dictionary against Challenge model
+            challenge_instance = Challenge.model_validate(challenge_data)
+        except ValidationError as e:
+            log.warning(f"Skipping invalid archived challenge {challenge_id}: {e}")
+            return None
+        except Exception:
+            log.exception(f"Error deserializing archived challenge {challenge_id} from DB")
+            return None
+
+        if task_data:
+            try:
+                tasks = TaskList.from_processed_dicts([json.loads(data) for data in task_data])
+                tasks.process_tasks()
+                challenge_instance.set_tasks(tasks)
+            except Exception as e:
+                log.error(f"Error parsing tasks for {challenge_id} from archive: {e}")
+        return challenge_instance
 
     def archive_challenges(self, challenges: list[Challenge]) -> int:
-        """Adds or replaces multiple challenges in the archive database. Returns count archived."""
-        if not challenges: return 0
-        conn = self._get_conn();
-        if not conn: log.error("Cannot archive challenges, DB connection failed."); return 0
-        log.info(f"Archiving {len(challenges)} challenges to DB...")
-        success_count = 0
-        try:
-            cursor = conn.cursor()
-            conn.execute("BEGIN TRANSACTION")
-            now_iso = datetime.now(timezone.utc).isoformat()
+        """Archives challenges and their tasks, writing only rows whose content changed.
 
-            for challenge in challenges:
-                if not isinstance(challenge, Challenge) or not challenge.id: continue
-                try:
-                    tasks_dump = [t.model_dump(mode='json', exclude={'styled_text','styled_notes'}) for t in challenge.tasks]
-                    tasks_json_str = json.dumps(tasks_dump) if tasks_dump else None # Store null if no tasks
-
-                    db_data = (
-                        challenge.id, challenge.name, challenge.short_name, challenge.summary, challenge.description,
-                        challenge.leader.id if challenge.leader else None, challenge.leader.name if challenge.leader else None,
-                        challenge.group.id if challenge.group else None, challenge.group.name if challenge.group else None,
-                        challenge.group.type if challenge.group else None, challenge.group.privacy if challenge.group else None,
-                        challenge.prize, int(challenge.official),
-                        challenge.created_at.isoformat() if challenge.created_at else None,
-                        challenge.broken, tasks_json_str, now_iso
-                    )
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO challenges_archive VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, db_data)
-                    success_count += 1
-                except Exception as item_e:
-                     log.error(f"Failed preparing/saving chal {challenge.id} to archive DB: {item_e}")
-
-            conn.commit()
-            log.info(f"Archived {success_count}/{len(challenges)} challenges.")
+        Unchanged challenges and tasks are skipped (their `last_archived_at` stays at the
+        last change); tasks no longer in a challenge are removed. Every write is
+        recorded in `archive_changes`.
 
-        except sqlite3.Error as e:
-            log.exception(f"Failed saving challenges archive batch: {e}")
-            if conn: try: conn.rollback() except: pass
-            success_count = 0 # Indicate failure
-        finally:
-             self._close_db_conn() # Close after operation
+        Returns:
+            Number of challenges processed (changed or not).
+        """
+        if not challenges:
+            return 0
+        now_iso = datetime.now(timezone.utc).isoformat()
+        challenge_params: list[tuple[Any, ...]] = []
+        task_params: dict[str, list[tuple[tuple[Any, ...], list[tuple[Any, ...]]]]] = {}
+        for challenge in challenges:
+            if not isinstance(challenge, Challenge) or not challenge.id:
+                continue
+            try:
+                row = challenge_row(challenge, now_iso)
+                entries = self._task_entries(challenge.id, [(task_dump(t), t.tag_names) for t in challenge.tasks], now_iso)
+            except Exception as item_e:
+                log.error(f"Failed preparing chal {challenge.id} for archive DB: {item_e}")
+                continue
+            challenge_params.append(row)
+            task_params[challenge.id] = entries
 
-        return success_count
+        log.info(f"Archiving {len(challenge_params)} challenges to DB...")
+        with self._lock:
+            conn = self._get_conn()
+            if not conn:
+                log.error("Cannot archive challenges, DB connection failed.")
+                return 0
+            try:
+                with conn:  # One transaction; rolls back on error
+                    stats = self._apply_batch(conn, challenge_params, task_params, now_iso)
+            except sqlite3.Error as e:
+                log.exception(f"Failed saving challenges archive batch: {e}")
+                return 0
+        log.info(f"Archived {len(challenge_params)}/{len(challenges)} challenges: {stats}")
+        return len(challenge_params)
 
     def get_archived_challenge(self, challenge_id: str) -> Challenge | None:
-        """Retrieves a single challenge from the archive DB."""
-        conn = self._get_conn();
-        if not conn: return None
-        challenge_instance = None
-        try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM challenges_archive WHERE id = ?", (challenge_id,))
-            row = cursor.fetchone()
-            if row:
-                 challenge_instance = self._deserialize_challenge(row)
-                 log.debug(f"Retrieved challenge '{challenge_id}' from archive.")
-            else:
-                 log.debug(f"Challenge '{challenge_id}' not found in archive.")
-        except sqlite3.Error as e:
-            log.exception(f"Failed get archived challenge {challenge_id}: {e}")
-        # finally: self._close_db_conn() # Keep open potentially? Close for now.
-        return challenge_instance
+        """Retrieves a single challenge, with its tasks, from the archive DB."""
+        with self._lock:
+            conn = self._get_conn()
+            if not conn:
+                return None
+            try:
+                row = conn.execute(SELECT_CHALLENGE_SQL, (challenge_id,)).fetchone()
+                task_data = [r["data_json"] for r in conn.execute(SELECT_TASK_DATA_SQL, (challenge_id,))] if row else []
+            except sqlite3.Error as e:
+                log.exception(f"Failed get archived challenge {challenge_id}: {e}")
+                return None
+        if not row:
+            log.debug(f"Challenge '{challenge_id}' not found in archive.")
+            return None
+        log.debug(f"Retrieved challenge '{challenge_id}' from archive.")
+        return self._deserialize_challenge(row, task_data)
 
     def load_all_challenges_from_archive(self) -> Dict[str, Challenge]:
-         """Loads all challenges from the archive DB into a dictionary."""
-         log.info("Loading all challenges from archive DB...")
-         all_challenges = {}
-         conn = self._get_conn()
-         if not conn:
-             return {}
-         try:
-              cursor = conn.cursor()
-              cursor.execute("SELECT * FROM challenges_archive ORDER BY last_archived_at DESC")
-              rows = cursor.fetchall()
-              for row in rows:
-                   challenge = self._deserialize_challenge(row)
-                   if challenge and challenge.id:
-                       all_challenges[challenge.id] = challenge
-              log.info(f"Loaded {len(all_challenges)} challenges from archive DB.")
-         except sqlite3.Error as e:
-              log.exception("Failed to load all challenges from archive DB.")
-         finally:
-              self._close_db_conn() # Close after potentially large load
-         return all_challenges
-
-
-    # --- Add methods for archiving/retrieving other items (e.g., Todos) ---
-    # def archive_todo(self, todo: Todo) -> bool: ...
-    # def get_archived_todos(self, ...) -> List[Todo]: ...
+        """Loads all challenges from the archive DB into a dictionary (see `iter_challenges` to stream instead)."""
+        log.info("Loading all challenges from archive DB...")
+        all_challenges = {challenge.id: challenge for challenge in self.iter_challenges()}
+        log.info(f"Loaded {len(all_challenges)} challenges from archive DB.")
+        return all_challenges
+
+    # --- Streaming ---
+
+    def _fetch_page(
+        self, columns: Sequence[str], filters: ChallengeFilter | None, after_id: str | None, page_size: int, with_tasks: bool
+    ) -> tuple[list[sqlite3.Row], dict[str, list[str]]]:
+        """Fetches one keyset page of challenge rows (ordered by id) and, optionally, their task data."""
+        unknown = [column for column in columns if column not in CHALLENGE_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown challenge columns: {', '.join(unknown)}")
+        clauses, params = (filters or ChallengeFilter()).to_sql()
+        if after_id is not None:
+            clauses.append("c.id > ?")
+            params.append(after_id)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT {', '.join(f'c.{column}' for column in columns)} FROM challenges c {where} ORDER BY c.id LIMIT ?"
+
+        with self._lock:
+            conn = self._get_conn()
+            if not conn:
+                return [], {}
+            rows = conn.execute(sql, (*params, page_size)).fetchall()
+            task_data: dict[str, list[str]] = {}
+            if with_tasks and rows:
+                for task_row in self._select_in(conn, SELECT_PAGE_TASK_DATA_SQL, [row["id"] for row in rows]):
+                    task_data.setdefault(task_row["challenge_id"], []).append(task_row["data_json"])
+        return rows, task_data
+
+    def _challenges_from_page(self, rows: list[sqlite3.Row], task_data: dict[str, list[str]]) -> Iterator[Challenge]:
+        for row in rows:
+            challenge = self._deserialize_challenge(row, task_data.get(row["id"]))
+            if challenge and challenge.id:
+                yield challenge
+
+    def iter_challenges(
+        self, filters: ChallengeFilter | None = None, with_tasks: bool = True, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[Challenge]:
+        """Streams archived challenges, ordered by ID, one page at a time.
+
+        Args:
+            filters: Conditions applied in SQL.
+            with_tasks: Also load each challenge's archived tasks (one extra query per page).
+            page_size: Challenges fetched per query.
+
+        Yields:
+            Validated Challenge objects.
+        """
+        after_id: str | None = None
+        while True:
+            rows, task_data = self._fetch_page(CHALLENGE_COLUMNS, filters, after_id, page_size, with_tasks)
+            yield from self._challenges_from_page(rows, task_data)
+            if len(rows) < page_size:
+                return
+            after_id = rows[-1]["id"]
+
+    def iter_challenge_rows(
+        self, columns: Sequence[str] = SUMMARY_COLUMNS, filters: ChallengeFilter | None = None, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[dict[str, Any]]:
+        """Streams projected challenge rows as plain dicts, without model validation or tasks.
+
+        Args:
+            columns: Columns of the `challenges` table to return; must include "id".
+            filters: Conditions applied in SQL.
+            page_size: Rows fetched per query.
+
+        Raises:
+            ValueError: If a column is unknown or "id" is missing.
+        """
+        if "id" not in columns:
+            raise ValueError('Projected columns must include "id" (used for paging).')
+        after_id: str | None = None
+        while True:
+            rows, _ = self._fetch_page(columns, filters, after_id, page_size, with_tasks=False)
+            yield from (dict(row) for row in rows)
+            if len(rows) < page_size:
+                return
+            after_id = rows[-1]["id"]
+
+    def find_archived_tasks(
+        self,
+        task_type: str | None = None,
+        tag: str | None = None,
+        challenge_id: str | None = None,
+        leader_id: str | None = None,
+        group_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Queries archived challenge tasks in SQL, without deserializing challenges.
+
+        Args:
+            task_type: 'habit', 'daily', 'todo' or 'reward'.
+            tag: Tag ID or tag name the task must carry.
+            challenge_id: Restrict to one challenge.
+            leader_id: Restrict to challenges led by this user.
+            group_id: Restrict to challenges of this group.
+
+        Returns:
+            Task rows as dicts (columns of `challenge_tasks` plus `challenge_name`), without `data_json`.
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if task_type:
+            clauses.append("t.type = ?")
+            params.append(task_type)
+        if challenge_id:
+            clauses.append("t.challenge_id = ?")
+            params.append(challenge_id)
+        if leader_id:
+            clauses.append("c.leader_id = ?")
+            params.append(leader_id)
+        if group_id:
+            clauses.append("c.group_id = ?")
+            params.append(group_id)
+        if tag:
+            clauses.append(
+                "EXISTS (SELECT 1 FROM challenge_task_tags g WHERE g.challenge_id = t.challenge_id AND g.task_id = t.task_id AND (g.tag_id = ? OR g.tag_name = ?))"
+            )
+            params.extend((tag, tag))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        columns = ", ".join(f"t.{column}" for column in TASK_COLUMNS if column != "data_json")
+        sql = (
+            f"SELECT {columns}, c.name AS challenge_name FROM challenge_tasks t JOIN challenges c ON c.id = t.challenge_id "
+            f"{where} ORDER BY c.created_at, t.challenge_id, t.position"
+        )
+
+        with self._lock:
+            conn = self._get_conn()
+            if not conn:
+                return []
+            try:
+                return [dict(row) for row in conn.execute(sql, params)]
+            except sqlite3.Error as e:
+                log.exception(f"Failed querying archived tasks: {e}")
+                return []
+
+    def get_change_log(self, challenge_id: str | None = None, since: datetime | None = None, limit: int = 200) -> list[dict[str, Any]]:
+        """Gets recorded archive changes, newest first.
+
+        Args:
+            challenge_id: Restrict to one challenge (its own and its tasks' changes).
+            since: Only changes at or after this time.
+            limit: Maximum number of entries.
+
+        Returns:
+            Dicts with changed_at, challenge_id, task_id (None for the challenge row),
+            change ('added', 'updated' or 'removed') and fields (list, for updates).
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if challenge_id:
+            clauses.append("challenge_id = ?")
+            params.append(challenge_id)
+        if since:
+            clauses.append("changed_at >= ?")
+            params.append(since.astimezone(timezone.utc).isoformat())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT changed_at, challenge_id, task_id, change, fields FROM archive_changes {where} ORDER BY id DESC LIMIT ?"
+        with self._lock:
+            conn = self._get_conn()
+            if not conn:
+                return []
+            try:
+                rows = conn.execute(sql, (*params, limit)).fetchall()
+            except sqlite3.Error as e:
+                log.exception(f"Failed reading archive change log: {e}")
+                return []
+        return [{**dict(row), "fields": json.loads(row["fields"]) if row["fields"] else None} for row in rows]
+
+    # --- Full-text search ---
+
+    def search_challenges(self, query: str, limit: int = DEFAULT_LIMIT, highlight: tuple[str, str] = HIGHLIGHT) -> list[SearchHit]:
+        """Ranked full-text search over archived challenge names, summaries and descriptions."""
+        with self._lock:
+            conn = self._get_conn()
+            if not conn:
+                return []
+            try:
+                return search_challenges(conn, CHALLENGES_FTS, query, limit, highlight=highlight)
+            except sqlite3.Error as e:
+                log.exception(f"Archive challenge search failed for {query!r}: {e}")
+                return []
+
+    def search_tasks(
+        self,
+        query: str,
+        limit: int = DEFAULT_LIMIT,
+        task_type: str | None = None,
+        challenge_id: str | None = None,
+        highlight: tuple[str, str] = HIGHLIGHT,
+    ) -> list[SearchHit]:
+        """Ranked full-text search over archived task text, notes and checklist items."""
+        with self._lock:
+            conn = self._get_conn()
+            if not conn:
+                return []
+            try:
+                return search_tasks(conn, TASKS_FTS, query, limit, task_type=task_type, challenge_id=challenge_id, highlight=highlight)
+            except sqlite3.Error as e:
+                log.exception(f"Archive task search failed for {query!r}: {e}")
+                return []
+
+    def rebuild_search_index(self) -> None:
+        """Rebuilds the archive's FTS indexes from its tables (e.g. after manual edits)."""
+        with self._lock:
+            conn = self._get_conn()
+            if conn:
+                with conn:
+                    self._rebuild_search_index(conn)
+
+    # --- Task history (time series) ---
+
+    def archive_task_history(self, tasks: Iterable[Task]) -> int:
+        """Appends new history entries of habits and dailies, and completions of completed todos.
+
+        Only entries newer than the newest stored one per task are inserted. A habit's
+        entry for its newest stored day may have been updated in place since, so it
+        replaces the stored row when it differs. The weekly rollup gets the difference.
+        Task text, type and tags are refreshed where they changed, for per-tag rollups.
+
+        Returns:
+            Number of new or updated history entries.
+        """
+        now_iso = datetime.now(timezone.utc).isoformat()
+        meta: dict[str, tuple[Any, ...]] = {}
+        tag_rows: dict[str, list[tuple[Any, ...]]] = {}
+        entries: list[tuple[Any, ...]] = []
+        todos: list[tuple[Any, ...]] = []
+        for task in tasks:
+            if not isinstance(task, Task) or not task.id or task.type == "reward":
+                continue
+            rows = history_rows(task)
+            if not rows:
+                continue
+            names = list(task.tag_names)
+            tags = [(task.id, tag_id, names[i] if i < len(names) else None) for i, tag_id in enumerate(task.tags_id)]
+            challenge_id = task.challenge.challenge_id if task.challenge else None
+            meta[task.id] = (task.id, task.type, task.text, challenge_id, content_hash(sorted(tags)), now_iso)
+            tag_rows[task.id] = tags
+            entries.extend(rows)
+            if task.type == "todo":
+                completed_at = task.completed_date.astimezone(timezone.utc)
+                todos.append(
+                    (task.id, task.text, task.notes, task.priority, _iso(task.created_at), completed_at.isoformat(),
+                     completed_at.date().isoformat(), json.dumps(task_dump(task), ensure_ascii=False, sort_keys=True))
+                )  # fmt: skip
+        if not entries:
+            return 0
+
+        with self._lock:
+            conn = self._get_conn()
+            if not conn:
+                log.error("Cannot archive task history, DB connection failed.")
+                return 0
+            try:
+                with conn:
+                    ids = list(meta)
+                    # Bare `day` comes from the row holding MAX(ts)
+                    newest = {
+                        r[0]: (r[1], r[2])
+                        for r in self._select_in(conn, "SELECT task_id, MAX(ts), day FROM task_history WHERE task_id IN ({}) GROUP BY task_id", ids)
+                    }
+                    new_entries, replaced = self._new_history_entries(conn, entries, newest)
+                    stored_meta = {
+                        r["task_id"]: tuple(r)
+                        for r in self._select_in(conn, "SELECT task_id, type, text, challenge_id, tag_key FROM history_tasks WHERE task_id IN ({})", ids)
+                    }
+                    changed_meta = [row for task_id, row in meta.items() if stored_meta.get(task_id) != row[:-1]]
+                    conn.executemany(UPSERT_HISTORY_TASK_SQL, changed_meta)
+                    conn.executemany(DELETE_HISTORY_TAGS_SQL, [(row[0],) for row in changed_meta])
+                    conn.executemany(INSERT_HISTORY_TAG_SQL, [tag for row in changed_meta for tag in tag_rows[row[0]]])
+                    conn.executemany(DELETE_HISTORY_SQL, [(row[0], row[1]) for row in replaced])
+                    conn.executemany(INSERT_HISTORY_SQL, new_entries)
+                    conn.executemany(UPSERT_WEEKLY_SQL, weekly_rollup_rows(new_entries, removed=replaced))
+                    conn.executemany(UPSERT_COMPLETED_TODO_SQL, todos)
+            except sqlite3.Error as e:
+                log.exception(f"Failed archiving task history: {e}")
+                return 0
+        log.info(f"Archived {len(new_entries)} new or updated history entries ({len(replaced)} replaced) for {len(meta)} tasks.")
+        return len(new_entries)
+
+    @staticmethod
+    def _new_history_entries(
+        conn: sqlite3.Connection, entries: list[tuple[Any, ...]], newest: dict[str, tuple[int, str]]
+    ) -> tuple[list[tuple[Any, ...]], list[tuple[Any, ...]]]:
+        """Splits candidate rows into rows to insert and stored rows they replace.
+
+        Rows newer than the task's newest stored entry are inserted. A habit row for the
+        newest stored day replaces that day's stored rows unless it is identical to them.
+        """
+        new_entries: list[tuple[Any, ...]] = []
+        replaced: list[tuple[Any, ...]] = []
+        for row in entries:
+            task_id, ts, day, task_type = row[:4]
+            stored_ts, stored_day = newest.get(task_id, (-1, None))
+            if task_type == "habit" and day == stored_day:
+                day_start = _ms(datetime.fromisoformat(day).replace(tzinfo=timezone.utc))
+                stored_rows = [tuple(r) for r in conn.execute(SELECT_HISTORY_SINCE_SQL, (task_id, day_start))]
+                if stored_rows == [row]:
+                    continue
+                replaced.extend(stored_rows)
+                new_entries.append(row)
+            elif ts > stored_ts:
+                new_entries.append(row)
+        return new_entries, replaced
+
+    def archive_todo(self, todo: Task) -> bool:
+        """Archives one completed todo. Returns True if its completion was new."""
+        return self.archive_task_history([todo]) > 0
+
+    def _query(self, sql: str, params: Sequence[Any] = ()) -> list[sqlite3.Row]:
+        with self._lock:
+            conn = self._get_conn()
+            if not conn:
+                return []
+            try:
+                return conn.execute(sql, params).fetchall()
+            except sqlite3.Error as e:
+                log.exception(f"Archive query failed: {e}")
+                return []
+
+    @staticmethod
+    def _rollup_filter(
+        task_type: str | None, task_id: str | None, since: date | datetime | None, until: date | datetime | None
+    ) -> tuple[list[str], list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if task_type:
+            clauses.append("w.type = ?")
+            params.append(task_type)
+        if task_id:
+            clauses.append("w.task_id = ?")
+            params.append(task_id)
+        if since:
+            clauses.append("w.week >= ?")
+            params.append(week_of(since))
+        if until:
+            clauses.append("w.week < ?")
+            params.append(week_of(until))
+        return clauses, params
+
+    def completion_rate_by_week(
+        self,
+        task_type: str | None = None,
+        task_id: str | None = None,
+        tag: str | None = None,
+        since: date | datetime | None = None,
+        until: date | datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Weekly totals from the rollup table, oldest week first.
+
+        Args:
+            task_type: 'habit', 'daily' or 'todo'.
+            task_id: Restrict to one task.
+            tag: Tag ID or name the task carries.
+            since: First week included (the week containing this date).
+            until: Weeks before the week containing this date.
+
+        Returns:
+            Dicts with week (Monday, ISO), tasks and the ROLLUP_COUNTS sums, plus
+            completion_rate and up_ratio (see `with_rates`).
+        """
+        clauses, params = self._rollup_filter(task_type, task_id, since, until)
+        if tag:
+            clauses.append("w.task_id IN (SELECT task_id FROM history_task_tags WHERE tag_id = ? OR tag_name = ?)")
+            params.extend((tag, tag))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sums = ", ".join(f"SUM(w.{c}) AS {c}" for c in ROLLUP_COUNTS)
+        sql = f"SELECT w.week, COUNT(DISTINCT w.task_id) AS tasks, {sums} FROM task_history_weekly w {where} GROUP BY w.week ORDER BY w.week"
+        return [with_rates(row) for row in self._query(sql, params)]
+
+    def completion_rate_by_tag(
+        self, task_type: str | None = None, since: date | datetime | None = None, until: date | datetime | None = None
+    ) -> list[dict[str, Any]]:
+        """Totals per tag over a period, from the rollup table.
+
+        Returns:
+            Dicts with tag_id, tag_name, tasks and the ROLLUP_COUNTS sums, plus rates; sorted by tag name.
+        """
+        clauses, params = self._rollup_filter(task_type, None, since, until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sums = ", ".join(f"SUM(w.{c}) AS {c}" for c in ROLLUP_COUNTS)
+        sql = (
+            f"SELECT g.tag_id, MAX(g.tag_name) AS tag_name, COUNT(DISTINCT w.task_id) AS tasks, {sums} "
+            f"FROM task_history_weekly w JOIN history_task_tags g ON g.task_id = w.task_id {where} "
+            "GROUP BY g.tag_id ORDER BY tag_name"
+        )
+        return [with_rates(row) for row in self._query(sql, params)]
+
+    def get_task_history(self, task_id: str, since: datetime | None = None, until: datetime | None = None) -> list[dict[str, Any]]:
+        """Raw history entries of one task, oldest first (`ts` in Unix ms)."""
+        clauses, params = ["task_id = ?"], [task_id]
+        if since:
+            clauses.append("ts >= ?")
+            params.append(_ms(since))
+        if until:
+            clauses.append("ts < ?")
+            params.append(_ms(until))
+        sql = f"SELECT {', '.join(HISTORY_COLUMNS)} FROM task_history WHERE {' AND '.join(clauses)} ORDER BY ts"
+        return [dict(row) for row in self._query(sql, params)]
+
+    def get_archived_todos(self, since: date | datetime | None = None, tag: str | None = None, limit: int | None = None) -> list[dict[str, Any]]:
+        """Archived completed todos, most recently completed first (without `data_json`)."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        if since:
+            clauses.append("t.day >= ?")
+            params.append((since.astimezone(timezone.utc).date() if isinstance(since, datetime) else since).isoformat())
+        if tag:
+            clauses.append("t.task_id IN (SELECT task_id FROM history_task_tags WHERE tag_id = ? OR tag_name = ?)")
+            params.extend((tag, tag))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT t.task_id, t.text, t.notes, t.priority, t.created_at, t.completed_at, t.day FROM completed_todos t {where} ORDER BY t.completed_at DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [dict(row) for row in self._query(sql, params)]
+
+    # --- Async wrappers (dedicated DB thread) ---
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Runs a blocking archive operation on the DB thread."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pixabit-archive")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def archive_challenges_async(self, challenges: list[Challenge]) -> int:
+        return await self._run(self.archive_challenges, challenges)
+
+    async def get_archived_challenge_async(self, challenge_id: str) -> Challenge | None:
+        return await self._run(self.get_archived_challenge, challenge_id)
+
+    async def load_all_challenges_from_archive_async(self) -> Dict[str, Challenge]:
+        return await self._run(self.load_all_challenges_from_archive)
+
+    async def aiter_challenges(
+        self, filters: ChallengeFilter | None = None, with_tasks: bool = True, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[Challenge]:
+        """Async counterpart of `iter_challenges`; each page is fetched and validated on the DB thread."""
+        after_id: str | None = None
+        while True:
+            rows, task_data = await self._run(self._fetch_page, CHALLENGE_COLUMNS, filters, after_id, page_size, with_tasks)
+            # The generator is consumed (and challenges validated) on the DB thread
+            for challenge in await self._run(list, self._challenges_from_page(rows, task_data)):
+                yield challenge
+            if len(rows) < page_size:
+                return
+            after_id = rows[-1]["id"]
+
+    async def aiter_challenge_rows(
+        self, columns: Sequence[str] = SUMMARY_COLUMNS, filters: ChallengeFilter | None = None, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Async counterpart of `iter_challenge_rows`."""
+        if "id" not in columns:
+            raise ValueError('Projected columns must include "id" (used for paging).')
+        after_id: str | None = None
+        while True:
+            rows, _ = await self._run(self._fetch_page, columns, filters, after_id, page_size, False)
+            for row in rows:
+                yield dict(row)
+            if len(rows) < page_size:
+                return
+            after_id = rows[-1]["id"]
+
+    async def find_archived_tasks_async(self, **filters: Any) -> list[dict[str, Any]]:
+        return await self._run(self.find_archived_tasks, **filters)
+
+    async def search_challenges_async(self, query: str, **options: Any) -> list[SearchHit]:
+        return await self._run(self.search_challenges, query, **options)
+
+    async def search_tasks_async(self, query: str, **options: Any) -> list[SearchHit]:
+        return await self._run(self.search_tasks, query, **options)
+
+    async def archive_task_history_async(self, tasks: Iterable[Task]) -> int:
+        return await self._run(self.archive_task_history, list(tasks))
+
+    async def completion_rate_by_week_async(self, **filters: Any) -> list[dict[str, Any]]:
+        return await self._run(self.completion_rate_by_week, **filters)
+
+    async def completion_rate_by_tag_async(self, **filters: Any) -> list[dict[str, Any]]:
+        return await self._run(self.completion_rate_by_tag, **filters)
+
+    async def get_task_history_async(self, task_id: str, **filters: Any) -> list[dict[str, Any]]:
+        return await self._run(self.get_task_history, task_id, **filters)
+
+    async def get_change_log_async(self, **filters: Any) -> list[dict[str, Any]]:
+        return await self._run(self.get_change_log, **filters)
+
+    async def close_async(self) -> None:
+        """Closes the connection on the DB thread, then stops the thread."""
+        await self._run(self._close_db_conn)
+        self.close()
 
     def close(self):
         """Closes database connections and performs cleanup."""
-        log.info("Closing DataManager resources...")
+        log.info("Closing Archiver resources...")
         self._close_db_conn()
-        # Add other cleanup if needed
-        log.info("DataManager closed.")
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        log.info("Archiver closed.")
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -83,11 +83,8 @@ class ChallengeService:
 
             # Create challenge list from API data
             challenge_list = ChallengeList.from_raw_data(challenges_data, context=validation_context)
-            for challenge in challenge_list:
-                if challenge.id in self.dm.user.challenges:
-                    challenge.joined = True
-                else:
-                    challenge.joined = False
+            if self.dm.user:
+                challenge_list.set_joined(self.dm.user.challenges)
             log.info(f"Successfully fetched {len(challenge_list.challenges) if challenge_list else 0} challenges from API.")
             return challenge_list
         except Exception as e:
@@ -189,17 +186,15 @@ class ChallengeService:
             # 2. Update local cache if challenge exists
             challenge_list = self.get_cached_challenges()
             if challenge_list:
-                challenge = challenge_list.get_by_id(challenge_id)
-                if challenge:
-                    challenge.joined = True
+                if challenge_list.mark_joined(challenge_id, True):
                     log.info(f"Updated local cache: challenge '{challenge_id}' is now joined.")
                 else:
                     log.info(f"Challenge '{challenge_id}' not found in local cache. Will be updated on next fetch.")
 
-            # 3. Fetch and merge challenge tasks into user tasks
-            tasks = await self.fetch_challenge_tasks(challenge_id)
-            if tasks:
-                log.info(f"Added {len(tasks)} tasks from challenge '{challenge_id}' to local task list.")
+            # 3. The server copied the challenge's tasks into the user's: refetch only user and tasks
+            if await self.dm.invalidate("user", "tasks"):
+                linked = len(self.dm.tasks.task_ids_for_challenge(challenge_id)) if self.dm.tasks else 0
+                log.info(f"Reloaded tasks: {linked} tasks of challenge '{challenge_id}' now in local task list.")
 
             return True
         except ValueError as ve:
@@ -239,18 +234,9 @@ class ChallengeService:
                 log.error(f"API call to leave challenge '{challenge_id}' failed.")
                 return False
 
-            # 2. Update local cache if challenge exists
-            if challenge_list:
-                existing_challenge = challenge_list.get_by_id(challenge_id)
-                if existing_challenge:
-                    existing_challenge.joined = False
-                    log.info(f"Updated local cache: challenge '{challenge_id}' is now left.")
-
-            # 3. Remove challenge tasks from task list if keep is "remove-all"
-            if keep == "remove-all" and self.dm.tasks:
-                # This would require a method to identify and remove challenge tasks
-                # Consider adding this functionality to the TaskList class
-                log.info(f"Tasks from challenge '{challenge_id}' should be removed from local task list.")
+            # 2. Update user, challenge and its tasks locally (removed, or kept without the challenge link)
+            changed = self.dm.apply_challenge_leave(challenge_id, keep)
+            log.info(f"Updated local cache: challenge '{challenge_id}' is now left ({changed} tasks {'removed' if keep == 'remove-all' else 'unlinked'}).")
 
             return True
         except ValueError as ve:
@@ -296,7 +282,7 @@ class ChallengeService:
                 new_challenge = temp_list.challenges[0] if temp_list.challenges else None
 
                 if new_challenge:
-                    challenge_list.add_challenge(new_challenge)  # Assumes implementation of add_challenge
+                    self.dm.apply_challenge_update(new_challenge)
                     log.info(f"Successfully created and cached challenge: {new_challenge}")
                     return new_challenge
                 else:
@@ -346,23 +332,17 @@ class ChallengeService:
                 log.error(f"API call to update challenge '{challenge_id}' did not return data.")
                 return None
 
-            # 2. Update local cache if challenge exists
-            if existing_challenge:
-                existing_challenge.model_validate(updated_data, update=True)
-                log.info(f"Successfully updated cached challenge: {existing_challenge}")
-                return existing_challenge
-            else:
-                # Create a new Challenge object with the updated data
-                user_id_context = self.dm.user.id if self.dm.user else None
-                context = {"current_user_id": user_id_context}
-                temp_list = ChallengeList.from_raw_data([updated_data], context=context)
-                new_challenge = temp_list.challenges[0] if temp_list.challenges else None
+            # 2. Replace (or add) the cached challenge; it is relinked to the current tasks
+            user_id_context = self.dm.user.id if self.dm.user else None
+            context = {"current_user_id": user_id_context}
+            temp_list = ChallengeList.from_raw_data([updated_data], context=context)
+            new_challenge = temp_list.challenges[0] if temp_list.challenges else None
 
-                if new_challenge and challenge_list:
-                    challenge_list.add_challenge(new_challenge)  # Assumes implementation of add_challenge
-                    log.info(f"Added updated challenge to cache: {new_challenge}")
+            if new_challenge and challenge_list:
+                self.dm.apply_challenge_update(new_challenge)
+                log.info(f"{'Updated cached' if existing_challenge else 'Added updated'} challenge: {new_challenge}")
 
-                return new_challenge
+            return new_challenge
 
         except ValueError as ve:
             log.error(f"Input validation error updating challenge: {ve}")
@@ -412,20 +392,15 @@ class ChallengeService:
                 return None
 
             # 2. Add task to main TaskList cache
-            new_task_instance = task_list.add_task(new_task_data)
+            new_task_instance = self.dm.apply_task_update(new_task_data)
             if not new_task_instance:
                 log.error("Failed to add created challenge task to local TaskList.")
                 # API created task, but local cache failed. Inconsistent.
                 return None
 
-            # 3. Add task reference to Challenge's task list if challenge exists in cache
+            # 3. Link the task to the cached challenge (no-op if the TaskList index already did)
             if challenge:
-                # Ensure challenge tasks are initialized
-                if not hasattr(challenge, "tasks") or not challenge.tasks:
-                    challenge.tasks = []
-                # Avoid duplicates if already added via some other means
-                if new_task_instance.id not in [task.id for task in challenge.tasks]:
-                    challenge.tasks.append(new_task_instance)
+                challenge.add_task(new_task_instance)
 
             log.info(f"Successfully created task '{new_task_instance.id}' in challenge '{challenge_id}' and cached.")
             return new_task_instance
@@ -463,8 +438,8 @@ class ChallengeService:
             # Create challenge list from API data
             challenge_list = ChallengeList.from_raw_data(challenges_data, context=validation_context)
 
-            # Update data manager's challenge list
-            self.dm.challenges = challenge_list
+            # Update data manager's challenge list (relinks tasks and joined flags)
+            self.dm.set_challenges(challenge_list)
             log.info(f"Successfully refreshed {len(challenge_list.challenges) if challenge_list else 0} challenges in cache.")
 
             return challenge_list
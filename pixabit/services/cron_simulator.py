@@ -0,0 +1,216 @@
+# pixabit/services/cron_simulator.py
+
+# SECTION: MODULE DOCSTRING
+"""Simulates the outcome of the next cron for hypothetical sets of checked dailies.
+
+A scenario is a boolean row saying which pending dailies get checked before cron.
+Damage per daily is independent and additive, so each daily's contribution is
+forecast once with `forecast_daily_damage` and scenario totals are a single
+matrix product. Hundreds of dailies times thousands of scenarios stay in the
+millisecond range.
+
+Boss damage is the user's own contribution; missed dailies of other party
+members are unknown here and not included. Likewise, quest progress per scenario
+adds the boss damage of each checked daily (`delta * (1 + STR / 200)`) to the
+user's pending progress, with the same matrix product.
+"""
+
+# SECTION: IMPORTS
+from __future__ import annotations
+
+from itertools import combinations
+from math import comb
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from pixabit.helpers._damage import daily_deltas, forecast_daily_damage
+from pixabit.helpers._logger import log
+from pixabit.helpers._scoring import STR_QUEST_BONUS
+from pixabit.models.task import Daily, damage_context
+
+if TYPE_CHECKING:
+    from pixabit.models.party import Party
+    from pixabit.models.task import TaskList
+    from pixabit.models.user import User
+
+# SECTION: CONSTANTS
+MAX_ENUMERATED_SCENARIOS = 200_000  # Guard for combinations() enumeration
+
+
+# SECTION: CLASSES
+
+
+# KLASS: CronOutcome
+class CronOutcome(NamedTuple):
+    """Batched cron forecast; arrays are indexed by scenario (and daily, for 2-D ones)."""
+
+    checked: np.ndarray  # (scenarios, dailies) bool
+    user_damage: np.ndarray  # (scenarios,) HP lost from own missed dailies
+    boss_damage: np.ndarray  # (scenarios,) HP the boss deals to the party
+    hp_after: np.ndarray  # (scenarios,) HP after both kinds of damage
+    survives: np.ndarray  # (scenarios,) bool, hp_after > 0
+    streaks_after: np.ndarray  # (scenarios, dailies) int
+    boss_hp_after: np.ndarray | None  # (scenarios,) Boss HP after pending and checked-daily progress, None if no boss quest
+    quest_progress: np.ndarray | None  # (scenarios,) Fraction of boss HP depleted after cron, None if no boss quest
+
+
+# KLASS: CronSimulator
+class CronSimulator:
+    """Batch what-if engine for the next cron.
+
+    Built once from the pending dailies and the user's state, then evaluates any
+    number of completion scenarios without touching the models again.
+    """
+
+    def __init__(self, dailies: Sequence[Daily], user: User, party: Party | None = None):
+        """Initializes the simulator.
+
+        Args:
+            dailies: Dailies to consider; only due, uncompleted ones are kept.
+            user: The user, with `calculate_effective_stats` already run.
+            party: The loaded party (for boss strength and quest progress).
+        """
+        self.dailies: list[Daily] = [daily for daily in dailies if daily.is_pending]
+        self.index: dict[str, int] = {daily.id: i for i, daily in enumerate(self.dailies)}
+        self.hp = float(user.hp)
+        self.streaks = np.fromiter((daily.streak for daily in self.dailies), dtype=np.int64, count=len(self.dailies))
+
+        context = damage_context(user, party)
+        self.deals_damage = context is not None
+        con, self.boss_strength = context if context else (0.0, 0.0)
+
+        count = len(self.dailies)
+        values = np.fromiter((daily.value for daily in self.dailies), dtype=np.float64, count=count)
+        forecast = forecast_daily_damage(
+            values,
+            np.fromiter((daily.priority for daily in self.dailies), dtype=np.float64, count=count),
+            np.fromiter((daily.calculate_checklist_progress(daily.checklist) for daily in self.dailies), dtype=np.float64, count=count),
+            con,
+            self.boss_strength,
+        )
+        scale = 1.0 if self.deals_damage else 0.0
+        self.user_damage: np.ndarray = forecast.user * scale
+        self.boss_damage: np.ndarray = forecast.party * scale
+
+        # Boss HP once the already pending progress lands, and each daily's extra hit if checked
+        self.boss_hp, self.boss_max_hp = self._boss_hp_after_pending(user, party)
+        if self.boss_hp is not None:
+            strength = float(user.effective_stats.get("str", 0.0))
+            self.quest_up: np.ndarray = daily_deltas(values, 0.0) * (1.0 + strength * STR_QUEST_BONUS)
+        else:
+            self.quest_up = np.zeros(count, dtype=np.float64)
+
+    @classmethod
+    def from_task_list(cls, task_list: TaskList, user: User, party: Party | None = None) -> CronSimulator:
+        """Creates a simulator over the pending dailies of a TaskList."""
+        return cls(task_list.pending_dailies(), user, party)
+
+    @staticmethod
+    def _boss_hp_after_pending(user: User, party: Party | None) -> tuple[float | None, float | None]:
+        """Applies the user's pending boss progress to the party boss HP.
+
+        Returns:
+            (boss HP after pending progress, boss max HP), or (None, None) if no boss quest is active.
+        """
+        quest = getattr(party, "quest", None)
+        static_quest = getattr(party, "static_quest_details", None)
+        if not quest or not quest.is_active_and_ongoing or not static_quest or not static_quest.boss:
+            return None, None
+        user_quest = getattr(user.party, "quest", None)
+        pending_up = user_quest.progress.up if user_quest else 0.0
+        current_hp = quest.progress.hp if quest.progress.hp is not None else static_quest.boss.hp
+        return max(0.0, current_hp - pending_up), float(static_quest.boss.hp)
+
+    # --- Scenario construction ---
+
+    def scenarios_from_ids(self, checked_id_sets: Iterable[Iterable[str]]) -> np.ndarray:
+        """Builds a (scenarios, dailies) checked matrix from sets of daily IDs; unknown IDs are ignored."""
+        id_sets = list(checked_id_sets)
+        checked = np.zeros((len(id_sets), len(self.dailies)), dtype=bool)
+        for row, ids in enumerate(id_sets):
+            columns = [self.index[task_id] for task_id in ids if task_id in self.index]
+            checked[row, columns] = True
+        return checked
+
+    def scenarios_choose(self, k: int) -> np.ndarray:
+        """Builds every scenario that checks exactly `k` of the pending dailies.
+
+        Raises:
+            ValueError: If the number of combinations exceeds MAX_ENUMERATED_SCENARIOS.
+        """
+        count = len(self.dailies)
+        k = max(0, min(k, count))
+        total = comb(count, k)
+        if total > MAX_ENUMERATED_SCENARIOS:
+            raise ValueError(f"{total} scenarios for choosing {k} of {count} dailies exceeds {MAX_ENUMERATED_SCENARIOS}")
+        picks = np.fromiter((i for combo in combinations(range(count), k) for i in combo), dtype=np.int64, count=total * k)
+        checked = np.zeros((total, count), dtype=bool)
+        checked[np.repeat(np.arange(total), k), picks] = True
+        return checked
+
+    # --- Simulation ---
+
+    def simulate(self, checked: ArrayLike) -> CronOutcome:
+        """Evaluates completion scenarios in one batch.
+
+        Args:
+            checked: Boolean matrix (scenarios, dailies), or a single 1-D row,
+                     marking dailies checked before cron (column order = `self.dailies`).
+
+        Returns:
+            The CronOutcome for every scenario.
+        """
+        checked = np.atleast_2d(np.asarray(checked, dtype=bool))
+        if checked.shape[1] != len(self.dailies):
+            raise ValueError(f"Expected {len(self.dailies)} columns, got {checked.shape[1]}")
+        missed = (~checked).astype(np.float64)
+        user_damage = missed @ self.user_damage
+        boss_damage = missed @ self.boss_damage
+        hp_after = np.maximum(0.0, self.hp - user_damage - boss_damage)
+        boss_hp_after = quest_progress = None
+        if self.boss_hp is not None:
+            boss_hp_after = np.maximum(0.0, self.boss_hp - checked.astype(np.float64) @ self.quest_up)
+            if self.boss_max_hp:
+                quest_progress = 1.0 - boss_hp_after / self.boss_max_hp
+        return CronOutcome(
+            checked=checked,
+            user_damage=user_damage,
+            boss_damage=boss_damage,
+            hp_after=hp_after,
+            survives=hp_after > 0.0,
+            streaks_after=np.where(checked, self.streaks + 1, 0),
+            boss_hp_after=boss_hp_after,
+            quest_progress=quest_progress,
+        )
+
+    def simulate_none_checked(self) -> CronOutcome:
+        """Forecast if no further dailies are checked before cron."""
+        return self.simulate(np.zeros(len(self.dailies), dtype=bool))
+
+    # --- Recommendations ---
+
+    def best_checks(self, k: int) -> list[Daily]:
+        """Returns the `k` dailies whose checking prevents the most HP loss.
+
+        Contributions are additive, so the top-k by damage is optimal for any `k`.
+        """
+        order = np.argsort(-(self.user_damage + self.boss_damage), kind="stable")
+        return [self.dailies[i] for i in order[: max(0, k)]]
+
+    def min_checks_to_survive(self) -> list[Daily] | None:
+        """Returns the smallest set of dailies to check so HP stays above zero.
+
+        Returns:
+            The dailies to check (possibly empty), or None if the user is at 0 HP already.
+        """
+        if self.hp <= 0:
+            return None
+        contributions = self.user_damage + self.boss_damage
+        order = np.argsort(-contributions, kind="stable")
+        # remaining[k] = damage taken when the top-k dailies are checked
+        remaining = contributions.sum() - np.concatenate(([0.0], np.cumsum(contributions[order])))
+        k = int(np.argmax(self.hp - remaining > 0.0))
+        log.debug(f"CronSimulator: {k} of {len(self.dailies)} dailies must be checked to survive.")
+        return [self.dailies[i] for i in order[:k]]
@@ -8,13 +8,20 @@
 """Provides a DataManager class for loading, caching (live data as files), processing,
 and accessing current Habitica Pydantic models (User, Tasks, Tags, Party, Challenges).
 Coordinates API client, static content manager, and models. Persistent archiving
-is handled by a separate Archiver class.
+is handled by a separate Archiver class; after each processing pass, new habit and
+daily history entries and completed todos are appended to its time-series tables.
+
+After a mutation, services patch the loaded models with the API response
+(`apply_task_update`, `apply_tag_delete`, ...) or refetch single models
+(`invalidate("party")`) instead of reloading everything; derived data (tag names,
+daily damage, challenge links) is recomputed for the affected entities only.
 """
 
 # SECTION: IMPORTS
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Mapping
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Coroutine, Dict, Type
@@ -32,6 +39,10 @@ from pixabit.models.party import Party
 from pixabit.models.tag import Tag, TagList
 from pixabit.models.task import AnyTask, Task, TaskList  # Need Task for user calc type hints if used
 from pixabit.models.user import User
+from pixabit.services.archiver import ARCHIVE_DB_FILENAME, Archiver
+from pixabit.services.history_analytics import HistoryAnalytics
+from pixabit.services.message_sync import MessageSync, group_stream
+from pixabit.services.stats_recorder import STATS_DB_FILENAME, StatsRecorder
 
 # SECTION: CONSTANTS & CONFIG
 
@@ -39,6 +50,8 @@ DEFAULT_LIVE_CACHE_TIMEOUT = timedelta(minutes=5)
 DEFAULT_CHALLENGE_CACHE_TIMEOUT = timedelta(hours=2)
 CACHE_SUBDIR_RAW = "raw"
 CACHE_SUBDIR_PROCESSED = "processed"
+CACHE_SUBDIR_MESSAGES = "messages"
+PARTY_CHAT_STREAM = group_stream("party")
 
 
 # SECTION: DATA MANAGER CLASS
@@ -82,6 +95,13 @@ class DataManager:
         self._party: Party | None = None
         self._challenges: ChallengeList | None = None
 
+        # Persistent chat/inbox history, synced incrementally
+        self.message_sync = MessageSync(self.api, self.cache_dir / CACHE_SUBDIR_MESSAGES, current_user_id=USER_ID)
+        self._archiver: Archiver | None = None  # Opened on first use
+        # hp/mp/exp/gp/lvl trend, sampled on each user API fetch and score
+        self.stats_recorder = StatsRecorder(self.cache_dir / STATS_DB_FILENAME)
+        self._history_analytics: tuple[TaskList, int, HistoryAnalytics] | None = None  # (TaskList, its version, analytics)
+
         self._last_refresh_times: dict[str, datetime | None] = {
             "user": None,
             "tasks": None,
@@ -91,6 +111,31 @@ class DataManager:
         }
         log.info(f"DataManager initialized. Cache Dir: {self.cache_dir}")
 
+    @property
+    def archiver(self) -> Archiver:
+        """Persistent archive (challenges, task history, completed todos) in the cache dir."""
+        if self._archiver is None:
+            self._archiver = Archiver(self.cache_dir / ARCHIVE_DB_FILENAME)
+        return self._archiver
+
+    def record_user_stats(self, source: str = "refresh") -> None:
+        """Appends the current user stats to the stats time series."""
+        if self._user:
+            self.stats_recorder.record(self._user.stats, source)
+
+    def history_analytics(self) -> HistoryAnalytics | None:
+        """Streak/completion analytics over habit and daily history, rebuilt only when the tasks changed.
+
+        Keyed on the TaskList object as well as its version: every load builds a new
+        TaskList whose version counter starts over.
+        """
+        if not self._tasks:
+            return None
+        cached = self._history_analytics
+        if cached is None or cached[0] is not self._tasks or cached[1] != self._tasks.version:
+            cached = self._history_analytics = (self._tasks, self._tasks.version, HistoryAnalytics.from_task_list(self._tasks))
+        return cached[2]
+
     # --- Cache Helper ---
     def _is_live_cache_stale(self, data_key: str) -> bool:
         """Checks if the LIVE cache for a specific data key is stale."""
@@ -143,16 +188,16 @@ class DataManager:
 
     # --- Static data access (unchanged) ---
     @property
-    def static_gear_data(self) -> dict[str, Gear] | None:
-        """Returns cached static gear data directly from the StaticContentManager (if loaded)."""
+    def static_gear_data(self) -> Mapping[str, Gear] | None:
+        """Returns the lazily validated gear section from the StaticContentManager (if loaded)."""
         # Note: This doesn't trigger loading, assumes load_all_data or equivalent called first.
         if self.static_content_manager._content:
             return self.static_content_manager._content.gear
         return None
 
     @property
-    def static_quest_data(self) -> dict[str, Quest] | None:
-        """Returns cached static quest data directly from the StaticContentManager (if loaded)."""
+    def static_quest_data(self) -> Mapping[str, Quest] | None:
+        """Returns the lazily validated quest section from the StaticContentManager (if loaded)."""
         if self.static_content_manager._content:
             return self.static_content_manager._content.quests
         return None
@@ -180,6 +225,7 @@ class DataManager:
                 if cached_model:
                     self._user = cached_model
                     self._update_refresh_time(data_key)  # Update timestamp based on cache load
+                    # Not recorded: the cached snapshot is older than in-memory updates (e.g. scores)
                     log.info("User loaded from fresh processed cache.")
                     return self._user
                 else:
@@ -200,6 +246,7 @@ class DataManager:
             # Validate raw data into model
             self._user = model_class.model_validate(raw_data)
             self._update_refresh_time(data_key)
+            self.record_user_stats()
 
             # Save raw and processed data
             save_json(raw_data, filename, folder=self.raw_cache_dir)
@@ -343,6 +390,8 @@ class DataManager:
                 log.debug(f"Attempting to load party from processed cache: {processed_path}")
                 cached_model = load_pydantic_model(model_class, processed_path, context=validation_context)
                 if cached_model:
+                    # Chat is not cached with the party; the MessageSync history is the complete one
+                    cached_model.chat = self.message_sync.history(PARTY_CHAT_STREAM)
                     self._party = cached_model
                     self._update_refresh_time(data_key)
                     log.info("Party loaded from fresh processed cache.")
@@ -363,12 +412,17 @@ class DataManager:
                 self._update_refresh_time(data_key)  # Update timestamp even for None result
                 return None
 
-            # Create Party model using factory method which handles context
-            self._party = model_class.create_from_raw_data(raw_data, current_user_id=user_id_context)
+            # Create Party model, merging only new chat messages into the stored history
+            chat_history = self.message_sync.history(PARTY_CHAT_STREAM)
+            known_count = len(chat_history)
+            self._party = model_class.create_from_raw_data(raw_data, current_user_id=user_id_context, chat_history=chat_history)
+            if len(chat_history) != known_count:
+                log.debug(f"Party chat: {len(chat_history) - known_count} new messages.")
+                self.message_sync.save(PARTY_CHAT_STREAM)
             self._update_refresh_time(data_key)
 
             save_json(raw_data, filename, folder=self.raw_cache_dir)
-            # Save the Party model (chat excluded by default based on field def)
+            # Save the Party model (chat is excluded by its field definition)
             save_pydantic_model(self._party, filename, folder=self.processed_cache_dir)
             log.success("Party data fetched and processed.")
             return self._party
@@ -514,6 +568,7 @@ class DataManager:
         3. Task statuses, tag names, and Daily damage.
         4. Links Tasks to Challenges. <<< Added explicit save after this
         5. Party static quest details.
+        6. Daily damage forecast including party boss damage.
 
         Returns:
             True if processing was successful, False otherwise.
@@ -541,27 +596,16 @@ class DataManager:
 
             # 1. Process User Stats (Needs Static Gear)
             if self._user:
-                gear_data = self.static_gear_data or {}
-                self._user.calculate_effective_stats(gear_data=gear_data)
+                content = self.static_content_manager.content
+                self._user.calculate_effective_stats(bonus_table=content.gear_bonus_table(self._user.klass))
                 log.debug("User stats processed.")
 
             # 2. Process Challenges Status (Needs User - already checked above)
             # Note: Ownership is now handled during validation via context.
             # We only need to explicitly set `joined` here.
             if self._user and self._challenges:
-                # Ensure profile.challenges exists and is a list
                 user_challenges_list = getattr(self._user, "challenges", [])
-                joined_ids = set(user_challenges_list if isinstance(user_challenges_list, list) else [])
-                # joined_ids = set(self._user.profile.challenges) if self._user.profile else set()
-                count_joined = 0
-                for c in self._challenges.challenges:
-                    is_joined = c.id in joined_ids
-                    if c.joined != is_joined:  # Only log if changed
-                        pass
-                        # log.debug(f"Challenge '{c.id[:8]}' joined status -> {is_joined}")
-                    c.joined = is_joined
-                    if is_joined:
-                        count_joined += 1
+                count_joined = self._challenges.set_joined(user_challenges_list if isinstance(user_challenges_list, list) else [])
                 # log.debug(f"Challenge joined status processed ({count_joined} marked as joined).")
 
             # 3. Process Tasks (Needs User, Tags, Static Content Manager)
@@ -578,28 +622,13 @@ class DataManager:
                 linked_count = self._challenges.link_tasks(self._tasks)
                 log.debug(f"Tasks linked to challenges ({linked_count} links made).")
 
-                # --- >>> SAVE CHALLENGES AGAIN (WITH LINKED TASKS) <<< ---
-                log.info("Saving fully processed challenges state (with linked tasks)...")
-                try:
-                    chal_filename = "challenges.json"
-                    processed_chal_path = self._get_cache_path(chal_filename, processed=True)
-                    # Overwrite the previously saved processed file
-                    challenges_to_save = self._challenges.model_dump(
-                        mode="json",  # Use 'json' mode for JSON-compatible types
-                        exclude={
-                            # Exclude from items within the 'challenges' list:
-                            "challenges": {
-                                "__all__": {  # Apply to all Challenge items in the list
-                                    # Exclude from items within the 'tasks' list of each Challenge:
-                                    "tasks": {"__all__": {"styled_text", "styled_notes"}}  # Adjust these field names based on your Task model
-                                }
-                            }
-                        },
-                    )
-                    save_successful = save_json(challenges_to_save, chal_filename, folder=self.processed_cache_dir)
-                    log.success(f"Saved processed challenges state to {processed_chal_path}")
-                except Exception as e:
-                    log.error(f"Failed saving processed challenges state: {e}")
+                # --- >>> SAVE CHALLENGES AGAIN (WITH TASK LINKS) <<< ---
+                # Challenges hold task IDs only, so this is a small write
+                chal_filename = "challenges.json"
+                if save_pydantic_model(self._challenges, chal_filename, folder=self.processed_cache_dir):
+                    log.debug(f"Saved challenge task links to {self._get_cache_path(chal_filename, processed=True)}")
+                else:
+                    log.error("Failed saving processed challenges state.")
                     # Don't mark overall processing as failed just for this save failure
                 # --- >>> END SAVE CHALLENGES AGAIN <<< ---
             else:
@@ -616,6 +645,18 @@ class DataManager:
                 log.debug("Party exists but no active quest to process.")
             # No else needed if self._party is None
 
+            # 6. Re-forecast Daily damage now that the boss (if any) is known
+            if self._tasks and self._party:
+                self._tasks.apply_daily_damage(party=self._party)
+                log.debug("Daily damage forecast updated with party quest.")
+
+            # 7. Append new history entries / completed todos to the archive time series
+            if self._tasks:
+                try:
+                    await self.archiver.archive_task_history_async(self._tasks)
+                except Exception as e:
+                    log.error(f"Failed archiving task history: {e}")
+
         except Exception as e:
             log.exception("Error during main processing steps of process_loaded_data.")
             success = False
@@ -635,8 +676,237 @@ class DataManager:
         log.info(f"process_loaded_data finished {'successfully' if success else 'with errors'}.")
         return success
 
+    # --- Targeted Updates ---
+    # Services patch the models with the API's response after a mutation instead of
+    # refetching everything; derived data is recomputed for the touched entities only.
+
+    def _save_processed(self, *data_keys: str) -> None:
+        """Writes the processed cache of the given models so a restart sees the patch."""
+        for data_key in data_keys:
+            filename = f"{data_key}.json"
+            if data_key == "tasks" and self._tasks:
+                self._tasks.save_to_json(filename, folder=self.processed_cache_dir)
+            elif data_key in ("tags", "challenges", "user", "party"):
+                model = getattr(self, f"_{data_key}")
+                if model is not None and not save_pydantic_model(model, filename, folder=self.processed_cache_dir):
+                    log.error(f"Failed saving processed {data_key} state.")
+
+    def apply_task_update(self, task_data: dict[str, Any] | Task) -> Task | None:
+        """Adds or edits one task from an API response (or model).
+
+        Tag names, status and (for dailies) the damage forecast are recomputed by the
+        TaskList for this task only; its challenge link follows it.
+
+        Returns:
+            The task now held by the TaskList, or None if it could not be applied.
+        """
+        if self._tasks is None:
+            log.warning("apply_task_update: no tasks loaded.")
+            return None
+        task_id = task_data.id if isinstance(task_data, Task) else task_data.get("_id") or task_data.get("id")
+        if task_id and task_id in self._tasks:
+            update = task_data.model_dump(by_alias=True) if isinstance(task_data, Task) else task_data
+            task = self._tasks.edit_task(task_id, update)
+        else:
+            task = self._tasks.add_task(task_data)
+        if task is not None:
+            self._save_processed("tasks")
+        return task
+
+    def apply_task_delete(self, *task_ids: str) -> list[Task]:
+        """Removes tasks locally (their challenge links and damage contribution go with them).
+
+        Returns:
+            The tasks that were removed.
+        """
+        if self._tasks is None:
+            return []
+        deleted = [task for task in map(self._tasks.delete_task, task_ids) if task is not None]
+        if deleted:
+            self._save_processed("tasks")
+        return deleted
+
+    def apply_tag_update(self, tag_data: dict[str, Any] | Tag) -> Tag | None:
+        """Adds or renames one tag and re-resolves tag names of the tasks carrying it."""
+        if self._tags is None:
+            log.warning("apply_tag_update: no tags loaded.")
+            return None
+        tag_id = tag_data.id if isinstance(tag_data, Tag) else tag_data.get("id")
+        existing = self._tags.get_by_id(tag_id) if tag_id else None
+        if existing is not None:
+            update = tag_data.model_dump() if isinstance(tag_data, Tag) else tag_data
+            tag = self._tags.update_tag(existing.id, update)
+        else:
+            try:
+                tag = tag_data if isinstance(tag_data, Tag) else Tag.model_validate(tag_data)
+            except ValidationError as e:
+                log.error(f"apply_tag_update: invalid tag data: {e}")
+                return None
+            self._tags.add_tag(tag)
+        if tag is None:
+            return None
+        if self._tasks:
+            touched = self._tasks.refresh_tag_names([tag.id])
+            log.debug(f"Tag {tag.id[:8]} applied; names refreshed on {len(touched)} tasks.")
+        self._save_processed("tags")
+        return tag
+
+    def apply_tag_delete(self, tag_id: str) -> bool:
+        """Removes one tag and strips it from the tasks carrying it (as the server does)."""
+        removed = self._tags.remove_tag(tag_id) if self._tags else False
+        if self._tasks:
+            touched = self._tasks.remove_tag_id(tag_id)
+            if touched:
+                self._save_processed("tasks")
+            log.debug(f"Tag {tag_id[:8]} deleted; removed from {len(touched)} tasks.")
+        if removed:
+            self._save_processed("tags")
+        return removed
+
+    def _link_challenge(self, challenge: Challenge) -> None:
+        """Links one challenge to the live TaskList and sets its joined flag from the user."""
+        if self._tasks:
+            challenge.link_task_list(self._tasks)
+        if self._user and self._challenges:
+            self._challenges.mark_joined(challenge.id, challenge.id in set(getattr(self._user, "challenges", None) or []))
+
+    def apply_challenge_update(self, challenge: Challenge) -> Challenge | None:
+        """Adds or replaces one challenge and links it to the current tasks."""
+        if self._challenges is None:
+            log.warning("apply_challenge_update: no challenges loaded.")
+            return None
+        self._challenges.add_challenge(challenge)
+        self._link_challenge(challenge)
+        self._save_processed("challenges")
+        return challenge
+
+    def apply_challenge_delete(self, challenge_id: str) -> Challenge | None:
+        """Removes one challenge locally."""
+        challenge = self._challenges.remove_challenge(challenge_id) if self._challenges else None
+        if challenge is not None:
+            self._save_processed("challenges")
+        return challenge
+
+    def apply_challenge_leave(self, challenge_id: str, keep: str = "keep-all") -> int:
+        """Mirrors leaving a challenge locally, as the server does.
+
+        The challenge is dropped from `user.challenges` and marked as not joined. Its
+        tasks are deleted ("remove-all") or kept without their challenge link ("keep-all").
+
+        Returns:
+            The number of tasks deleted or unlinked.
+        """
+        if self._user and self._user.challenges and challenge_id in self._user.challenges:
+            self._user.challenges = [cid for cid in self._user.challenges if cid != challenge_id]
+            self._save_processed("user")
+        if self._challenges and self._challenges.mark_joined(challenge_id, False):
+            self._save_processed("challenges")
+        if not self._tasks:
+            return 0
+        task_ids = list(self._tasks.task_ids_for_challenge(challenge_id))
+        if keep == "remove-all":
+            return len(self.apply_task_delete(*task_ids))
+        unlinked = [task_id for task_id in task_ids if self._tasks.edit_task(task_id, {"challenge": {}})]
+        if unlinked:
+            self._save_processed("tasks")
+        return len(unlinked)
+
+    def set_challenges(self, challenges: ChallengeList) -> None:
+        """Replaces the challenge list (e.g. after a refetch), linking tasks and joined flags."""
+        self._challenges = challenges
+        self._update_refresh_time("challenges")
+        self._recompute_challenges()
+        self._save_processed("challenges")
+
+    def _recompute_challenges(self) -> None:
+        if not self._challenges:
+            return
+        if self._user:
+            user_challenges = getattr(self._user, "challenges", None)
+            self._challenges.set_joined(user_challenges if isinstance(user_challenges, list) else [])
+        if self._tasks:
+            self._challenges.link_tasks(self._tasks)
+
+    async def invalidate(self, *data_keys: str) -> bool:
+        """Refetches only the given models and recomputes what depends on them.
+
+        Dependents per key:
+            user: effective stats, challenge joined flags, daily damage.
+            party: quest details, daily damage.
+            tags: tag names of every task.
+            tasks: task processing, daily damage, challenge links, history archive.
+            challenges: joined flags, task links.
+
+        Args:
+            data_keys: Any of "user", "tasks", "tags", "party", "challenges".
+
+        Returns:
+            True if every requested model was reloaded and processed.
+        """
+        loaders = {
+            "user": self.load_user,
+            "tasks": self.load_tasks,
+            "tags": self.load_tags,
+            "party": self.load_party,
+            "challenges": self.load_challenges,
+        }
+        unknown = set(data_keys) - loaders.keys()
+        if unknown:
+            raise ValueError(f"Unknown data keys {sorted(unknown)}, expected some of {list(loaders)}")
+        keys = set(data_keys)
+        if not keys:
+            return True
+        log.info(f"Invalidating {', '.join(sorted(keys))}...")
+
+        results = await asyncio.gather(*(loaders[key](force_refresh=True) for key in keys), return_exceptions=True)
+        success = True
+        for key, result in zip(keys, results, strict=True):
+            if isinstance(result, Exception):
+                log.error(f"Error reloading {key}: {result}")
+                success = False
+            elif result is None and key != "party":  # No party is a valid state
+                success = False
+
+        try:
+            content = self.static_content_manager.content
+            if "user" in keys and self._user and content:
+                self._user.calculate_effective_stats(bonus_table=content.gear_bonus_table(self._user.klass))
+
+            if "party" in keys and self._party and self._party.quest and self._party.quest.key and not self._party.static_quest_details:
+                await self._party.fetch_and_set_static_quest_details(self.static_content_manager)
+
+            if self._tasks:
+                if "tasks" in keys:
+                    if self._user and self._tags:
+                        self._tasks.process_tasks(user=self._user, tags_provider=self._tags, content_manager=self.static_content_manager)
+                    self._tasks.apply_daily_damage(party=self._party)
+                else:
+                    if "tags" in keys and self._tags:
+                        self._tasks.refresh_tag_names(tags_provider=self._tags)
+                    if "user" in keys or "party" in keys:
+                        self._tasks.set_user(self._user, party=self._party)
+
+            if keys & {"user", "tasks", "challenges"}:
+                self._recompute_challenges()
+
+            if "tasks" in keys and self._tasks:
+                try:
+                    await self.archiver.archive_task_history_async(self._tasks)
+                except Exception as e:
+                    log.error(f"Failed archiving task history: {e}")
+        except Exception:
+            log.exception("Error recomputing data after invalidation.")
+            return False
+
+        if "tasks" in keys:
+            self._save_processed("tasks")
+        if keys & {"user", "tasks", "challenges"}:
+            self._save_processed("challenges")
+        log.info(f"Invalidation of {', '.join(sorted(keys))} finished {'successfully' if success else 'with errors'}.")
+        return success
+
     # Helper for sync gear access during processing
-    def _get_static_gear_data_sync(self) -> dict[str, Gear]:
+    def _get_static_gear_data_sync(self) -> Mapping[str, Gear]:
         content = self.static_content_manager._content
         if content and content.gear:
             return content.gear
@@ -0,0 +1,154 @@
+# pixabit/services/gear_optimizer.py
+
+# SECTION: MODULE DOCSTRING
+"""Picks the best owned gear per slot for a stat objective.
+
+Works on the per-class `GearBonusTable` from `GameContent`, so scoring every
+owned item is one matrix-vector product and choosing a loadout is one masked
+argmax per slot. Slots are independent except for two-handed weapons, which are
+weighed against the best one-handed weapon plus shield.
+"""
+
+# SECTION: IMPORTS
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Mapping, NamedTuple
+
+import numpy as np
+
+from pixabit.helpers._logger import log
+from pixabit.models.game_content import GEAR_STAT_KEYS
+
+if TYPE_CHECKING:
+    from pixabit.models.game_content import GameContent, GearBonusTable
+    from pixabit.models.user import User
+
+# SECTION: CONSTANTS
+GEAR_SLOTS: tuple[str, ...] = ("weapon", "shield", "armor", "head", "headAccessory", "eyewear", "body", "back")
+
+TIE_BIAS = 1e-9  # Score nudge for equipped items, far below any real stat difference
+
+# Preset objectives as weights over (str, con, int, per)
+OBJECTIVES: dict[str, dict[str, float]] = {
+    "survival": {"con": 1.0},
+    "damage": {"str": 1.0},
+    "mana": {"int": 1.0},
+    "drops": {"per": 1.0},
+    "quests": {"int": 1.0, "per": 1.0},
+    "balanced": {"str": 1.0, "con": 1.0, "int": 1.0, "per": 1.0},
+}
+
+
+# SECTION: CLASSES
+
+
+# KLASS: Loadout
+class Loadout(NamedTuple):
+    """Result of an optimization: chosen gear and the stats it yields."""
+
+    gear: dict[str, str]  # slot -> gear key
+    bonus: dict[str, float]  # gear bonus (class multiplier applied)
+    effective_stats: dict[str, float]  # stats before gear + bonus
+    score: float  # weighted objective value of `bonus`
+
+
+# KLASS: GearOptimizer
+class GearOptimizer:
+    """Chooses the best owned gear per slot for a weighted stat objective."""
+
+    def __init__(self, content: GameContent, user: User):
+        """Initializes the optimizer for one user.
+
+        Args:
+            content: Loaded static content (provides the gear bonus table).
+            user: The user; class, owned gear and base stats are read from it.
+        """
+        self.user = user
+        self.table: GearBonusTable = content.gear_bonus_table(user.klass)
+        owned_rows = self.table.rows_for(user.items.owned_gear_keys())
+        self.owned = np.zeros(len(self.table.keys), dtype=bool)
+        self.owned[owned_rows] = True
+        self.stats_before_gear = user.stats.calculate_stats_before_gear()
+        self._slot_masks = {slot: self.owned & (self.table.slots == slot) for slot in GEAR_SLOTS}
+        # Tiny bias so ties keep what is already equipped instead of suggesting a pointless swap
+        self._equipped_bias = np.zeros(len(self.table.keys), dtype=np.float64)
+        self._equipped_bias[self.table.rows_for(user.items.gear_equipped.get_equipped_item_keys())] = TIE_BIAS
+
+    @staticmethod
+    def weights_for(objective: str | Mapping[str, float]) -> np.ndarray:
+        """Converts an objective name or {stat: weight} mapping to a weight vector.
+
+        Raises:
+            ValueError: If the objective name is unknown.
+        """
+        if isinstance(objective, str):
+            if objective not in OBJECTIVES:
+                raise ValueError(f"Unknown objective '{objective}'. Choose from: {', '.join(OBJECTIVES)}")
+            objective = OBJECTIVES[objective]
+        return np.array([float(objective.get(stat, 0.0)) for stat in GEAR_STAT_KEYS], dtype=np.float64)
+
+    def _best_row(self, slot: str, scores: np.ndarray, exclude_two_handed: bool = False) -> int | None:
+        """Row of the highest-scoring owned item for a slot, or None if the slot has no owned item."""
+        mask = self._slot_masks[slot]
+        if exclude_two_handed:
+            mask = mask & ~self.table.two_handed
+        if not mask.any():
+            return None
+        masked = np.where(mask, scores, -np.inf)
+        return int(np.argmax(masked))
+
+    def optimize(self, objective: str | Mapping[str, float] = "survival") -> Loadout:
+        """Computes the best owned loadout for an objective.
+
+        Args:
+            objective: A name from OBJECTIVES or a {stat: weight} mapping, e.g. {"con": 2, "per": 1}.
+
+        Returns:
+            The chosen Loadout. Slots without owned gear are left out.
+        """
+        weights = self.weights_for(objective)
+        scores = self.table.bonuses @ weights + self._equipped_bias
+
+        chosen: dict[str, int] = {}
+        for slot in GEAR_SLOTS:
+            if slot in ("weapon", "shield"):
+                continue
+            row = self._best_row(slot, scores)
+            if row is not None:
+                chosen[slot] = row
+
+        # Weapon and shield: a two-handed weapon occupies both slots
+        best_weapon = self._best_row("weapon", scores)
+        one_handed = self._best_row("weapon", scores, exclude_two_handed=True)
+        shield = self._best_row("shield", scores)
+        paired_score = (scores[one_handed] if one_handed is not None else 0.0) + (scores[shield] if shield is not None else 0.0)
+        if best_weapon is not None and self.table.two_handed[best_weapon] and scores[best_weapon] > paired_score:
+            chosen["weapon"] = best_weapon
+        else:
+            if one_handed is not None:
+                chosen["weapon"] = one_handed
+            if shield is not None:
+                chosen["shield"] = shield
+
+        rows = list(chosen.values())
+        bonus_vector = self.table.bonuses[rows].sum(axis=0)
+        bonus = dict(zip(GEAR_STAT_KEYS, bonus_vector.tolist(), strict=True))
+        effective = {stat: self.stats_before_gear.get(stat, 0.0) + bonus[stat] for stat in GEAR_STAT_KEYS}
+        loadout = Loadout(
+            gear={slot: self.table.keys[row] for slot, row in chosen.items()},
+            bonus=bonus,
+            effective_stats=effective,
+            score=float(bonus_vector @ weights),
+        )
+        log.debug(f"GearOptimizer: objective={objective!r} score={loadout.score:.1f} gear={loadout.gear}")
+        return loadout
+
+    def current_loadout(self, objective: str | Mapping[str, float] = "survival") -> Loadout:
+        """Evaluates the currently equipped gear with the same scoring, for comparison."""
+        weights = self.weights_for(objective)
+        equipped = self.user.items.gear_equipped
+        gear = {slot: key for slot in GEAR_SLOTS if (key := getattr(equipped, slot, None)) and key in self.table.index}
+        bonus_vector = self.table.bonuses[self.table.rows_for(gear.values())].sum(axis=0)
+        bonus = dict(zip(GEAR_STAT_KEYS, bonus_vector.tolist(), strict=True))
+        effective = {stat: self.stats_before_gear.get(stat, 0.0) + bonus[stat] for stat in GEAR_STAT_KEYS}
+        return Loadout(gear=gear, bonus=bonus, effective_stats=effective, score=float(bonus_vector @ weights))
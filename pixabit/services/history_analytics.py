@@ -0,0 +1,318 @@
+# pixabit/services/history_analytics.py
+
+# SECTION: MODULE DOCSTRING
+"""Columnar analytics over the `history` of habits and dailies.
+
+All entries of all tasks are loaded once into flat NumPy columns, sorted by
+(task, time), with `offsets` marking where each task's slice starts. Per-task
+results are then segment reductions (`np.bincount`, `np.maximum.at`) over those
+columns instead of Python loops over entries, so the whole set is recomputed on
+every refresh in a few milliseconds even with years of history.
+
+What counts as a success:
+- dailies: the entry's `completed` flag; only entries with `isDue` not False count.
+- habits: more up than down scores that day (`scoredUp` > `scoredDown`).
+- old entries without those fields: the task value went up since the previous entry.
+
+Days and weekdays are taken in the given UTC offset (the system's local offset by
+default), since Habitica writes history at the user's cron.
+"""
+
+# SECTION: IMPORTS
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Iterable, NamedTuple
+
+import numpy as np
+
+from pixabit.helpers._logger import log
+from pixabit.models.task import Daily, Habit
+
+if TYPE_CHECKING:
+    from pixabit.models.task import TaskList
+
+# SECTION: CONSTANTS
+MS_PER_DAY = 86_400_000
+EPOCH_WEEKDAY = 3  # 1970-01-01 was a Thursday (Monday = 0)
+WEEKDAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+MIN_WEEKDAY_SAMPLES = 2  # Due entries a weekday needs before it can be best/worst
+
+
+# SECTION: CLASSES
+
+
+# KLASS: TaskHistoryStats
+class TaskHistoryStats(NamedTuple):
+    """Summary of one task's history, one row of the stats panel."""
+
+    task_id: str
+    text: str
+    type: str
+    entries: int
+    current_streak: int
+    longest_streak: int
+    completion_rate: float | None  # Successes / due entries
+    value_slope: float | None  # Task value change per week (least squares)
+    best_weekday: int | None  # 0 = Monday
+    worst_weekday: int | None
+
+
+# KLASS: TagHistoryStats
+class TagHistoryStats(NamedTuple):
+    """Aggregate over all habits and dailies carrying a tag."""
+
+    tag_id: str
+    tag_name: str
+    tasks: int
+    due: int
+    successes: int
+    completion_rate: float | None
+    best_weekday: int | None
+    worst_weekday: int | None
+
+
+# KLASS: HistoryAnalytics
+class HistoryAnalytics:
+    """Columnar history of habits and dailies with vectorized statistics.
+
+    Columns (one element per history entry, sorted by task then time):
+        task: index into `task_ids`.
+        ts: entry time, Unix ms.
+        day: day number in the chosen UTC offset (days since 1970-01-01).
+        weekday: 0 = Monday.
+        value: task value after the entry.
+        due: entry counts towards completion rate and streaks.
+        success: see the module docstring.
+    """
+
+    def __init__(self, tasks: Iterable[Habit | Daily], utc_offset: timedelta | None = None):
+        """Loads the histories into columns.
+
+        Args:
+            tasks: Habits and dailies; other task types are ignored.
+            utc_offset: Offset for day boundaries; defaults to the system's local offset.
+        """
+        if utc_offset is None:
+            utc_offset = datetime.now(timezone.utc).astimezone().utcoffset() or timedelta(0)
+        self.utc_offset = utc_offset
+        self.tasks: list[Habit | Daily] = [task for task in tasks if isinstance(task, (Habit, Daily)) and task.history]
+        self.task_ids: list[str] = [task.id for task in self.tasks]
+        self.index: dict[str, int] = {task_id: i for i, task_id in enumerate(self.task_ids)}
+
+        histories = [task.history for task in self.tasks]
+        counts = np.fromiter((len(history) for history in histories), dtype=np.int64, count=len(histories))
+        self.offsets = np.concatenate(([0], np.cumsum(counts)))
+        total = int(self.offsets[-1])
+        entries = [entry for history in histories for entry in history]
+
+        self.task = np.repeat(np.arange(len(self.tasks)), counts)
+        self.is_daily = np.fromiter((isinstance(task, Daily) for task in self.tasks), dtype=bool, count=len(self.tasks))
+        self.ts = np.fromiter((int(entry.date.timestamp() * 1000) for entry in entries), dtype=np.int64, count=total)
+        self.value = np.fromiter((entry.value for entry in entries), dtype=np.float64, count=total)
+        # -1 marks "not in this entry"; resolved below
+        is_due = np.fromiter((-1 if entry.is_due is None else entry.is_due for entry in entries), dtype=np.int8, count=total)
+        completed = np.fromiter((-1 if entry.completed is None else entry.completed for entry in entries), dtype=np.int8, count=total)
+        scored_up = np.fromiter((-1 if entry.scored_up is None else entry.scored_up for entry in entries), dtype=np.int64, count=total)
+        scored_down = np.fromiter((entry.scored_down or 0 for entry in entries), dtype=np.int64, count=total)
+
+        self.day = (self.ts + int(utc_offset.total_seconds() * 1000)) // MS_PER_DAY
+        self.weekday = (self.day + EPOCH_WEEKDAY) % 7
+
+        starts = np.zeros(total, dtype=bool)
+        starts[self.offsets[:-1][counts > 0]] = True
+        self.task_start = starts
+        rose = np.diff(self.value, prepend=0.0) > 0
+        rose[starts] = False
+        daily_entry = self.is_daily[self.task]
+        inferred = np.where(daily_entry, completed < 0, scored_up < 0)
+        # A task's first entry has no previous value to infer success from
+        self.due = np.where(daily_entry, is_due != 0, True) & ~(inferred & starts)
+        self.success = np.where(inferred, rose, np.where(daily_entry, completed == 1, scored_up > scored_down))
+        log.debug(f"HistoryAnalytics: {total} entries for {len(self.tasks)} tasks.")
+
+    @classmethod
+    def from_task_list(cls, task_list: TaskList, utc_offset: timedelta | None = None) -> HistoryAnalytics:
+        """Builds the analytics over the habits and dailies of a TaskList."""
+        return cls(task_list.get_tasks_by_type("habit") + task_list.get_tasks_by_type("daily"), utc_offset)
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    # --- Helpers ---
+
+    def _mask(self, since: datetime | None) -> np.ndarray:
+        """Due entries, optionally only those at or after `since`."""
+        mask = self.due.copy()
+        if since is not None:
+            mask &= self.ts >= int(since.timestamp() * 1000)
+        return mask
+
+    def _per_task(self, weights: np.ndarray | None, mask: np.ndarray) -> np.ndarray:
+        return np.bincount(self.task[mask], weights=None if weights is None else weights[mask], minlength=len(self.tasks))
+
+    @staticmethod
+    def _rates(successes: np.ndarray, due: np.ndarray) -> np.ndarray:
+        """Successes / due, NaN where nothing was due."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(due > 0, successes / np.maximum(due, 1), np.nan)
+
+    @staticmethod
+    def _best_worst(rates: np.ndarray, samples: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Row-wise argmax/argmin of weekday rates (rows, 7); -1 where no weekday has enough samples."""
+        eligible = (samples >= MIN_WEEKDAY_SAMPLES) & ~np.isnan(rates)
+        best = np.argmax(np.where(eligible, rates, -np.inf), axis=1)
+        worst = np.argmin(np.where(eligible, rates, np.inf), axis=1)
+        none = ~eligible.any(axis=1)
+        return np.where(none, -1, best), np.where(none, -1, worst)
+
+    # --- Statistics ---
+
+    def streaks(self) -> tuple[np.ndarray, np.ndarray]:
+        """Current and longest run of successful due entries per task.
+
+        Returns:
+            (current, longest), both int arrays indexed like `task_ids`.
+        """
+        current = np.zeros(len(self.tasks), dtype=np.int64)
+        longest = np.zeros(len(self.tasks), dtype=np.int64)
+        if not len(self):
+            return current, longest
+        task = self.task[self.due]
+        success = self.success[self.due]
+        if not len(task):
+            return current, longest
+        # A new run starts at every failure and at every task's first due entry
+        breaks = ~success
+        breaks[0] = True
+        breaks[1:] |= task[1:] != task[:-1]
+        run = np.cumsum(breaks) - 1
+        run_length = np.bincount(run, weights=success).astype(np.int64)
+        run_task = task[breaks]
+        np.maximum.at(longest, run_task, run_length)
+        last = np.flatnonzero(np.append(task[1:] != task[:-1], True))
+        current[task[last]] = run_length[run[last]]
+        return current, longest
+
+    def completion_rates(self, since: datetime | None = None) -> np.ndarray:
+        """Successes / due entries per task (NaN if none), optionally since a date."""
+        mask = self._mask(since)
+        return self._rates(self._per_task(self.success.astype(np.float64), mask), self._per_task(None, mask))
+
+    def value_slopes(self) -> np.ndarray:
+        """Least-squares slope of task value over time per task, in value per week (NaN if undefined)."""
+        x = (self.day - self.day[self.offsets[:-1]][self.task]).astype(np.float64) / 7.0 if len(self) else np.zeros(0)
+        y = self.value
+        mask = np.ones(len(self), dtype=bool)
+        n = self._per_task(None, mask)
+        sx, sy = self._per_task(x, mask), self._per_task(y, mask)
+        sxx, sxy = self._per_task(x * x, mask), self._per_task(x * y, mask)
+        denominator = n * sxx - sx * sx
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(denominator > 0, (n * sxy - sx * sy) / np.where(denominator > 0, denominator, 1.0), np.nan)
+
+    def weekday_counts(self, since: datetime | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """Due entries and successes per (task, weekday).
+
+        Returns:
+            (due, successes), both shaped (tasks, 7).
+        """
+        mask = self._mask(since)
+        cells = self.task[mask] * 7 + self.weekday[mask]
+        size = len(self.tasks) * 7
+        due = np.bincount(cells, minlength=size).reshape(-1, 7)
+        successes = np.bincount(cells, weights=self.success[mask], minlength=size).reshape(-1, 7)
+        return due, successes
+
+    def weekday_rates(self, task_id: str | None = None, since: datetime | None = None) -> np.ndarray:
+        """Completion rate per weekday (7,), over all tasks or one task."""
+        due, successes = self.weekday_counts(since)
+        if task_id is not None:
+            row = self.index.get(task_id)
+            if row is None:
+                return np.full(7, np.nan)
+            return self._rates(successes[row], due[row])
+        return self._rates(successes.sum(axis=0), due.sum(axis=0))
+
+    def trajectory(self, task_id: str) -> tuple[np.ndarray, np.ndarray]:
+        """Value trajectory of one task.
+
+        Returns:
+            (times as datetime64[ms], values); empty arrays for unknown tasks.
+        """
+        row = self.index.get(task_id)
+        if row is None:
+            return np.zeros(0, dtype="datetime64[ms]"), np.zeros(0)
+        part = slice(self.offsets[row], self.offsets[row + 1])
+        return self.ts[part].astype("datetime64[ms]"), self.value[part]
+
+    # --- Summaries ---
+
+    def task_stats(self, since: datetime | None = None) -> list[TaskHistoryStats]:
+        """One TaskHistoryStats per task, in `task_ids` order.
+
+        Args:
+            since: Restricts completion rate and weekdays to entries from this time on;
+                   streaks and value slope always use the full history.
+        """
+        current, longest = self.streaks()
+        rates = self.completion_rates(since)
+        slopes = self.value_slopes()
+        due, successes = self.weekday_counts(since)
+        best, worst = self._best_worst(self._rates(successes, due), due)
+        entries = np.diff(self.offsets)
+        return [
+            TaskHistoryStats(
+                task_id=task.id,
+                text=task.text,
+                type=task.type,
+                entries=int(entries[i]),
+                current_streak=int(current[i]),
+                longest_streak=int(longest[i]),
+                completion_rate=None if np.isnan(rates[i]) else float(rates[i]),
+                value_slope=None if np.isnan(slopes[i]) else float(slopes[i]),
+                best_weekday=None if best[i] < 0 else int(best[i]),
+                worst_weekday=None if worst[i] < 0 else int(worst[i]),
+            )
+            for i, task in enumerate(self.tasks)
+        ]
+
+    def tag_stats(self, since: datetime | None = None) -> list[TagHistoryStats]:
+        """Aggregates per tag (a task counts towards each of its tags), sorted by tag name."""
+        tag_ids: dict[str, int] = {}
+        tag_names: dict[str, str] = {}
+        pairs: list[tuple[int, int]] = []
+        for row, task in enumerate(self.tasks):
+            names = task.tag_names
+            for position, tag_id in enumerate(task.tags_id):
+                column = tag_ids.setdefault(tag_id, len(tag_ids))
+                tag_names.setdefault(tag_id, names[position] if position < len(names) else tag_id)
+                pairs.append((row, column))
+        if not tag_ids:
+            return []
+        membership = np.zeros((len(self.tasks), len(tag_ids)))
+        rows, columns = zip(*pairs, strict=True)
+        membership[list(rows), list(columns)] = 1.0
+
+        due, successes = self.weekday_counts(since)
+        tag_due = membership.T @ due  # (tags, 7)
+        tag_successes = membership.T @ successes
+        best, worst = self._best_worst(self._rates(tag_successes, tag_due), tag_due)
+        total_due = tag_due.sum(axis=1)
+        total_successes = tag_successes.sum(axis=1)
+        rates = self._rates(total_successes, total_due)
+        task_counts = membership.sum(axis=0)
+        stats = [
+            TagHistoryStats(
+                tag_id=tag_id,
+                tag_name=tag_names[tag_id],
+                tasks=int(task_counts[column]),
+                due=int(total_due[column]),
+                successes=int(total_successes[column]),
+                completion_rate=None if np.isnan(rates[column]) else float(rates[column]),
+                best_weekday=None if best[column] < 0 else int(best[column]),
+                worst_weekday=None if worst[column] < 0 else int(worst[column]),
+            )
+            for tag_id, column in tag_ids.items()
+        ]
+        return sorted(stats, key=lambda stat: stat.tag_name.lower())
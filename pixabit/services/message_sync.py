@@ -0,0 +1,169 @@
+# pixabit/services/message_sync.py
+
+# SECTION: MODULE DOCSTRING
+"""Incremental sync of group chats and the inbox into local message history.
+
+Each stream (one group chat, or the inbox) is a `MessageList` persisted as JSON
+under the cache directory. A sync only validates messages whose IDs are not
+already held, and inbox pagination (newest first) stops at the first page that
+reaches a known message or the stream's newest timestamp. The cursor of a
+stream or conversation is simply its newest held message.
+
+Group chat endpoints return the whole recent chat in one response, so there the
+saving is in validation and processing, not in the request itself.
+"""
+
+# SECTION: IMPORTS
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from pixabit.helpers._json import load_json, save_json
+from pixabit.helpers._logger import log
+from pixabit.models.message import Message, MessageList, message_sort_key
+
+if TYPE_CHECKING:
+    from pixabit.api.client import HabiticaClient
+
+# SECTION: CONSTANTS
+INBOX_STREAM = "inbox"
+INBOX_PAGE_SIZE = 10  # Messages per /inbox/messages page
+MAX_INBOX_PAGES = 100  # Guard for the first full sync
+
+
+# SECTION: FUNCTIONS
+
+
+# FUNC: group_stream
+def group_stream(group_id: str) -> str:
+    """Stream key of a group chat ('party', 'tavern' or a guild ID)."""
+    return f"group_{group_id}"
+
+
+# SECTION: CLASSES
+
+
+# KLASS: SyncCursor
+class SyncCursor(NamedTuple):
+    """Newest message held for a stream or conversation."""
+
+    message_id: str
+    timestamp: datetime | None
+
+
+# KLASS: MessageSync
+class MessageSync:
+    """Keeps local message history per stream and fetches only what is new."""
+
+    def __init__(self, api_client: HabiticaClient, storage_dir: Path, current_user_id: str | None = None):
+        """Initializes the sync layer.
+
+        Args:
+            api_client: Client used for chat and inbox requests.
+            storage_dir: Directory holding one JSON history file per stream.
+            current_user_id: The user's ID, for conversation IDs and sent/received flags.
+        """
+        self.api = api_client
+        self.storage_dir = storage_dir
+        self.current_user_id = current_user_id
+        self._histories: dict[str, MessageList] = {}
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+
+    # --- Storage ---
+
+    def _path(self, stream: str) -> Path:
+        return self.storage_dir / f"{stream}.json"
+
+    def history(self, stream: str) -> MessageList:
+        """Gets the full message history of a stream, loading it from disk on first use."""
+        history = self._histories.get(stream)
+        if history is not None:
+            return history
+        context = {"current_user_id": self.current_user_id}
+        stored = load_json(self._path(stream)) if self._path(stream).exists() else None
+        raw_messages = stored.get("messages") if isinstance(stored, dict) else None
+        history = MessageList.model_validate(raw_messages if isinstance(raw_messages, list) else [], context=context)
+        log.debug(f"MessageSync: loaded {len(history)} stored messages for '{stream}'.")
+        self._histories[stream] = history
+        return history
+
+    def save(self, stream: str) -> bool:
+        """Writes a stream's history to disk."""
+        history = self.history(stream)
+        cursor = self.cursor(stream)
+        data = {
+            "stream": stream,
+            "cursor": {"id": cursor.message_id, "timestamp": cursor.timestamp.isoformat() if cursor.timestamp else None} if cursor else None,
+            "messages": [msg.model_dump(mode="json", by_alias=True, exclude_none=True) for msg in history],
+        }
+        return save_json(data, self._path(stream))
+
+    # --- Cursors ---
+
+    def cursor(self, stream: str, conversation_id: str | None = None) -> SyncCursor | None:
+        """Gets the newest held message of a stream, or of one conversation in it."""
+        history = self.history(stream)
+        newest = history.newest_in_conversation(conversation_id) if conversation_id else history.newest
+        return SyncCursor(newest.id, newest.timestamp) if newest else None
+
+    # --- Sync ---
+
+    def merge(self, stream: str, raw_messages: list[dict[str, Any]], persist: bool = True) -> list[Message]:
+        """Merges already fetched raw messages into a stream; only unknown IDs are validated.
+
+        Returns:
+            The newly added messages, oldest first.
+        """
+        new_messages = self.history(stream).add_messages(raw_messages)
+        if new_messages and persist:
+            self.save(stream)
+        return new_messages
+
+    async def sync_group_chat(self, group_id: str = "party") -> list[Message]:
+        """Fetches a group chat and merges the messages not yet held.
+
+        Returns:
+            The newly added messages, oldest first.
+        """
+        stream = group_stream(group_id)
+        raw_messages = await self.api.get_group_chat_messages(group_id)
+        new_messages = self.merge(stream, raw_messages)
+        log.info(f"MessageSync: {len(new_messages)} new messages in '{group_id}' chat.")
+        return new_messages
+
+    async def sync_inbox(self, conversation_id: str | None = None, max_pages: int = MAX_INBOX_PAGES) -> list[Message]:
+        """Fetches inbox pages newest-first until reaching messages already held.
+
+        Args:
+            conversation_id: Limit to one conversation (the other user's ID).
+            max_pages: Upper bound on pages fetched, for the first sync of a large inbox.
+
+        Returns:
+            The newly added messages, oldest first.
+        """
+        history = self.history(INBOX_STREAM)
+        cursor = self.cursor(INBOX_STREAM, conversation_id)
+        new_messages: list[Message] = []
+
+        for page in range(max_pages):
+            raw_page = await self.api.get_inbox_messages(page=page, conversation_id=conversation_id)
+            if not raw_page:
+                break
+            reached_known = any(item.get("id", item.get("_id")) in history for item in raw_page if isinstance(item, dict))
+            added = history.add_messages(raw_page)
+            new_messages.extend(added)
+            # Deleted messages leave no known ID behind, so also stop once the page is older than the cursor
+            if not reached_known and cursor and cursor.timestamp and added:
+                reached_known = message_sort_key(added[0]) <= cursor.timestamp
+            if reached_known or len(raw_page) < INBOX_PAGE_SIZE:
+                break
+        else:
+            log.warning(f"MessageSync: inbox sync stopped after {max_pages} pages.")
+
+        if new_messages:
+            self.save(INBOX_STREAM)
+        new_messages.sort(key=message_sort_key)
+        log.info(f"MessageSync: {len(new_messages)} new inbox messages{f' with {conversation_id}' if conversation_id else ''}.")
+        return new_messages
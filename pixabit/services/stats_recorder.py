@@ -0,0 +1,184 @@
+# pixabit/services/stats_recorder.py
+
+# SECTION: MODULE DOCSTRING
+"""Time series of the user's core stats (hp, mp, exp, gp, lvl).
+
+`UserStats` only holds the current values; the recorder appends a compact
+sample on every user fetch from the API and every score delta, so trends survive.
+
+Samples live in a fixed-size ring buffer in SQLite: sample N goes to slot
+N % capacity, replacing the oldest one, so the file never grows past
+`capacity` rows. A sample identical to the previous one is skipped.
+
+`downsample` answers range queries for sparklines with one indexed range scan
+grouped into buckets in SQL, returning the last sample of each bucket; the log
+outside the range is never read.
+"""
+
+# SECTION: IMPORTS
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from pixabit.helpers._logger import log
+
+if TYPE_CHECKING:
+    from pixabit.models.user import UserStats
+
+# SECTION: CONSTANTS
+STATS_DB_FILENAME = "stats_history.db"
+DEFAULT_CAPACITY = 100_000  # Samples kept; a few MB on disk
+STAT_FIELDS = ("hp", "mp", "exp", "gp", "lvl")
+SOURCES = ("refresh", "score")  # Stored as their index
+DEFAULT_POINTS = 30  # Sparkline width in cells
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS stats_samples (
+    slot INTEGER PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    ts INTEGER NOT NULL,
+    hp REAL, mp REAL, exp REAL, gp REAL, lvl INTEGER,
+    source INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_stats_samples_ts ON stats_samples(ts);
+"""
+INSERT_SAMPLE_SQL = f"INSERT OR REPLACE INTO stats_samples (slot, seq, ts, {', '.join(STAT_FIELDS)}, source) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+# SQLite returns the bare columns from the row holding MAX(ts): the last sample of each bucket
+DOWNSAMPLE_SQL = (
+    f"SELECT MAX(ts) AS ts, {', '.join(STAT_FIELDS)}, source FROM stats_samples "
+    "WHERE ts >= ? AND ts < ? GROUP BY (ts - ?) / ? ORDER BY ts"
+)
+
+
+# SECTION: CLASSES
+
+
+# KLASS: StatsSample
+class StatsSample(NamedTuple):
+    """One recorded stats snapshot."""
+
+    ts: int  # Unix ms
+    hp: float
+    mp: float
+    exp: float
+    gp: float
+    lvl: int
+    source: str = "refresh"
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.ts / 1000).astimezone()
+
+    @property
+    def values(self) -> tuple[float, float, float, float, int]:
+        return self.hp, self.mp, self.exp, self.gp, self.lvl
+
+
+# KLASS: StatsRecorder
+class StatsRecorder:
+    """Ring buffer of user stats samples persisted in SQLite."""
+
+    def __init__(self, db_path: Path, capacity: int = DEFAULT_CAPACITY):
+        """Opens (or creates) the sample store.
+
+        Args:
+            db_path: SQLite file for the samples.
+            capacity: Number of samples kept before the oldest are overwritten.
+        """
+        self.db_path = db_path
+        self.capacity = max(1, capacity)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._seq = 0
+        self._last: StatsSample | None = None
+        try:
+            conn = self._get_conn()
+            row = conn.execute(f"SELECT seq, ts, {', '.join(STAT_FIELDS)}, source FROM stats_samples ORDER BY seq DESC LIMIT 1").fetchone()
+            if row:
+                self._seq = row[0] + 1
+                self._last = StatsSample(*row[1:7], SOURCES[row[7]] if row[7] < len(SOURCES) else SOURCES[0])
+        except sqlite3.Error as e:
+            log.error(f"StatsRecorder: failed to open {db_path}: {e}")
+
+    def _get_conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+            self._conn.executescript(SCHEMA_SQL)
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # --- Recording ---
+
+    def record(self, stats: UserStats, source: str = "refresh", at: datetime | None = None) -> StatsSample | None:
+        """Appends a sample of `stats` unless it equals the previous sample.
+
+        Args:
+            stats: The user's current stats.
+            source: What produced the sample, one of SOURCES.
+            at: Sample time; now by default.
+
+        Returns:
+            The stored sample, or None if skipped or the write failed.
+        """
+        ts = int(at.timestamp() * 1000) if at else time.time_ns() // 1_000_000
+        sample = StatsSample(ts, float(stats.hp), float(stats.mp), float(stats.exp), float(stats.gp), int(stats.lvl), source)
+        if self._last is not None and self._last.values == sample.values:
+            return None
+        with self._lock:
+            try:
+                conn = self._get_conn()
+                with conn:
+                    conn.execute(INSERT_SAMPLE_SQL, (self._seq % self.capacity, self._seq, *sample[:6], SOURCES.index(source)))
+            except (sqlite3.Error, ValueError) as e:
+                log.error(f"StatsRecorder: failed to record sample: {e}")
+                return None
+            self._seq += 1
+            self._last = sample
+        return sample
+
+    # --- Queries ---
+
+    @property
+    def last(self) -> StatsSample | None:
+        return self._last
+
+    def __len__(self) -> int:
+        return min(self._seq, self.capacity)
+
+    def downsample(self, start: datetime, end: datetime | None = None, points: int = DEFAULT_POINTS) -> list[StatsSample]:
+        """Samples in [start, end), reduced to at most `points` (the last one of each equal-width bucket).
+
+        Empty buckets are left out, so the result may be shorter than `points`.
+        """
+        start_ms = int(start.timestamp() * 1000)
+        end_ms = int(end.timestamp() * 1000) if end else time.time_ns() // 1_000_000 + 1
+        if end_ms <= start_ms:
+            return []
+        bucket_ms = max(1, -(-(end_ms - start_ms) // max(1, points)))
+        with self._lock:
+            try:
+                rows = self._get_conn().execute(DOWNSAMPLE_SQL, (start_ms, end_ms, start_ms, bucket_ms)).fetchall()
+            except sqlite3.Error as e:
+                log.error(f"StatsRecorder: range query failed: {e}")
+                return []
+        return [StatsSample(*row[:6], SOURCES[row[6]] if row[6] < len(SOURCES) else SOURCES[0]) for row in rows]
+
+    def series(self, field: str, period: timedelta = timedelta(days=7), points: int = DEFAULT_POINTS) -> list[float]:
+        """One stat over the last `period`, downsampled for a sparkline."""
+        if field not in STAT_FIELDS:
+            raise ValueError(f"Unknown stat '{field}', expected one of {STAT_FIELDS}")
+        index = STAT_FIELDS.index(field) + 1
+        return [float(sample[index]) for sample in self.downsample(datetime.now().astimezone() - period, points=points)]
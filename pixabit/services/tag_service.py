@@ -87,12 +87,10 @@ class TagService:
             else:
                 new_tag = Tag.model_validate(tag_data)  # Use simple Tag validation
 
-            # 3. Add to local cache (DataManager's TagList)
+            # 3. Add to local cache (DataManager's TagList); tasks already carrying it get its name
             if tag_list:
-                tag_list.add_tag(new_tag)  # Assumes TagList has add_tag method
+                self.dm.apply_tag_update(new_tag)
                 log.info(f"Successfully created and cached tag: {new_tag}")
-                # Optionally trigger saving the updated TagList cache file via DataManager
-                # self.dm.save_tags() # If such a method exists
                 return new_tag
             else:
                 log.error("Cannot add created tag: TagList not loaded in DataManager.")
@@ -148,12 +146,10 @@ class TagService:
                 log.error(f"API call to update tag '{tag_id}' did not return data.")
                 return None  # Or raise
 
-            # 2. Update local cache
-            # Use model_validate with update=True or manually set attributes
-            existing_tag.model_validate(updated_data, update=True)
-            log.info(f"Successfully updated and cached tag: {existing_tag}")
-            # self.dm.save_tags() # Optional: Save updated cache
-            return existing_tag
+            # 2. Update local cache and the tag names of the tasks carrying it
+            updated_tag = self.dm.apply_tag_update({**updated_data, "id": tag_id})
+            log.info(f"Successfully updated and cached tag: {updated_tag}")
+            return updated_tag
 
         except ValueError as ve:
             log.error(f"Input validation error updating tag: {ve}")
@@ -198,11 +194,10 @@ class TagService:
                 log.error(f"API call to delete tag '{tag_id}' failed.")
                 return False  # Indicate failure
 
-            # 2. Remove from local cache
-            removed_local = tag_list.remove_tag(tag_id)  # Assumes TagList has remove_tag
+            # 2. Remove from local cache and from the tasks carrying it
+            removed_local = self.dm.apply_tag_delete(tag_id)
             if removed_local:
                 log.info(f"Successfully deleted tag '{tag_id}' from API and cache.")
-                # self.dm.save_tags() # Optional: Save updated cache
                 return True
             else:
                 # This shouldn't happen if get_by_id worked, but log just in case
@@ -262,9 +257,8 @@ class TagService:
                 # self.dm.save_tags() # Optional: Save updated cache
                 return True
             else:
-                log.warning(f"API reorder successful, but failed to reorder tag '{tag_id}' locally.")
-                # Maybe force a full refresh of tags here?
-                # await self.dm.load_tags(force_refresh=True)
+                log.warning(f"API reorder successful, but failed to reorder tag '{tag_id}' locally. Refetching tags.")
+                await self.dm.invalidate("tags")
                 return False  # Indicate local state might be inconsistent
 
         except ValueError as ve:
@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING
+import inspect
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Literal, NamedTuple
 
 from pixabit.api.mixin.task_mixin import TaskData  #! IMPORT TaskData FROM HERE
 from pixabit.helpers._logger import log
+from pixabit.helpers._scoring import ScorePrediction, apply_level_ups, predict_score
 from pixabit.models.task import (
     AnyTask,  # Import specific model if needed
 )
+from pixabit.models.user import User, UserStats
 
 if TYPE_CHECKING:
     from pixabit.api.client import HabiticaClient
@@ -18,6 +22,27 @@ if TYPE_CHECKING:
 
     from .data_manager import DataManager
 
+# Task fields a score can change (undone on rollback)
+SCORE_TASK_FIELDS = ("value", "counter_up", "counter_down", "completed", "streak", "completed_date")
+# Numeric task fields undone by subtracting the change; the others are reset if still unchanged
+SCORE_TASK_COUNTERS = ("value", "counter_up", "counter_down", "streak")
+# UserStats fields a score can change
+SCORE_STAT_FIELDS = ("hp", "mp", "exp", "gp", "lvl", "max_exp")
+# Score response keys holding stat totals -> UserStats field names
+SCORE_RESULT_STATS = {"hp": "hp", "mp": "mp", "exp": "exp", "gp": "gp", "lvl": "lvl", "toNextLevel": "max_exp", "maxHealth": "max_hp", "maxMP": "max_mp"}
+
+
+class _AppliedScore(NamedTuple):
+    """Changes made by one optimistic score.
+
+    Only these are undone or corrected, so overlapping scores (rapid presses,
+    other tasks) keep each other's changes.
+    """
+
+    task_fields: dict[str, tuple[Any, Any]]  # Field -> (before, after)
+    stats: dict[str, float]  # Field -> change
+    quest_up: float  # Change to pending boss damage
+
 
 class TaskService:
     """Service layer for interacting with Habitica Tasks.
@@ -95,12 +120,11 @@ class TaskService:
             task_list = self.get_tasks()
             if task_list:
                 # add_task should validate the raw dict and create the correct subclass
-                new_task_instance = task_list.add_task(task_data)
+                new_task_instance = self.dm.apply_task_update(task_data)
                 if new_task_instance:
                     log.info(
                         f"Successfully created and cached task: {new_task_instance}"
                     )
-                    # self.dm.save_tasks() # Optional: Save updated cache
                     return new_task_instance
                 else:
                     log.error("Failed to add created task to local TaskList.")
@@ -161,16 +185,15 @@ class TaskService:
                 return None
 
             # 2. Update local cache using TaskList's method
-            # edit_task should handle validation and updating the existing instance
-            updated_task_instance = task_list.edit_task(
-                task_id, updated_data_from_api
+            # Patches the existing instance; derived data is recomputed for it alone
+            updated_task_instance = self.dm.apply_task_update(
+                {**updated_data_from_api, "_id": task_id}
             )
 
             if updated_task_instance:
                 log.info(
                     f"Successfully updated and cached task: {updated_task_instance}"
                 )
-                # self.dm.save_tasks() # Optional
                 return updated_task_instance
             else:
                 log.error(
@@ -215,13 +238,12 @@ class TaskService:
                 return False
 
             # 2. Remove from local cache using TaskList's method
-            deleted_task = task_list.delete_task(task_id)
+            deleted_task = self.dm.apply_task_delete(task_id)
 
             if deleted_task:
                 log.info(
                     f"Successfully deleted task '{task_id}' from API and cache."
                 )
-                # self.dm.save_tasks() # Optional
                 return True
             else:
                 log.warning(
@@ -236,22 +258,146 @@ class TaskService:
             log.exception(f"Failed to delete task '{task_id}': {e}")
             raise
 
+    # --- Scoring (optimistic) ---
+
+    @staticmethod
+    def _undo_score(task: AnyTask, user: User, applied: _AppliedScore) -> None:
+        """Reverts only the changes of one optimistic score."""
+        for name, (before, after) in applied.task_fields.items():
+            if name in SCORE_TASK_COUNTERS:
+                value = getattr(task, name) - (after - before)
+                setattr(task, name, value if name == "value" else max(0, value))
+            elif getattr(task, name) == after:  # Not changed again by a later score
+                setattr(task, name, before)
+
+        stats = user.stats
+        for name, change in applied.stats.items():
+            setattr(stats, name, getattr(stats, name) - change)
+        stats.hp = max(0.0, stats.hp)
+        stats.mp = min(max(0.0, stats.mp), user.max_mp)
+        stats.exp, stats.gp, stats.lvl = max(0.0, stats.exp), max(0.0, stats.gp), max(1, stats.lvl)
+        if user.party.quest and applied.quest_up:
+            user.party.quest.progress.up = max(0.0, user.party.quest.progress.up - applied.quest_up)
+
+    def _apply_prediction(self, task: AnyTask, user: User, direction: str) -> tuple[ScorePrediction, _AppliedScore]:
+        """Applies the local scoring model to the task and the user in place.
+
+        Returns:
+            The prediction, and the changes actually made (after clamping and level-ups).
+        """
+        quest = user.party.quest
+        task_before = {name: getattr(task, name) for name in SCORE_TASK_FIELDS if hasattr(task, name)}
+        stats_before = {name: getattr(user.stats, name) for name in SCORE_STAT_FIELDS}
+        quest_up_before = quest.progress.up if quest else 0.0
+        prediction = predict_score(
+            task.type,
+            direction,
+            task.value,
+            priority=task.priority,
+            streak=getattr(task, "streak", 0),
+            completed=getattr(task, "completed", False),
+            checked_items=sum(1 for item in getattr(task, "checklist", ()) if item.completed),
+            stats=user.effective_stats,
+            max_mp=user.max_mp,
+            on_quest=bool(quest and quest.key and quest.active),
+        )
+
+        # Task
+        if task.type != "reward":
+            task.value += prediction.delta
+        if task.type == "habit":
+            if direction == "up":
+                task.counter_up += 1
+            else:
+                task.counter_down += 1
+        if prediction.completed is not None:
+            task.completed = prediction.completed
+        if task.type == "daily":
+            task.streak = max(0, task.streak + prediction.streak)
+        if task.type == "todo":
+            task.completed_date = datetime.now(timezone.utc) if task.completed else None
+
+        # User
+        stats = user.stats
+        stats.hp = max(0.0, stats.hp + prediction.hp)
+        stats.mp = min(max(0.0, stats.mp + prediction.mp), user.max_mp)
+        stats.gp = max(0.0, stats.gp + prediction.gp)
+        exp, lvl, to_next, leveled_up = apply_level_ups(max(0.0, stats.exp + prediction.exp), stats.lvl, stats.max_exp)
+        stats.exp, stats.max_exp = exp, to_next
+        if leveled_up:
+            stats.lvl = lvl
+            stats.hp = float(stats.max_hp)  # A level-up heals fully
+            log.info(f"User leveled up to {lvl} (predicted).")
+        if quest and prediction.quest_up:
+            quest.progress.up = max(0.0, quest.progress.up + prediction.quest_up)
+
+        applied = _AppliedScore(
+            task_fields={name: (before, getattr(task, name)) for name, before in task_before.items() if getattr(task, name) != before},
+            stats={name: getattr(stats, name) - before for name, before in stats_before.items() if getattr(stats, name) != before},
+            quest_up=(quest.progress.up - quest_up_before) if quest else 0.0,
+        )
+        return prediction, applied
+
+    @staticmethod
+    def _reconcile(task: AnyTask, user: User, applied: _AppliedScore, score_result: dict[str, Any]) -> None:
+        """Replaces predicted values with the server's.
+
+        The score response carries the task value delta and the user's stats
+        as totals, plus random outcomes (crit, drop, quest progress) in `_tmp`.
+        Deltas replace this score's own predicted changes, keeping those of
+        other scores still in flight.
+        """
+        delta = score_result.get("delta")
+        if isinstance(delta, (int, float)) and task.type != "reward":
+            before, after = applied.task_fields.get("value", (0.0, 0.0))
+            task.value += delta - (after - before)
+
+        stat_updates = {key: score_result[key] for key in SCORE_RESULT_STATS if score_result.get(key) is not None}
+        if stat_updates:
+            validated = UserStats.model_validate(stat_updates)  # Same coercion as a user load
+            fields = [SCORE_RESULT_STATS[key] for key in stat_updates]
+            user.stats = user.stats.model_copy(update={field: getattr(validated, field) for field in fields})
+
+        tmp = score_result.get("_tmp") or {}
+        quest = user.party.quest
+        quest_tmp = tmp.get("quest") or {}
+        if quest:
+            if isinstance(quest_tmp.get("progressDelta"), (int, float)):
+                quest.progress.up = max(0.0, quest.progress.up - applied.quest_up + quest_tmp["progressDelta"])
+            if isinstance(quest_tmp.get("collection"), int):
+                quest.progress.collected_items_count += quest_tmp["collection"]
+        drop = tmp.get("drop") or {}
+        if drop.get("type") == "Quest" and drop.get("key"):
+            user.items.quests[drop["key"]] = user.items.quests.get(drop["key"], 0) + 1
+        if drop:
+            log.info(f"Drop received: {drop.get('dialog') or drop.get('key')}")
+
     async def score_task(
-        self, task_id: str, direction: ScoreDirection | Literal[up, down]
+        self,
+        task_id: str,
+        direction: ScoreDirection | Literal["up", "down"],
+        on_applied: Callable[[AnyTask], Any] | None = None,
     ) -> dict[str, Any] | None:
-        """Scores a task (up or down) via the API, updates local user stats,
-        and updates the local task state.
+        """Scores a task (up or down) optimistically.
+
+        The local scoring model (`pixabit.helpers._scoring`) updates the task,
+        user stats, level and quest progress before the API call, and
+        `on_applied` runs right away so the UI can repaint. The API response
+        then replaces the predictions (crits, drops and quest progress are
+        random); if the call fails, this score's changes are rolled back.
 
         Args:
             task_id: The ID of the task to score.
             direction: "up" or "down" (or ScoreDirection enum).
+            on_applied: Called (and awaited, if async) with the task after the
+                        local update; called again after reconcile or rollback.
 
         Returns:
             The score result dictionary from the API (containing deltas), or None on failure.
 
         Raises:
             ValueError: If task or user not found.
-            HabiticaAPIError: If the API call fails.
+            HabiticaAPIError: If the API call fails (after rolling back).
         """
         task_list = self.get_tasks()
         user = self.dm.user
@@ -265,91 +411,53 @@ class TaskService:
             raise ValueError("User data not loaded.")
 
         task = task_list.get_by_id(task_id)  # Get the specific task instance
+        direction_value = getattr(direction, "value", direction)
+
+        async def notify() -> None:
+            if on_applied:
+                result = on_applied(task)
+                if inspect.isawaitable(result):
+                    await result
 
         log.info(
-            f"Attempting to score task '{task_id}' direction '{direction}'..."
+            f"Attempting to score task '{task_id}' direction '{direction_value}'..."
         )
+        # 1. Apply locally first
+        prediction, applied = self._apply_prediction(task, user, direction_value)
+        task_list.refresh_task(task_id)
+        log.debug(f"Applied predicted score to '{task_id}': {prediction}")
+        await notify()
+
+        # 2. Confirm with the API, rolling back on failure
         try:
-            # 1. Call API
             score_result = await self.api.score_task(
                 task_id=task_id, direction=direction
             )
-
-            if not score_result:
-                log.error(
-                    f"API call to score task '{task_id}' failed or returned no data."
-                )
-                return None
-
-            # 2. Update local User stats based on score_result deltas
-            # This is complex: need to parse score_result keys (+hp, -mp, etc.)
-            # and apply them carefully to user.stats and user.party.quest.progress if applicable
-            delta = score_result.get("delta", 0)  # Habitica's main score delta
-
-            # --- Apply Deltas to User (Simplified Example) ---
-            # A more robust implementation would parse all possible delta keys
-            user.stats.hp = max(
-                0, user.stats.hp + score_result.get("hp", 0)
-            )  # Ensure HP doesn't go below 0
-            user.stats.mp += score_result.get("mp", 0)
-            user.stats.exp += score_result.get("exp", 0)
-            user.stats.gp += score_result.get("gp", 0)
-            new_lvl = score_result.get("lvl")
-            if new_lvl and new_lvl > user.stats.lvl:
-                user.stats.lvl = new_lvl
-                # Need to update maxHP/MP, expToNextLevel etc. based on level up
-                # Maybe trigger a full user re-processing?
-                log.info(f"User leveled up to {new_lvl}!")
-                # Re-fetch user data might be simplest after level up
-                # await self.dm.load_user(force_refresh=True) ? Or recalculate locally?
-
-            log.debug(f"Applied score deltas to user: {score_result}")
-
-            # 3. Update local Task state
-            update_payload = {}
-            if task.type == "habit":
-                if direction == "up":
-                    update_payload["counterUp"] = task.counter_up + 1
-                else:  # direction == "down"
-                    update_payload["counterDown"] = task.counter_down + 1
-            elif task.type in ["daily", "todo"]:
-                # Scoring 'up' completes it, scoring 'down' uncompletes it? Check API behavior.
-                # Assume 'up' means complete, 'down' means uncomplete for score_task endpoint
-                update_payload["completed"] = direction == "up"
-                if direction == "up":
-                    # TODO: Add completedDate? API might set this implicitly.
-                    update_payload["dateCompleted"] = datetime.now(
-                        timezone.utc
-                    ).isoformat()
-                else:
-                    update_payload["dateCompleted"] = None
-
-            # Edit the task locally with the derived state changes
-            if update_payload:
-                updated_task = task_list.edit_task(task_id, update_payload)
-                if updated_task:
-                    log.debug(
-                        f"Updated local task state after scoring: {updated_task}"
-                    )
-                else:
-                    log.warning(
-                        f"Failed to update local task state for {task_id} after scoring."
-                    )
-            else:
-                # For rewards, scoring consumes GP, no task state change usually needed
-                log.debug(
-                    f"Scored reward '{task_id}'. No local task state change applied."
-                )
-
-            # 4. Return API score result
-            return score_result
-
-        except ValueError as ve:
-            log.error(f"Input validation error scoring task: {ve}")
-            raise
         except Exception as e:
-            log.exception(f"Failed to score task '{task_id}': {e}")
-            raise
+            log.exception(f"Failed to score task '{task_id}', rolling back: {e}")
+            score_result = None
+            raised: Exception | None = e
+        else:
+            raised = None
+
+        if not score_result:
+            self._undo_score(task, user, applied)
+            task_list.refresh_task(task_id)
+            await notify()
+            if raised:
+                raise raised
+            log.error(
+                f"API call to score task '{task_id}' failed or returned no data; local changes rolled back."
+            )
+            return None
+
+        # 3. Reconcile with the server's numbers
+        self._reconcile(task, user, applied, score_result)
+        task_list.refresh_task(task_id)
+        self.dm.record_user_stats("score")
+        await notify()
+        log.debug(f"Reconciled score of '{task_id}' with server result.")
+        return score_result
 
     async def clear_completed_todos(self) -> bool:
         """Clears completed Todos via API and removes them locally.
@@ -363,6 +471,13 @@ class TaskService:
             log.error("Cannot clear Todos: TaskList not loaded.")
             return False
 
+        completed_todos = [task for task in task_list.get_tasks_by_type("todo") if task.completed]
+        try:
+            # Archive first: the API deletes them for good
+            await self.dm.archiver.archive_task_history_async(completed_todos)
+        except Exception as e:
+            log.error(f"Failed archiving completed Todos before clearing: {e}")
+
         try:
             # 1. Call API
             api_success = await self.api.clear_completed_todos()
@@ -371,27 +486,19 @@ class TaskService:
                 return False
 
             # 2. Remove completed Todos locally
-            ids_to_remove = [
-                task.id
-                for task in task_list.get_tasks_by_type("todo")
-                if task.completed
-            ]
+            ids_to_remove = [task.id for task in completed_todos]
             log.debug(
                 f"Found {len(ids_to_remove)} completed Todos locally to remove."
             )
-            removed_count = 0
-            for task_id in ids_to_remove:
-                if task_list.delete_task(task_id):
-                    removed_count += 1
+            removed_count = len(self.dm.apply_task_delete(*ids_to_remove))
 
             log.info(
                 f"Cleared completed Todos. API success: True. Local removed: {removed_count}/{len(ids_to_remove)}."
             )
-            # self.dm.save_tasks() # Optional
             return True
 
         except Exception as e:
-            log.exception("Failed to clear completed Todos: {e}")
+            log.exception(f"Failed to clear completed Todos: {e}")
             raise
 
     # --- Tagging/Checklist Methods (Example: Add Tag) ---
@@ -419,12 +526,11 @@ class TaskService:
 
             # 2. Update local task
             # The API response should contain the updated task data including the new tag list
-            updated_task = task_list.edit_task(task_id, updated_task_data)
+            updated_task = self.dm.apply_task_update({**updated_task_data, "_id": task_id})
             if updated_task:
                 log.info(
                     f"Successfully added tag '{tag_id}' to task '{task_id}'."
                 )
-                # self.dm.save_tasks() # Optional
                 return updated_task
             else:
                 log.error(
@@ -465,12 +571,11 @@ class TaskService:
                 return None
 
             # 2. Update local task
-            updated_task = task_list.edit_task(task_id, updated_task_data)
+            updated_task = self.dm.apply_task_update({**updated_task_data, "_id": task_id})
             if updated_task:
                 log.info(
                     f"Successfully removed tag '{tag_id}' from task '{task_id}'."
                 )
-                # self.dm.save_tasks() # Optional
                 return updated_task
             else:
                 log.error(
@@ -513,12 +618,11 @@ class TaskService:
                 return None
 
             # 2. Update local task
-            updated_task = task_list.edit_task(task_id, updated_task_data)
+            updated_task = self.dm.apply_task_update({**updated_task_data, "_id": task_id})
             if updated_task:
                 log.info(
                     f"Successfully added checklist item to task '{task_id}'."
                 )
-                # self.dm.save_tasks() # Optional
                 return updated_task
             else:
                 log.error(
@@ -1,6 +1,6 @@
 # pixabit/ui/app.py
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Any, Callable, Dict, Optional
 
 from textual import events, on
@@ -30,7 +30,7 @@ from pixabit.services.task_service import TaskService
 from pixabit.ui.widgets.challenge_view import ChallengeScreen, ChallengeView
 from pixabit.ui.widgets.help_modal import HelpModal
 from pixabit.ui.widgets.main_panel import TaskView
-from pixabit.ui.widgets.sidebar_stats import SidebarStats
+from pixabit.ui.widgets.sidebar_stats import HISTORY_DAYS, TREND_FIELDS, SidebarStats
 from pixabit.ui.widgets.sleep_toggle import SleepToggle
 
 # Importar widgets modulares
@@ -38,6 +38,17 @@ from pixabit.ui.widgets.stats_count import StatsCount
 from pixabit.ui.widgets.table_detail_panel import TaskDetailPanel
 from pixabit.ui.widgets.table_list_panel import TaskListWidget
 
+# Models to refetch per data-changed action; the services already patched the rest in memory.
+# Actions not listed fall back to a full refresh.
+DATA_CHANGED_INVALIDATES: dict[str, tuple[str, ...]] = {
+    "score": (),  # Applied optimistically and reconciled by TaskService
+    "join": (),  # ChallengeService refetched user and tasks
+    "leave": (),  # ChallengeService updated user.challenges and removed or unlinked the challenge's tasks
+    "complete": (),
+    "edit": (),
+    "sleep_toggled": ("user",),  # Sleeping changes the damage forecast
+}
+
 
 class HabiticaApp(App):
     """Textual App for Habitica with sidebar and improved UI."""
@@ -254,8 +265,15 @@ class HabiticaApp(App):
                 # Update widgets
                 user_info_widget.update(f"{class_emoji} [b]{username}[/b]")
                 stats_widget.update_display(self.data_manager.user)
+                task_list = self.data_manager.tasks
+                analytics = self.data_manager.history_analytics()
+                history_since = datetime.now(timezone.utc) - timedelta(days=HISTORY_DAYS)
                 sidebar_stats.update_sidebar_stats(
-                    self.data_manager.user, self.quest_data
+                    self.data_manager.user,
+                    self.quest_data,
+                    total_damage=task_list.total_user_damage if task_list else None,
+                    trends={field: self.data_manager.stats_recorder.series(field) for field in TREND_FIELDS},
+                    history=analytics.task_stats(since=history_since) if analytics else None,
                 )
                 sleep_toggle.update_sleep_state(self.data_manager.user)
 
@@ -279,6 +297,14 @@ class HabiticaApp(App):
             event_data: Datos opcionales sobre el cambio
         """
         log.info(f"Data changed event received: {event_data}")
+        action = event_data.get("action") if event_data else None
+        if action in DATA_CHANGED_INVALIDATES and self.data_manager:
+            # Refetch only the affected models, then repaint
+            keys = DATA_CHANGED_INVALIDATES[action]
+            if keys:
+                await self.data_manager.invalidate(*keys)
+            await self.update_ui_with_data(data_loaded=True, processing_successful=True)
+            return
         await self.load_and_refresh_data(force_refresh=True)
 
     async def action_refresh_data(self) -> None:
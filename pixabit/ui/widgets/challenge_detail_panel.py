@@ -2,6 +2,7 @@ from pixabit.helpers._logger import log
 from pixabit.helpers._md_to_rich import MarkdownRenderer
 from pixabit.helpers._textual import Button, ComposeResult, DataTable, Horizontal, Markdown, Message, ScrollableContainer, Select, Static, Vertical, on, reactive
 from pixabit.models.challenge import Challenge
+from pixabit.models.task import TaskList, TaskRow
 
 
 def md_render(str):
@@ -158,14 +159,10 @@ class ChallengeDetailPanel(ScrollableContainer):
                 # Clear existing rows
                 tasks_table.clear()
 
-                # Add task rows
-                for task in tasks:
-                    text = task.text if hasattr(task, "text") else "Unknown"
-                    task_type = task.type if hasattr(task, "type") else "Unknown"
-                    difficulty = task.priority if hasattr(task, "priority") else "1"
-                    notes = task.notes if hasattr(task, "notes") else ""
-
-                    tasks_table.add_row(text, task_type, difficulty, notes)
+                # Add task rows from the shared TaskRow projection
+                rows = tasks.rows() if isinstance(tasks, TaskList) else [TaskRow(task) for task in tasks]
+                for row in rows:
+                    tasks_table.add_row(row.text, row.type, f"{row.priority:g}", row.notes, key=row.id)
 
                 # Show the tasks container
                 tasks_container.remove_class("hidden")
@@ -55,6 +55,18 @@ class ChallengeTree(Tree):
         all_node = filter_node.add(f"{all_prefix}All Challenges", data={"filter": "all"})
         member_node = filter_node.add(f"{member_prefix}My Challenges", data={"filter": "member"})
 
+        # Facet counts come precomputed from the ChallengeList indexes
+        if isinstance(challenges, ChallengeList):
+            counts = challenges.facet_counts()
+            facets_node = self.root.add("Facets", expand=False)
+            facets_node.add_leaf(f"Joined: {counts['joined'].get(True, 0)}")
+            facets_node.add_leaf(f"Owned: {counts['owned'].get(True, 0)}")
+            facets_node.add_leaf(f"Official: {counts['official'].get(True, 0)}")
+            facets_node.add_leaf(f"Broken: {counts['broken'].get(True, 0)}")
+            for group_type, count in sorted(counts["group_type"].items(), key=lambda item: str(item[0])):
+                if group_type:
+                    facets_node.add_leaf(f"{group_type.capitalize()}: {count}")
+
         # Add pagination info if there are multiple pages
         if total_pages > 1:
             page_info = f"Page {current_page + 1} of {total_pages}"
@@ -359,7 +371,7 @@ class ChallengeView(Container):
             self.total_pages = 50
 
             # Update the tree with challenges
-            challenges = getattr(challenge_list, "challenges", [])
+            challenges = challenge_list if challenge_list is not None else []
             tree.populate(challenges=challenges, member_only=self.member_only, current_page=self.current_page, total_pages=self.total_pages)
 
         except Exception as e:
@@ -126,17 +126,24 @@ class TaskView(Widget):
         log.info(f"TaskView: Scoring task {task_id} {direction}")
 
         try:
-            # Score the task
-            result = await self.app.run_in_thread(self.app.datastore.score_task, task_id, direction)
+            if self.task_service:
+                # Optimistic: the lists repaint as soon as the local score is applied, and again after reconcile
+                result = await self.task_service.score_task(task_id, direction, on_applied=lambda _task: self.refresh_all_task_lists())
+                if result and hasattr(self.app, "on_data_changed"):
+                    await self.app.on_data_changed({"action": "score", "task_id": task_id, "direction": direction})
+            else:
+                result = await self.app.run_in_thread(self.app.datastore.score_task, task_id, direction)
+                if result:
+                    await self.refresh_all_task_lists()
 
             if result:
-                # Refresh all task lists and update detail panel
-                await self.refresh_all_task_lists()
-
                 # Update detail panel if it's showing the scored task
                 detail_panel = self.query_one(TaskDetailPanel)
                 if detail_panel.current_task and getattr(detail_panel.current_task, "id", None) == task_id:
-                    task = await self.app.run_in_thread(self.app.datastore.get_task_by_id, task_id)
+                    if self.task_service:
+                        task = self.task_service.get_task_by_id(task_id)
+                    else:
+                        task = await self.app.run_in_thread(self.app.datastore.get_task_by_id, task_id)
                     detail_panel.current_task = task
             else:
                 log.warning(f"Failed to score task {task_id}")
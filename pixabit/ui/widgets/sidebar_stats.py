@@ -1,14 +1,19 @@
 # pixabit/ui/widgets/sidebar_stats.py
 
-from typing import Any, Dict
+from typing import Any, Dict, Sequence
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.reactive import reactive
-from textual.widgets import Label, ProgressBar, Static
+from textual.widgets import Label, ProgressBar, Sparkline, Static
 
 from pixabit.helpers._logger import log
 from pixabit.models.user import User
+from pixabit.services.history_analytics import TaskHistoryStats
+
+TREND_FIELDS = ("hp", "exp")  # Stats shown as sparklines, see StatsRecorder.series
+HISTORY_DAYS = 30  # Completion rate window, see HistoryAnalytics.task_stats
+HISTORY_TEXT_WIDTH = 16
 
 
 class SidebarStats(Vertical):
@@ -34,8 +39,25 @@ class SidebarStats(Vertical):
         self._status_label = self.query_one("#api-status-label", Label)
         self._status_label.update("Esperando datos...")
 
-    def update_sidebar_stats(self, user_data: User | None, quest_data: Dict[str, Any] | None = None) -> None:
-        """Updates sidebar stats with user and quest data."""
+    def update_sidebar_stats(
+        self,
+        user_data: User | None,
+        quest_data: Dict[str, Any] | None = None,
+        total_damage: float | None = None,
+        trends: Dict[str, Sequence[float]] | None = None,
+        history: Sequence[TaskHistoryStats] | None = None,
+    ) -> None:
+        """Updates sidebar stats with user and quest data.
+
+        Args:
+            user_data: The current user, or None to reset the sidebar.
+            quest_data: Optional quest summary (title, progress, progressNeeded).
+            total_damage: Forecast HP damage at the next cron (see `TaskList.total_user_damage`).
+            trends: Downsampled recent values per stat in TREND_FIELDS (see `StatsRecorder.series`).
+            history: Per-task history stats over the last HISTORY_DAYS (see `HistoryAnalytics.task_stats`).
+        """
+        self.update_trends(trends if user_data else None)
+        self.update_history(history if user_data else None)
         if not user_data:
             self.user_class = "Unknown"
             self.is_sleeping = False
@@ -66,8 +88,8 @@ class SidebarStats(Vertical):
             self.quest_name = "No quest"
             self.quest_progress = 0.0
 
-        # Total damage - assume we have a method or attribute for this
-        self.total_damage = getattr(user_data, "total_damage", 0.0)
+        # Total damage forecast from the batched daily damage engine
+        self.total_damage = total_damage if total_damage is not None else 0.0
 
         # Day start time - format: "HH:MM"
         preferences = user_data.preferences
@@ -91,6 +113,31 @@ class SidebarStats(Vertical):
 
         # Update widgets
 
+    def update_trends(self, trends: Dict[str, Sequence[float]] | None) -> None:
+        """Feeds the stat sparklines; missing stats are cleared."""
+        for field in TREND_FIELDS:
+            try:
+                self.query_one(f"#{field}-trend", Sparkline).data = list((trends or {}).get(field, ()))
+            except Exception as e:
+                log.error(f"Error updating {field} trend: {e}")
+
+    def update_history(self, history: Sequence[TaskHistoryStats] | None) -> None:
+        """Shows the mean completion rate and the longest current streak; cleared when there is no history."""
+        try:
+            label = self.query_one("#history-stats", Label)
+            rates = [stats.completion_rate for stats in history or () if stats.completion_rate is not None]
+            if not rates:
+                label.update("")
+                return
+            text = f"📈 {sum(rates) / len(rates):.0%} {HISTORY_DAYS}d "
+            top = max(history, key=lambda stats: stats.current_streak)
+            if top.current_streak > 0:
+                name = top.text if len(top.text) <= HISTORY_TEXT_WIDTH else f"{top.text[: HISTORY_TEXT_WIDTH - 1]}…"
+                text += f"🔥 {name} {top.current_streak} "
+            label.update(text)
+        except Exception as e:
+            log.error(f"Error updating history stats: {e}")
+
     def watch_is_sleeping(self, sleeping: bool) -> None:
         """Updates the sleep status label when sleep state changes."""
         try:
@@ -180,4 +227,7 @@ class SidebarStats(Vertical):
             yield Label("", id="total-damage", classes="stat-label")
             yield Label("", id="day-start-time", classes="stat-label")
             yield Label("", id="needs-cron", classes="stat-label")
+            yield Label("", id="history-stats", classes="stat-label")
+            for field in TREND_FIELDS:
+                yield Sparkline([], id=f"{field}-trend", classes="stat-trend")
             yield Label("", id="api-status-label")
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import pytz
 from rich.text import Text
@@ -14,7 +14,10 @@ from textual.widgets import DataTable, Input, Select
 from textual.widgets._data_table import CellKey, ColumnKey, RowKey
 
 from pixabit.helpers._logger import log
-from pixabit.models.task import Daily, Task, Todo
+from pixabit.models.task import Task, TaskList, TaskRow
+
+STATUS_SORT_ORDER = {"past_due": 0, "bad": 0, "due": 1, "good_bad": 2, "good": 2, "neutral": 3, "available": 3, "unknown": 4, "not_due": 5, "no_due_date": 5, "complete": 6}
+FAR_FUTURE = datetime.max.replace(tzinfo=timezone.utc)
 
 
 class ScoreTaskRequest(Message):
@@ -59,8 +62,7 @@ class TaskListWidget(Widget):
         widget_id = id or f"task-list-{task_type or 'all'}"
         super().__init__(id=widget_id, **kwargs)
         self._datatable = None
-        self._tasks = []
-        self._sort_value_cache = {}
+        self._rows: list[TaskRow] = []
 
     def compose(self) -> ComposeResult:
         """Compose the widget layout."""
@@ -103,14 +105,12 @@ class TaskListWidget(Widget):
     def watch_tag_colors(self, new_colors: dict[str, str]) -> None:
         """React to changes in tag colors."""
         log.info("Watch: Tag colors changed. Re-sorting/displaying tasks.")
-        self._invalidate_sort_cache()
         self.sort_and_display_tasks()
 
     def watch_sort_key(self, new_key: str) -> None:
         """React to changes in sort key."""
         if new_key:
             log.info(f"Watch: sort_key changed to {new_key}")
-            self._invalidate_sort_cache()
             self.sort_and_display_tasks()
 
     def watch_sort_ascending(self, ascending: bool) -> None:
@@ -197,22 +197,18 @@ class TaskListWidget(Widget):
         # Clear table and prepare for new data
         table.loading = True
         table.clear()
-        self._tasks = []
-        self._invalidate_sort_cache()
+        self._rows = []
 
-        # Set up filters
-        data_filters = {"text_filter": self._text_filter}
-        if self.task_type_filter and self.task_type_filter != "all":
-            data_filters["task_type"] = self.task_type_filter
+        task_type = self.task_type_filter if self.task_type_filter and self.task_type_filter != "all" else None
 
         try:
-            # Fetch tasks from data store
-            fetched_tasks = await self.app.run_in_thread(self.app.datastore.get_tasks, **data_filters)
-            log.info(f"Received {len(fetched_tasks)} tasks from DataStore.")
-            self._tasks = fetched_tasks
+            # Filter the TaskList's row projection, built once per version and shared by all views
+            task_list = self.app.data_manager.tasks if self.app.data_manager else None
+            self._rows = task_list.get_rows(task_type=task_type, text_filter=self._text_filter) if task_list else []
+            log.info(f"Received {len(self._rows)} task rows from DataManager.")
         except Exception as e:
-            log.error(f"Error getting tasks from datastore: {e}")
-            self._tasks = []
+            log.error(f"Error getting task rows from DataManager: {e}")
+            self._rows = []
 
         # Sort and display tasks
         self.sort_and_display_tasks()
@@ -228,66 +224,56 @@ class TaskListWidget(Widget):
             return
 
         table.clear()
-        sorted_tasks = self._tasks
+        sorted_rows = self._rows
 
         # Sort if a sort key is set
         if self.sort_key is not None:
             try:
-                sorted_tasks = sorted(self._tasks, key=lambda task: self._get_sort_value(task), reverse=not self.sort_ascending)
+                sorted_rows = sorted(self._rows, key=self._sort_key_func(), reverse=not self.sort_ascending)
             except Exception as e:
                 log.error(f"Error sorting tasks: {e}")
 
         # Add rows for all tasks
-        for task in sorted_tasks:
+        for row in sorted_rows:
             try:
-                self._add_row_for_task(table, task)
+                self._add_row_for_task(table, row)
             except Exception as e:
-                task_id = getattr(task, "id", "N/A")
-                log.error(f"Error adding row for task {task_id}: {e}")
+                log.error(f"Error adding row for task {row.id}: {e}")
 
-    def _add_row_for_task(self, table: DataTable, task: Task) -> None:
+    def _add_row_for_task(self, table: DataTable, row: TaskRow) -> None:
         """Add a row to the table for a task."""
         try:
-            # Get task attributes
-            status = getattr(task, "_status", "unknown")
-            value = getattr(task, "value", 0.0)
-            priority = getattr(task, "priority", 1.0)
-            tag_names = getattr(task, "tag_names", [])
-            task_id = getattr(task, "id", f"no-id-{id(task)}")
-
             # Create cell content
-            status_cell = Text("●", style=f"bold {self._get_status_style(status)}")
-            task_text = Text.from_markup(getattr(task, "text", ""))
-            due_str = self._format_due_date(task)
-            tag_str = self._create_tags_cell(tag_names)
+            status_cell = Text("●", style=f"bold {self._get_status_style(row.status)}")
+            task_text = Text.from_markup(row.text)
+            due_str = self._format_due_date(row)
+            tag_str = self._create_tags_cell(row.tag_names)
 
             # Add the row
             table.add_row(
                 status_cell,
                 task_text,
-                f"{value:.1f}",
-                f"{priority:.1f}",
+                f"{row.value:.1f}",
+                f"{row.priority:.1f}",
                 due_str,
                 tag_str,
-                key=str(task_id),
+                key=row.id,
             )
         except Exception as e:
             log.error(f"Error adding row for task: {e}")
 
-    def _format_due_date(self, task: Task) -> str:
+    def _format_due_date(self, row: TaskRow) -> str:
         """Format the due date for a task."""
         due_str = ""
         try:
-            if isinstance(task, Todo) and task.due_date:
-                due_str = task.due_date.strftime("%Y-%m-%d")
-            elif isinstance(task, Daily) and task.next_due and task.next_due[0]:
-                due_str = task.next_due[0].strftime("%Y-%m-%d")
+            if row.due:
+                due_str = row.due.strftime("%Y-%m-%d")
         except Exception as e:
             log.error(f"Error formatting due date: {e}")
             due_str = "Invalid"
         return due_str
 
-    def _create_tags_cell(self, tag_names: list[str]) -> Text:
+    def _create_tags_cell(self, tag_names: tuple[str, ...]) -> Text:
         """Create a formatted text object for tags."""
         tag_text = Text()
         if not tag_names:
@@ -305,56 +291,33 @@ class TaskListWidget(Widget):
         """Get the style color for a task status."""
         return {
             "due": "$warning",
-            "red": "$error",
-            "done": "$success",
-            "success": "$success",
-            "grey": "$text-muted",
-            "habit": "$secondary",
-            "reward": "$warning",
+            "past_due": "$error",
+            "complete": "$success",
+            "not_due": "$text-muted",
+            "no_due_date": "$text-muted",
+            "good": "$success",
+            "bad": "$error",
+            "good_bad": "$secondary",
+            "neutral": "$text-muted",
+            "available": "$warning",
             "unknown": "$text-disabled",
         }.get(status, "$text-muted")
 
-    def _get_sort_value(self, task: Task) -> Any:
-        """Get the sort value for a task, using cache if available."""
-        cache_key = (task.id, self.sort_key)
-        if cache_key in self._sort_value_cache:
-            return self._sort_value_cache[cache_key]
-
-        value = self._calculate_sort_value(task)
-        self._sort_value_cache[cache_key] = value
-        return value
-
-    def _calculate_sort_value(self, task: Task) -> Any:
-        """Calculate the sort value for a task based on the current sort key."""
+    def _sort_key_func(self) -> Callable[[TaskRow], Any]:
+        """Get the key function for the current sort column; rows are plain attribute reads."""
         key_str = self.sort_key
 
         if key_str == "status":
-            status_order = {"red": 0, "due": 1, "habit": 2, "unknown": 3, "grey": 4, "done": 5, "success": 5}
-            status = getattr(task, "_status", "unknown")
-            return (status_order.get(status, 99), status)
-
-        elif key_str == "text":
-            return getattr(task, "text", "").lower()
-
-        elif key_str == "value":
-            return getattr(task, "value", 0.0)
-
-        elif key_str == "priority":
-            return getattr(task, "priority", 1.0)
-
-        elif key_str == "due":
-            if isinstance(task, Todo) and task.due_date:
-                return task.due_date
-            if isinstance(task, Daily) and task.next_due:
-                return task.next_due[0] if task.next_due else datetime.max.replace(tzinfo=timezone.utc)
-            return datetime.max.replace(tzinfo=timezone.utc)
-
-        elif key_str == "tags":
-            tag_names = getattr(task, "tag_names", [])
-            return tag_names[0].lower() if tag_names else ""
-
-        else:
-            return getattr(task, "text", "").lower()
+            return lambda row: (STATUS_SORT_ORDER.get(row.status, 99), row.status)
+        if key_str == "value":
+            return lambda row: row.value
+        if key_str == "priority":
+            return lambda row: row.priority
+        if key_str == "due":
+            return lambda row: row.due or FAR_FUTURE
+        if key_str == "tags":
+            return lambda row: row.tag_names[0].lower() if row.tag_names else ""
+        return lambda row: row.text_lower
 
     def _get_current_cursor_row_id(self) -> str | None:
         """Get the ID of the currently selected row."""
@@ -388,7 +351,3 @@ class TaskListWidget(Widget):
 
         # Default to first row if can't restore
         table.move_cursor(row=0, animate=False)
-
-    def _invalidate_sort_cache(self) -> None:
-        """Clear the sort value cache."""
-        self._sort_value_cache = {}